@@ -0,0 +1,272 @@
+"""Squashed baseline — the schema as of revision 011, in one pass
+
+Not a revision file: it lives outside versions/ so it is not part of the
+revision graph.  env.py applies it to a completely empty database and then
+stamps 011, so a fresh bring-up (CI, dev, test fixtures) skips replaying
+001→011 one ALTER TABLE at a time.  Existing databases are untouched and
+keep following the normal chain.
+
+Keep in sync with 001–011: the final state after those revisions, including
+the server defaults added in 009.  Nothing after 011 belongs here.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+BASELINE_REVISION = "011"
+
+# Same VARCHAR + CHECK scheme as 001 (enum names as persisted by SQLAlchemy,
+# plus the lowercase values used by server defaults / raw SQL).
+THERAPEUTIC_APPROACH_VALUES = (
+    "CBT", "PSYCHODYNAMIC", "HUMANISTIC", "GESTALT", "DBT", "ACT", "EMDR",
+    "INTEGRATIVE", "PSYCHODRAMA", "OTHER",
+    "psychodynamic", "humanistic", "gestalt", "integrative", "psychodrama", "other",
+)
+PATIENT_STATUS_VALUES = (
+    "ACTIVE", "PAUSED", "COMPLETED", "INACTIVE",
+    "active", "paused", "completed", "inactive",
+)
+SESSION_TYPE_VALUES = (
+    "INDIVIDUAL", "COUPLES", "FAMILY", "GROUP", "INTAKE", "FOLLOW_UP",
+    "individual", "couples", "family", "group", "intake", "follow_up",
+)
+MESSAGE_STATUS_VALUES = (
+    "DRAFT", "PENDING_APPROVAL", "APPROVED", "SCHEDULED", "SENT", "DELIVERED",
+    "READ", "REPLIED", "REJECTED", "CANCELLED", "FAILED",
+    "draft", "pending_approval", "approved", "scheduled", "sent", "delivered",
+    "read", "replied", "rejected", "cancelled", "failed",
+)
+MESSAGE_DIRECTION_VALUES = (
+    "TO_PATIENT", "FROM_PATIENT",
+    "to_patient", "from_patient",
+)
+SUMMARY_STATUS_VALUES = ("draft", "approved")
+
+
+# 64-bit ids on messages/audit_logs (INTEGER on SQLite for rowid aliasing).
+BIGINT_ID = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+
+
+def _enum_check(table: str, column: str, values) -> sa.CheckConstraint:
+    allowed = ", ".join(f"'{v}'" for v in values)
+    return sa.CheckConstraint(f"{column} IN ({allowed})", name=f"ck_{table}_{column}")
+
+
+def _timestamps():
+    return (
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+
+def upgrade() -> None:
+    from migration_helpers import create_month_partitions, range_partitioned
+
+    # audit_logs is partitioned by month on PostgreSQL (see migration_helpers)
+    audit_pk, audit_partitioning = range_partitioned(op.get_bind(), "id")
+
+    op.create_table(
+        "therapists",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        *_timestamps(),
+        sa.Column("email", sa.String(255), unique=True, index=True, nullable=False),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("full_name", sa.String(255), nullable=False),
+        sa.Column("phone", sa.String(50)),
+        sa.Column("is_active", sa.Boolean, server_default=sa.text("true")),
+        sa.Column("is_verified", sa.Boolean, server_default=sa.text("false")),
+    )
+
+    op.create_table(
+        "therapist_profiles",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        *_timestamps(),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), unique=True, nullable=False),
+        sa.Column("therapeutic_approach", sa.String(50), nullable=False),
+        sa.Column("approach_description", sa.Text),
+        sa.Column("tone", sa.String(100)),
+        sa.Column("message_length_preference", sa.String(50)),
+        sa.Column("common_terminology", sa.JSON),
+        sa.Column("summary_template", sa.Text),
+        sa.Column("summary_sections", sa.JSON),
+        sa.Column("follow_up_frequency", sa.String(50)),
+        sa.Column("preferred_exercises", sa.JSON),
+        sa.Column("language", sa.String(10)),
+        sa.Column("cultural_considerations", sa.Text),
+        sa.Column("example_summaries", sa.JSON),
+        sa.Column("example_messages", sa.JSON),
+        sa.Column("onboarding_completed", sa.Boolean, server_default=sa.text("false")),
+        sa.Column("onboarding_step", sa.Integer, server_default=sa.text("0")),
+        # 004 — Twin controls
+        sa.Column("tone_warmth", sa.Integer, nullable=True, server_default=sa.text("3")),
+        sa.Column("directiveness", sa.Integer, nullable=True, server_default=sa.text("3")),
+        sa.Column("prohibitions", sa.JSON, nullable=True),
+        sa.Column("custom_rules", sa.Text, nullable=True),
+        sa.Column("style_version", sa.Integer, nullable=True, server_default=sa.text("1")),
+        # 006 — professional info
+        sa.Column("education", sa.Text, nullable=True),
+        sa.Column("certifications", sa.Text, nullable=True),
+        sa.Column("years_of_experience", sa.String(50), nullable=True),
+        sa.Column("areas_of_expertise", sa.Text, nullable=True),
+        _enum_check("therapist_profiles", "therapeutic_approach", THERAPEUTIC_APPROACH_VALUES),
+    )
+
+    op.create_table(
+        "session_summaries",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        *_timestamps(),
+        sa.Column("topics_discussed", sa.JSON),
+        sa.Column("interventions_used", sa.JSON),
+        sa.Column("patient_progress", sa.Text),
+        sa.Column("homework_assigned", sa.JSON),
+        sa.Column("next_session_plan", sa.Text),
+        sa.Column("full_summary", sa.Text),
+        sa.Column("generated_from", sa.String(50)),
+        sa.Column("therapist_edited", sa.Boolean, server_default=sa.text("false")),
+        sa.Column("approved_by_therapist", sa.Boolean, server_default=sa.text("false")),
+        sa.Column("mood_observed", sa.String(100)),
+        sa.Column("risk_assessment", sa.Text),
+        # 002 / 003
+        sa.Column(
+            "status",
+            sa.Enum(*SUMMARY_STATUS_VALUES, name="summarystatus", native_enum=False),
+            nullable=False,
+            server_default="draft",
+        ),
+        sa.Column("transcript", sa.Text, nullable=True),
+    )
+
+    op.create_table(
+        "patients",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        *_timestamps(),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False, index=True),
+        sa.Column("full_name_encrypted", sa.Text, nullable=False),
+        sa.Column("phone_encrypted", sa.Text),
+        sa.Column("email_encrypted", sa.Text),
+        sa.Column("status", sa.String(50), server_default=sa.text("'active'")),
+        sa.Column("start_date", sa.Date),
+        sa.Column("primary_concerns", sa.Text),
+        sa.Column("diagnosis", sa.Text),
+        sa.Column("treatment_goals", sa.JSON),
+        sa.Column("current_exercises", sa.JSON),
+        sa.Column("last_contact_date", sa.Date),
+        sa.Column("next_session_date", sa.Date),
+        sa.Column("pending_followups", sa.JSON),
+        sa.Column("completed_exercises_count", sa.Integer, server_default=sa.text("0")),
+        sa.Column("missed_exercises_count", sa.Integer, server_default=sa.text("0")),
+        sa.Column("allow_ai_contact", sa.Boolean, server_default=sa.text("true")),
+        sa.Column("preferred_contact_time", sa.String(50)),
+        _enum_check("patients", "status", PATIENT_STATUS_VALUES),
+    )
+
+    op.create_table(
+        "sessions",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        *_timestamps(),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False, index=True),
+        sa.Column("patient_id", sa.Integer, sa.ForeignKey("patients.id"), nullable=False, index=True),
+        sa.Column("session_date", sa.Date, nullable=False),
+        sa.Column("session_type", sa.String(50), server_default=sa.text("'individual'")),
+        sa.Column("duration_minutes", sa.Integer),
+        sa.Column("session_number", sa.Integer),
+        sa.Column("audio_file_path", sa.String(500)),
+        sa.Column("has_recording", sa.Boolean, server_default=sa.text("false")),
+        sa.Column("summary_id", sa.Integer, sa.ForeignKey("session_summaries.id")),
+        # 002
+        sa.Column("start_time", sa.DateTime, nullable=True),
+        sa.Column("end_time", sa.DateTime, nullable=True),
+        _enum_check("sessions", "session_type", SESSION_TYPE_VALUES),
+    )
+
+    op.create_table(
+        "messages",
+        sa.Column("id", BIGINT_ID, primary_key=True, index=True),
+        *_timestamps(),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False, index=True),
+        sa.Column("patient_id", sa.Integer, sa.ForeignKey("patients.id"), nullable=False, index=True),
+        sa.Column("direction", sa.String(50), nullable=False),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("status", sa.String(50), server_default=sa.text("'draft'")),
+        sa.Column("requires_approval", sa.Boolean, server_default=sa.text("true")),
+        sa.Column("approved_at", sa.DateTime),
+        sa.Column("rejected_at", sa.DateTime),
+        sa.Column("rejection_reason", sa.Text),
+        sa.Column("sent_at", sa.DateTime),
+        sa.Column("delivered_at", sa.DateTime),
+        sa.Column("read_at", sa.DateTime),
+        sa.Column("message_type", sa.String(50)),
+        sa.Column("related_session_id", sa.Integer, sa.ForeignKey("sessions.id")),
+        sa.Column("related_exercise", sa.String(255)),
+        sa.Column("generated_by_ai", sa.Boolean, server_default=sa.text("true")),
+        sa.Column("ai_prompt_used", sa.Text),
+        sa.Column("ai_model", sa.String(100)),
+        sa.Column("patient_response", sa.Text),
+        sa.Column("response_received_at", sa.DateTime),
+        # 005 — Messages Center v1
+        sa.Column("scheduled_send_at", sa.DateTime, nullable=True),
+        sa.Column("channel", sa.String(50), nullable=True, server_default="whatsapp"),
+        sa.Column("recipient_phone", sa.String(100), nullable=True),
+        _enum_check("messages", "direction", MESSAGE_DIRECTION_VALUES),
+        _enum_check("messages", "status", MESSAGE_STATUS_VALUES),
+    )
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", BIGINT_ID, autoincrement=True, nullable=False, index=True),
+        *_timestamps(),
+        sa.Column("user_id", sa.Integer),
+        sa.Column("user_type", sa.String(50)),
+        sa.Column("user_email", sa.String(255)),
+        sa.Column("action", sa.String(100), nullable=False),
+        sa.Column("resource_type", sa.String(100), nullable=False),
+        sa.Column("resource_id", sa.Integer),
+        sa.Column("timestamp", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column("ip_address", sa.String(50)),
+        sa.Column("user_agent", sa.String(500)),
+        sa.Column("action_details", sa.JSON),
+        sa.Column("old_value", sa.Text),
+        sa.Column("new_value", sa.Text),
+        sa.Column("success", sa.Boolean),
+        sa.Column("error_message", sa.Text),
+        sa.Column("gdpr_relevant", sa.Boolean),
+        sa.Column("data_category", sa.String(100)),
+        *audit_pk,
+        **audit_partitioning,
+    )
+    if audit_partitioning:
+        create_month_partitions("audit_logs")
+
+    # 007
+    op.create_table(
+        "exercises",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("patient_id", sa.Integer, sa.ForeignKey("patients.id"), nullable=False, index=True),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False),
+        sa.Column("session_summary_id", sa.Integer, sa.ForeignKey("session_summaries.id"), nullable=True),
+        sa.Column("description", sa.Text, nullable=False),
+        sa.Column("completed", sa.Boolean, nullable=False, server_default="0"),
+        sa.Column("completed_at", sa.DateTime, nullable=True),
+        *_timestamps(),
+    )
+
+    # 010
+    op.create_table(
+        "patient_notes",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("patient_id", sa.Integer, sa.ForeignKey("patients.id"), nullable=False, index=True),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False),
+        sa.Column("content", sa.Text, nullable=False),
+        *_timestamps(),
+    )
+
+    # 011
+    op.create_table(
+        "therapist_notes",
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False, index=True),
+        sa.Column("title", sa.String(255), nullable=True),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("tags", sa.JSON, nullable=True),
+        *_timestamps(),
+    )
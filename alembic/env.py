@@ -1,9 +1,13 @@
+import importlib.util
+import os
+import sys
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
+from sqlalchemy import engine_from_config, inspect
 from sqlalchemy import pool
 
 from alembic import context
+from alembic.operations import Operations
 
 # Import your models and settings
 from app.core.config import settings
@@ -13,11 +17,15 @@ from app.models import (  # noqa: F401 — registers models with Base metadata
     SessionSummary, Message, AuditLog, Exercise,
 )
 
+# Make alembic/migration_helpers.py importable from revision scripts
+sys.path.insert(0, os.path.dirname(__file__))
+
 # this is the Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
+# Interpret the config file for Python logging (skipped when run in-process
+# from app.core.migrations, where the app owns logging)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Set the database URL from settings
@@ -41,6 +49,46 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _load_baseline():
+    """Import alembic/baseline_011.py (kept outside versions/ on purpose)."""
+    path = os.path.join(os.path.dirname(__file__), "baseline_011.py")
+    spec = importlib.util.spec_from_file_location("alembic_baseline_011", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _is_fresh_database(connection) -> bool:
+    """True when neither alembic_version nor any app table exists yet."""
+    existing = set(inspect(connection).get_table_names())
+    return "alembic_version" not in existing and "therapists" not in existing
+
+
+def _apply_squashed_baseline(connection) -> None:
+    """
+    Fresh-install fast path: build the 011 schema in one pass and stamp 011,
+    so run_migrations() only has to replay 012+.
+
+    Only used for `upgrade head` against an empty database.  Pass
+    `-x baseline=false` to replay the full 001→011 chain instead.
+    """
+    if context.get_x_argument(as_dictionary=True).get("baseline") == "false":
+        return
+    # get_revision_argument() resolves "head" to the concrete revision id.
+    target = context.get_revision_argument()
+    targets = set(target) if isinstance(target, tuple) else {target}
+    if targets != set(context.script.get_heads()):
+        return
+    if not _is_fresh_database(connection):
+        return
+
+    baseline = _load_baseline()
+    migration_context = context.get_context()
+    with Operations.context(migration_context):
+        baseline.upgrade()
+    migration_context.stamp(context.script, baseline.BASELINE_REVISION)
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
     connectable = engine_from_config(
@@ -55,6 +103,7 @@ def run_migrations_online() -> None:
         )
 
         with context.begin_transaction():
+            _apply_squashed_baseline(connection)
             context.run_migrations()
 
 
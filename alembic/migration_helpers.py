@@ -0,0 +1,105 @@
+"""Shared helpers for migrations (data backfills, partitioned tables).
+
+Lives outside versions/ because Alembic treats every module there as a
+revision.  env.py puts this directory on sys.path, so a revision can use it
+with a function-level import (module-level would break `alembic history`,
+which loads revisions without running env.py):
+
+    def upgrade() -> None:
+        from migration_helpers import paginated_update
+        paginated_update(
+            "messages",
+            set_clause="channel = 'whatsapp'",
+            where_clause="channel IS NULL",
+        )
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.partitions import month_partitions
+
+# Same logger Alembic reports "Running upgrade ..." on (see alembic.ini).
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def paginated_update(
+    table: str,
+    set_clause: str,
+    where_clause: str,
+    batch_size: int = 1000,
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Rewrite rows of `table` in committed batches of `batch_size`.
+
+    Each batch is `UPDATE table SET ... WHERE id IN (SELECT id ... LIMIT n)`
+    and commits on its own (autocommit block), so a million-row backfill
+    never holds one long transaction or row locks on the whole table, and
+    an interrupted run resumes where it stopped.
+
+    `where_clause` must stop matching a row once it has been updated
+    (e.g. `col IS NULL` when setting `col`), otherwise the loop never ends.
+
+    Returns the total number of rows updated.
+    """
+    statement = sa.text(
+        f"UPDATE {table} SET {set_clause} "
+        f"WHERE id IN (SELECT id FROM {table} WHERE {where_clause} "
+        f"ORDER BY id LIMIT :batch_size)"
+    )
+    bind_params = {**(params or {}), "batch_size": batch_size}
+
+    total = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            updated = bind.execute(statement, bind_params).rowcount
+            if not updated:
+                break
+            total += updated
+            logger.info("%s: %d rows updated", table, total)
+    return total
+
+
+# ── Monthly RANGE partitioning (PostgreSQL) ───────────────────────────────
+# The app keeps future partitions ahead via
+# app.services.audit_service.ensure_audit_log_partitions (daily job); both use
+# app.core.partitions.month_partitions for names and ranges.
+
+def range_partitioned(bind, *pk_columns: str, partition_key: str = "created_at"):
+    """
+    create_table() extras for a table partitioned by month on `partition_key`.
+
+    Returns (constraints, table kwargs).  PostgreSQL requires the partition
+    key in the primary key, so it is appended there; other dialects get a
+    plain primary key and an ordinary table.
+    """
+    if bind.dialect.name != "postgresql":
+        return (sa.PrimaryKeyConstraint(*pk_columns),), {}
+    return (
+        (sa.PrimaryKeyConstraint(*pk_columns, partition_key),),
+        {"postgresql_partition_by": f"RANGE ({partition_key})"},
+    )
+
+
+def create_month_partitions(table: str, months_ahead: int = 2) -> None:
+    """
+    Create `<table>_yYYYYmMM` partitions for this month and the next
+    `months_ahead`, plus `<table>_default` so an insert outside every range
+    never fails.
+
+    RLS is enabled on each partition: a partition is a table of its own to
+    the Supabase Data API and would otherwise bypass the parent's policies.
+    """
+    for name, start, end in month_partitions(table, months_ahead):
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+        op.execute(f"ALTER TABLE {name} ENABLE ROW LEVEL SECURITY")
+    op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+    op.execute(f"ALTER TABLE {table}_default ENABLE ROW LEVEL SECURITY")
@@ -13,39 +13,118 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
-# Enum values matching the Python model enums
+# Enum columns are plain VARCHAR(50) guarded by a CHECK constraint, matching
+# native_enum=False in the models (no native PostgreSQL ENUM types, so no
+# per-connection type lookup and nothing for 008/009 to convert later).
+# SQLAlchemy persists the enum *names* ("ACTIVE"); the lowercase values are
+# accepted as well so raw-SQL inserts and the server defaults also pass.
 THERAPEUTIC_APPROACH_VALUES = (
-    "CBT", "psychodynamic", "humanistic", "gestalt",
-    "DBT", "ACT", "EMDR", "integrative", "other",
+    "CBT", "PSYCHODYNAMIC", "HUMANISTIC", "GESTALT", "DBT", "ACT", "EMDR",
+    "INTEGRATIVE", "PSYCHODRAMA", "OTHER",
+    "psychodynamic", "humanistic", "gestalt", "integrative", "psychodrama", "other",
+)
+PATIENT_STATUS_VALUES = (
+    "ACTIVE", "PAUSED", "COMPLETED", "INACTIVE",
+    "active", "paused", "completed", "inactive",
 )
-PATIENT_STATUS_VALUES = ("active", "paused", "completed", "inactive")
 SESSION_TYPE_VALUES = (
+    "INDIVIDUAL", "COUPLES", "FAMILY", "GROUP", "INTAKE", "FOLLOW_UP",
     "individual", "couples", "family", "group", "intake", "follow_up",
 )
 MESSAGE_STATUS_VALUES = (
-    "draft", "pending_approval", "approved", "sent",
-    "delivered", "read", "replied", "rejected",
+    "DRAFT", "PENDING_APPROVAL", "APPROVED", "SCHEDULED", "SENT", "DELIVERED",
+    "READ", "REPLIED", "REJECTED", "CANCELLED", "FAILED",
+    "draft", "pending_approval", "approved", "scheduled", "sent", "delivered",
+    "read", "replied", "rejected", "cancelled", "failed",
+)
+MESSAGE_DIRECTION_VALUES = (
+    "TO_PATIENT", "FROM_PATIENT",
+    "to_patient", "from_patient",
+)
+
+
+# High-volume append-only tables (messages, audit_logs) get 64-bit ids so
+# they never need an INT4 → INT8 table rewrite.  SQLite keeps INTEGER: only
+# an INTEGER PRIMARY KEY aliases the rowid and autoincrements.
+BIGINT_ID = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+
+
+def enum_check(table: str, column: str, values) -> sa.CheckConstraint:
+    """CHECK (column IN (...)) named ck_<table>_<column>."""
+    allowed = ", ".join(f"'{v}'" for v in values)
+    return sa.CheckConstraint(f"{column} IN ({allowed})", name=f"ck_{table}_{column}")
+
+
+# Foreign-key indexes, built after the tables exist rather than via
+# index=True inside create_table.  Names match SQLAlchemy's ix_<table>_<col>
+# convention so later migrations and autogenerate see the same indexes.
+FK_INDEXES = (
+    ("ix_patients_therapist_id", "patients", "therapist_id"),
+    ("ix_sessions_therapist_id", "sessions", "therapist_id"),
+    ("ix_sessions_patient_id", "sessions", "patient_id"),
+    ("ix_messages_therapist_id", "messages", "therapist_id"),
+    ("ix_messages_patient_id", "messages", "patient_id"),
+)
+
+
+def create_fk_indexes(indexes) -> None:
+    """
+    Create (name, table, column) indexes without blocking writes.
+
+    PostgreSQL: CREATE INDEX CONCURRENTLY cannot run inside a transaction,
+    so the statements are issued in an autocommit block.  IF NOT EXISTS keeps
+    a re-run after a partial failure idempotent.
+    SQLite (dev): plain CREATE INDEX — there is no concurrent variant.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, column in indexes:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {table} ({column})"
+                )
+    else:
+        for name, table, column in indexes:
+            op.create_index(name, table, [column])
+
+
+# Foreign keys as (name, table, column, referenced table).  Names follow
+# PostgreSQL's default <table>_<column>_fkey so 051 can validate them on
+# databases created either way.
+FOREIGN_KEYS = (
+    ("therapist_profiles_therapist_id_fkey", "therapist_profiles", "therapist_id", "therapists"),
+    ("patients_therapist_id_fkey", "patients", "therapist_id", "therapists"),
+    ("sessions_therapist_id_fkey", "sessions", "therapist_id", "therapists"),
+    ("sessions_patient_id_fkey", "sessions", "patient_id", "patients"),
+    ("sessions_summary_id_fkey", "sessions", "summary_id", "session_summaries"),
+    ("messages_therapist_id_fkey", "messages", "therapist_id", "therapists"),
+    ("messages_patient_id_fkey", "messages", "patient_id", "patients"),
+    ("messages_related_session_id_fkey", "messages", "related_session_id", "sessions"),
 )
-MESSAGE_DIRECTION_VALUES = ("to_patient", "from_patient")
+
+
+def foreign_key(target: str, inline: bool) -> tuple:
+    """Inline ForeignKey for create_table, or nothing when added later."""
+    return (sa.ForeignKey(target),) if inline else ()
+
+
+def add_foreign_keys_not_valid(foreign_keys) -> None:
+    """
+    PostgreSQL: add FKs as NOT VALID so existing/bulk-seeded rows are not
+    checked row-by-row here; 051 runs VALIDATE CONSTRAINT separately.
+    New writes are enforced immediately either way.
+    """
+    for name, table, column, ref_table in foreign_keys:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {ref_table} (id) NOT VALID"
+        )
 
 
 def upgrade() -> None:
-    # Create ENUMs
-    therapeutic_approach = sa.Enum(
-        *THERAPEUTIC_APPROACH_VALUES, name="therapeuticapproach",
-    )
-    patient_status = sa.Enum(
-        *PATIENT_STATUS_VALUES, name="patientstatus",
-    )
-    session_type = sa.Enum(
-        *SESSION_TYPE_VALUES, name="sessiontype",
-    )
-    message_status = sa.Enum(
-        *MESSAGE_STATUS_VALUES, name="messagestatus",
-    )
-    message_direction = sa.Enum(
-        *MESSAGE_DIRECTION_VALUES, name="messagedirection",
-    )
+    # SQLite cannot ADD CONSTRAINT after the fact, so FKs stay inline there.
+    inline_fks = op.get_bind().dialect.name != "postgresql"
 
     # 1. therapists (no FKs)
     op.create_table(
@@ -84,11 +163,11 @@ def upgrade() -> None:
         ),
         sa.Column(
             "therapist_id", sa.Integer,
-            sa.ForeignKey("therapists.id"),
+            *foreign_key("therapists.id", inline_fks),
             unique=True, nullable=False,
         ),
         sa.Column(
-            "therapeutic_approach", therapeutic_approach,
+            "therapeutic_approach", sa.String(50),
             nullable=False,
         ),
         sa.Column("approach_description", sa.Text),
@@ -105,6 +184,10 @@ def upgrade() -> None:
         sa.Column("example_messages", sa.JSON),
         sa.Column("onboarding_completed", sa.Boolean, default=False),
         sa.Column("onboarding_step", sa.Integer, default=0),
+        enum_check(
+            "therapist_profiles", "therapeutic_approach",
+            THERAPEUTIC_APPROACH_VALUES,
+        ),
     )
 
     # 3. session_summaries (no FKs, created before sessions)
@@ -148,13 +231,12 @@ def upgrade() -> None:
         ),
         sa.Column(
             "therapist_id", sa.Integer,
-            sa.ForeignKey("therapists.id"), nullable=False,
-            index=True,
+            *foreign_key("therapists.id", inline_fks), nullable=False,
         ),
         sa.Column("full_name_encrypted", sa.Text, nullable=False),
         sa.Column("phone_encrypted", sa.Text),
         sa.Column("email_encrypted", sa.Text),
-        sa.Column("status", patient_status, default="active"),
+        sa.Column("status", sa.String(50), server_default="active"),
         sa.Column("start_date", sa.Date),
         sa.Column("primary_concerns", sa.Text),
         sa.Column("diagnosis", sa.Text),
@@ -169,6 +251,7 @@ def upgrade() -> None:
         sa.Column("missed_exercises_count", sa.Integer, default=0),
         sa.Column("allow_ai_contact", sa.Boolean, default=True),
         sa.Column("preferred_contact_time", sa.String(50)),
+        enum_check("patients", "status", PATIENT_STATUS_VALUES),
     )
 
     # 5. sessions (FK to therapists, patients, session_summaries)
@@ -185,18 +268,16 @@ def upgrade() -> None:
         ),
         sa.Column(
             "therapist_id", sa.Integer,
-            sa.ForeignKey("therapists.id"), nullable=False,
-            index=True,
+            *foreign_key("therapists.id", inline_fks), nullable=False,
         ),
         sa.Column(
             "patient_id", sa.Integer,
-            sa.ForeignKey("patients.id"), nullable=False,
-            index=True,
+            *foreign_key("patients.id", inline_fks), nullable=False,
         ),
         sa.Column("session_date", sa.Date, nullable=False),
         sa.Column(
-            "session_type", session_type,
-            default="individual",
+            "session_type", sa.String(50),
+            server_default="individual",
         ),
         sa.Column("duration_minutes", sa.Integer),
         sa.Column("session_number", sa.Integer),
@@ -204,14 +285,15 @@ def upgrade() -> None:
         sa.Column("has_recording", sa.Boolean, default=False),
         sa.Column(
             "summary_id", sa.Integer,
-            sa.ForeignKey("session_summaries.id"),
+            *foreign_key("session_summaries.id", inline_fks),
         ),
+        enum_check("sessions", "session_type", SESSION_TYPE_VALUES),
     )
 
     # 6. messages (FK to therapists, patients, sessions)
     op.create_table(
         "messages",
-        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("id", BIGINT_ID, primary_key=True, index=True),
         sa.Column(
             "created_at", sa.DateTime, nullable=False,
             server_default=sa.func.now(),
@@ -222,17 +304,15 @@ def upgrade() -> None:
         ),
         sa.Column(
             "therapist_id", sa.Integer,
-            sa.ForeignKey("therapists.id"), nullable=False,
-            index=True,
+            *foreign_key("therapists.id", inline_fks), nullable=False,
         ),
         sa.Column(
             "patient_id", sa.Integer,
-            sa.ForeignKey("patients.id"), nullable=False,
-            index=True,
+            *foreign_key("patients.id", inline_fks), nullable=False,
         ),
-        sa.Column("direction", message_direction, nullable=False),
+        sa.Column("direction", sa.String(50), nullable=False),
         sa.Column("content", sa.Text, nullable=False),
-        sa.Column("status", message_status, default="draft"),
+        sa.Column("status", sa.String(50), server_default="draft"),
         sa.Column("requires_approval", sa.Boolean, default=True),
         sa.Column("approved_at", sa.DateTime),
         sa.Column("rejected_at", sa.DateTime),
@@ -243,7 +323,7 @@ def upgrade() -> None:
         sa.Column("message_type", sa.String(50)),
         sa.Column(
             "related_session_id", sa.Integer,
-            sa.ForeignKey("sessions.id"),
+            *foreign_key("sessions.id", inline_fks),
         ),
         sa.Column("related_exercise", sa.String(255)),
         sa.Column("generated_by_ai", sa.Boolean, default=True),
@@ -251,12 +331,17 @@ def upgrade() -> None:
         sa.Column("ai_model", sa.String(100)),
         sa.Column("patient_response", sa.Text),
         sa.Column("response_received_at", sa.DateTime),
+        enum_check("messages", "direction", MESSAGE_DIRECTION_VALUES),
+        enum_check("messages", "status", MESSAGE_STATUS_VALUES),
     )
 
-    # 7. audit_logs (no FKs)
+    # 7. audit_logs (no FKs) — partitioned by month on PostgreSQL
+    from migration_helpers import create_month_partitions, range_partitioned
+
+    audit_pk, audit_partitioning = range_partitioned(op.get_bind(), "id")
     op.create_table(
         "audit_logs",
-        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("id", BIGINT_ID, autoincrement=True, nullable=False, index=True),
         sa.Column(
             "created_at", sa.DateTime, nullable=False,
             server_default=sa.func.now(),
@@ -284,7 +369,18 @@ def upgrade() -> None:
         sa.Column("error_message", sa.Text),
         sa.Column("gdpr_relevant", sa.Boolean, default=False),
         sa.Column("data_category", sa.String(100)),
+        *audit_pk,
+        **audit_partitioning,
     )
+    if audit_partitioning:
+        create_month_partitions("audit_logs")
+
+    # 8. Deferred foreign keys (PostgreSQL only, see add_foreign_keys_not_valid)
+    if not inline_fks:
+        add_foreign_keys_not_valid(FOREIGN_KEYS)
+
+    # 9. FK indexes (outside create_table so PostgreSQL can build them CONCURRENTLY)
+    create_fk_indexes(FK_INDEXES)
 
 
 def downgrade() -> None:
@@ -296,9 +392,3 @@ def downgrade() -> None:
     op.drop_table("therapist_profiles")
     op.drop_table("therapists")
 
-    # Drop ENUMs
-    sa.Enum(name="messagedirection").drop(op.get_bind())
-    sa.Enum(name="messagestatus").drop(op.get_bind())
-    sa.Enum(name="sessiontype").drop(op.get_bind())
-    sa.Enum(name="patientstatus").drop(op.get_bind())
-    sa.Enum(name="therapeuticapproach").drop(op.get_bind())
@@ -17,8 +17,9 @@ SUMMARY_STATUS_VALUES = ("draft", "approved")
 
 
 def upgrade() -> None:
-    op.add_column("sessions", sa.Column("start_time", sa.DateTime, nullable=True))
-    op.add_column("sessions", sa.Column("end_time", sa.DateTime, nullable=True))
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(sa.Column("start_time", sa.DateTime, nullable=True))
+        batch_op.add_column(sa.Column("end_time", sa.DateTime, nullable=True))
     op.add_column(
         "session_summaries",
         sa.Column(
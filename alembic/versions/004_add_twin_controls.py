@@ -14,11 +14,25 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("therapist_profiles", sa.Column("tone_warmth", sa.Integer, nullable=True, server_default="3"))
-    op.add_column("therapist_profiles", sa.Column("directiveness", sa.Integer, nullable=True, server_default="3"))
-    op.add_column("therapist_profiles", sa.Column("prohibitions", sa.JSON, nullable=True))
-    op.add_column("therapist_profiles", sa.Column("custom_rules", sa.Text, nullable=True))
-    op.add_column("therapist_profiles", sa.Column("style_version", sa.Integer, nullable=True, server_default="1"))
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # One ALTER TABLE → one ACCESS EXCLUSIVE lock instead of five.
+        op.execute(sa.text(
+            "ALTER TABLE therapist_profiles"
+            " ADD COLUMN tone_warmth INTEGER DEFAULT 3,"
+            " ADD COLUMN directiveness INTEGER DEFAULT 3,"
+            " ADD COLUMN prohibitions JSON,"
+            " ADD COLUMN custom_rules TEXT,"
+            " ADD COLUMN style_version INTEGER DEFAULT 1"
+        ))
+        return
+
+    with op.batch_alter_table("therapist_profiles") as batch_op:
+        batch_op.add_column(sa.Column("tone_warmth", sa.Integer, nullable=True, server_default="3"))
+        batch_op.add_column(sa.Column("directiveness", sa.Integer, nullable=True, server_default="3"))
+        batch_op.add_column(sa.Column("prohibitions", sa.JSON, nullable=True))
+        batch_op.add_column(sa.Column("custom_rules", sa.Text, nullable=True))
+        batch_op.add_column(sa.Column("style_version", sa.Integer, nullable=True, server_default="1"))
 
 
 def downgrade() -> None:
@@ -18,9 +18,21 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("messages", sa.Column("scheduled_send_at", sa.DateTime, nullable=True))
-    op.add_column("messages", sa.Column("channel", sa.String(50), nullable=True, server_default="whatsapp"))
-    op.add_column("messages", sa.Column("recipient_phone", sa.String(100), nullable=True))
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # One ALTER TABLE → one ACCESS EXCLUSIVE lock instead of three.
+        op.execute(sa.text(
+            "ALTER TABLE messages"
+            " ADD COLUMN scheduled_send_at TIMESTAMP WITHOUT TIME ZONE,"
+            " ADD COLUMN channel VARCHAR(50) DEFAULT 'whatsapp',"
+            " ADD COLUMN recipient_phone VARCHAR(100)"
+        ))
+        return
+
+    with op.batch_alter_table("messages") as batch_op:
+        batch_op.add_column(sa.Column("scheduled_send_at", sa.DateTime, nullable=True))
+        batch_op.add_column(sa.Column("channel", sa.String(50), nullable=True, server_default="whatsapp"))
+        batch_op.add_column(sa.Column("recipient_phone", sa.String(100), nullable=True))
 
 
 def downgrade() -> None:
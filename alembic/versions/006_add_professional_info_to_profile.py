@@ -17,10 +17,23 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("therapist_profiles", sa.Column("education", sa.Text, nullable=True))
-    op.add_column("therapist_profiles", sa.Column("certifications", sa.Text, nullable=True))
-    op.add_column("therapist_profiles", sa.Column("years_of_experience", sa.String(50), nullable=True))
-    op.add_column("therapist_profiles", sa.Column("areas_of_expertise", sa.Text, nullable=True))
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # One ALTER TABLE → one ACCESS EXCLUSIVE lock instead of four.
+        op.execute(sa.text(
+            "ALTER TABLE therapist_profiles"
+            " ADD COLUMN education TEXT,"
+            " ADD COLUMN certifications TEXT,"
+            " ADD COLUMN years_of_experience VARCHAR(50),"
+            " ADD COLUMN areas_of_expertise TEXT"
+        ))
+        return
+
+    with op.batch_alter_table("therapist_profiles") as batch_op:
+        batch_op.add_column(sa.Column("education", sa.Text, nullable=True))
+        batch_op.add_column(sa.Column("certifications", sa.Text, nullable=True))
+        batch_op.add_column(sa.Column("years_of_experience", sa.String(50), nullable=True))
+        batch_op.add_column(sa.Column("areas_of_expertise", sa.Text, nullable=True))
 
 
 def downgrade() -> None:
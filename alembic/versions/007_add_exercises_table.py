@@ -18,7 +18,7 @@ def upgrade() -> None:
     op.create_table(
         "exercises",
         sa.Column("id", sa.Integer, primary_key=True, index=True),
-        sa.Column("patient_id", sa.Integer, sa.ForeignKey("patients.id"), nullable=False, index=True),
+        sa.Column("patient_id", sa.Integer, sa.ForeignKey("patients.id"), nullable=False),
         sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id"), nullable=False),
         sa.Column("session_summary_id", sa.Integer, sa.ForeignKey("session_summaries.id"), nullable=True),
         sa.Column("description", sa.Text, nullable=False),
@@ -28,6 +28,17 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
     )
 
+    # FK index built outside create_table — CONCURRENTLY on PostgreSQL (see 001)
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exercises_patient_id "
+                "ON exercises (patient_id)"
+            )
+    else:
+        op.create_index("ix_exercises_patient_id", "exercises", ["patient_id"])
+
 
 def downgrade() -> None:
     op.drop_table("exercises")
@@ -22,11 +22,22 @@ depends_on = None
 def upgrade() -> None:
     bind = op.get_bind()
     if bind.dialect.name == "postgresql":
-        # ALTER TYPE ADD VALUE cannot easily be rolled back in PostgreSQL,
+        # One DO block → one round trip for the existence check and all three
+        # ADD VALUEs.  ADD VALUE cannot easily be rolled back in PostgreSQL,
         # but IF NOT EXISTS makes this idempotent on re-runs.
-        bind.execute(sa.text("ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'scheduled'"))
-        bind.execute(sa.text("ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'cancelled'"))
-        bind.execute(sa.text("ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'failed'"))
+        # Fresh installs: 001 now creates status as VARCHAR + CHECK, so the
+        # native type never exists and the block does nothing.
+        bind.execute(sa.text("""
+            DO $$
+            BEGIN
+                IF EXISTS (SELECT 1 FROM pg_type WHERE typname = 'messagestatus') THEN
+                    ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'scheduled';
+                    ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'cancelled';
+                    ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'failed';
+                END IF;
+            END
+            $$
+        """))
     # SQLite (dev): native_enum=False means status is VARCHAR — no DDL needed.
 
 
@@ -30,34 +30,67 @@ down_revision = "008"
 branch_labels = None
 depends_on = None
 
+# table → columns 001 originally created as native ENUMs
+# (patientstatus, sessiontype, messagestatus/messagedirection, therapeuticapproach)
+ENUM_COLUMNS = {
+    "patients": ["status"],
+    "sessions": ["session_type"],
+    "messages": ["status", "direction"],
+    "therapist_profiles": ["therapeutic_approach"],
+}
+
+# table → [(column, server default SQL, existing type)]
+SERVER_DEFAULTS = {
+    "therapists": [
+        ("is_active", "true", sa.Boolean()),
+        ("is_verified", "false", sa.Boolean()),
+    ],
+    "therapist_profiles": [
+        ("onboarding_completed", "false", sa.Boolean()),
+        ("onboarding_step", "0", sa.Integer()),
+        ("tone_warmth", "3", sa.Integer()),
+        ("directiveness", "3", sa.Integer()),
+        ("style_version", "1", sa.Integer()),
+    ],
+    "patients": [
+        ("status", "'active'", sa.String(50)),
+        ("allow_ai_contact", "true", sa.Boolean()),
+        ("completed_exercises_count", "0", sa.Integer()),
+        ("missed_exercises_count", "0", sa.Integer()),
+    ],
+    "sessions": [
+        ("session_type", "'individual'", sa.String(50)),
+        ("has_recording", "false", sa.Boolean()),
+    ],
+    "session_summaries": [
+        ("therapist_edited", "false", sa.Boolean()),
+        ("approved_by_therapist", "false", sa.Boolean()),
+    ],
+    "messages": [
+        ("status", "'draft'", sa.String(50)),
+        ("requires_approval", "true", sa.Boolean()),
+        ("generated_by_ai", "true", sa.Boolean()),
+    ],
+}
+
 
 def upgrade() -> None:
     bind = op.get_bind()
 
     if bind.dialect.name == "postgresql":
         # ── 1. Convert native ENUM columns → VARCHAR ──────────────────────
-        # patients.status  (patientstatus)
-        bind.execute(sa.text(
-            "ALTER TABLE patients "
-            "ALTER COLUMN status TYPE VARCHAR(50) USING status::text"
-        ))
-        # sessions.session_type  (sessiontype)
-        bind.execute(sa.text(
-            "ALTER TABLE sessions "
-            "ALTER COLUMN session_type TYPE VARCHAR(50) USING session_type::text"
-        ))
-        # messages.status + messages.direction  (messagestatus, messagedirection)
-        bind.execute(sa.text(
-            "ALTER TABLE messages "
-            "ALTER COLUMN status TYPE VARCHAR(50) USING status::text, "
-            "ALTER COLUMN direction TYPE VARCHAR(50) USING direction::text"
-        ))
-        # therapist_profiles.therapeutic_approach  (therapeuticapproach)
-        bind.execute(sa.text(
-            "ALTER TABLE therapist_profiles "
-            "ALTER COLUMN therapeutic_approach TYPE VARCHAR(50) "
-            "USING therapeutic_approach::text"
-        ))
+        # Only columns still typed as an ENUM are rewritten: on fresh installs
+        # (001 now uses VARCHAR + CHECK) and re-runs every column is already
+        # character varying and the full-table rewrite is skipped.
+        enum_typed = _enum_typed_columns(bind)
+        for table, columns in ENUM_COLUMNS.items():
+            pending = [c for c in columns if (table, c) in enum_typed]
+            if not pending:
+                continue
+            clauses = ", ".join(
+                f"ALTER COLUMN {c} TYPE VARCHAR(50) USING {c}::text" for c in pending
+            )
+            bind.execute(sa.text(f"ALTER TABLE {table} {clauses}"))
 
         # ── 2. Drop the native ENUM types (no longer referenced) ──────────
         # Drop in dependency order; IF EXISTS makes it idempotent.
@@ -70,54 +103,35 @@ def upgrade() -> None:
     # ── 3. Add server_defaults (applies to both PostgreSQL and SQLite) ────
     # These ensure non-NULL values even on raw inserts and prevent
     # Pydantic validation errors when ORM refresh reads back NULL.
-
-    # therapists
-    op.alter_column("therapists", "is_active",
-                    server_default=sa.text("true"), existing_type=sa.Boolean())
-    op.alter_column("therapists", "is_verified",
-                    server_default=sa.text("false"), existing_type=sa.Boolean())
-
-    # therapist_profiles
-    op.alter_column("therapist_profiles", "onboarding_completed",
-                    server_default=sa.text("false"), existing_type=sa.Boolean())
-    op.alter_column("therapist_profiles", "onboarding_step",
-                    server_default=sa.text("0"), existing_type=sa.Integer())
-    op.alter_column("therapist_profiles", "tone_warmth",
-                    server_default=sa.text("3"), existing_type=sa.Integer())
-    op.alter_column("therapist_profiles", "directiveness",
-                    server_default=sa.text("3"), existing_type=sa.Integer())
-    op.alter_column("therapist_profiles", "style_version",
-                    server_default=sa.text("1"), existing_type=sa.Integer())
-
-    # patients
-    op.alter_column("patients", "status",
-                    server_default=sa.text("'active'"), existing_type=sa.String(50))
-    op.alter_column("patients", "allow_ai_contact",
-                    server_default=sa.text("true"), existing_type=sa.Boolean())
-    op.alter_column("patients", "completed_exercises_count",
-                    server_default=sa.text("0"), existing_type=sa.Integer())
-    op.alter_column("patients", "missed_exercises_count",
-                    server_default=sa.text("0"), existing_type=sa.Integer())
-
-    # sessions
-    op.alter_column("sessions", "session_type",
-                    server_default=sa.text("'individual'"), existing_type=sa.String(50))
-    op.alter_column("sessions", "has_recording",
-                    server_default=sa.text("false"), existing_type=sa.Boolean())
-
-    # session_summaries
-    op.alter_column("session_summaries", "therapist_edited",
-                    server_default=sa.text("false"), existing_type=sa.Boolean())
-    op.alter_column("session_summaries", "approved_by_therapist",
-                    server_default=sa.text("false"), existing_type=sa.Boolean())
-
-    # messages
-    op.alter_column("messages", "status",
-                    server_default=sa.text("'draft'"), existing_type=sa.String(50))
-    op.alter_column("messages", "requires_approval",
-                    server_default=sa.text("true"), existing_type=sa.Boolean())
-    op.alter_column("messages", "generated_by_ai",
-                    server_default=sa.text("true"), existing_type=sa.Boolean())
+    for table, columns in SERVER_DEFAULTS.items():
+        if bind.dialect.name == "postgresql":
+            # One ALTER TABLE per table: a single catalog lock per table
+            # instead of one per column.
+            clauses = ", ".join(
+                f"ALTER COLUMN {column} SET DEFAULT {default}"
+                for column, default, _ in columns
+            )
+            bind.execute(sa.text(f"ALTER TABLE {table} {clauses}"))
+        else:
+            # SQLite: batch mode rebuilds the table once for all columns.
+            with op.batch_alter_table(table) as batch_op:
+                for column, default, existing_type in columns:
+                    batch_op.alter_column(column,
+                                          server_default=sa.text(default),
+                                          existing_type=existing_type)
+
+
+def _enum_typed_columns(bind) -> set:
+    """(table, column) pairs among ENUM_COLUMNS whose type is still an ENUM."""
+    rows = bind.execute(
+        sa.text(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND data_type = 'USER-DEFINED' AND table_name = ANY(:tables)"
+        ),
+        {"tables": list(ENUM_COLUMNS)},
+    )
+    return {(row.table_name, row.column_name) for row in rows}
 
 
 def downgrade() -> None:
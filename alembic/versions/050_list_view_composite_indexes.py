@@ -0,0 +1,78 @@
+"""Composite indexes for patient-scoped list views
+
+Revision ID: 050
+Revises: 049
+Create Date: 2026-10-16
+
+Adds:
+- messages(therapist_id, patient_id, created_at DESC) — per-patient message
+  history, newest first, served straight from the index (no heap sort)
+- sessions(patient_id, session_date DESC) — per-patient session timeline
+
+Drops the single-column ix_messages_therapist_id and ix_sessions_patient_id:
+each is the leading column of the new composite, which covers the same
+lookups (including FK checks on delete).
+
+PostgreSQL builds the new indexes CONCURRENTLY so writes to messages and
+sessions are not blocked during rollout.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "050"
+down_revision = "049"
+branch_labels = None
+depends_on = None
+
+# (name, table, column SQL)
+COMPOSITE_INDEXES = (
+    ("ix_messages_therapist_patient_created", "messages",
+     "therapist_id, patient_id, created_at DESC"),
+    ("ix_sessions_patient_date", "sessions",
+     "patient_id, session_date DESC"),
+)
+
+# (name, table) — superseded by the composites above
+REDUNDANT_INDEXES = (
+    ("ix_messages_therapist_id", "messages"),
+    ("ix_sessions_patient_id", "sessions"),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, columns in COMPOSITE_INDEXES:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})"
+                )
+            for name, _table in REDUNDANT_INDEXES:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        return
+
+    with op.batch_alter_table("messages") as batch_op:
+        batch_op.create_index(
+            "ix_messages_therapist_patient_created",
+            ["therapist_id", "patient_id", sa.text("created_at DESC")],
+        )
+        batch_op.drop_index("ix_messages_therapist_id", if_exists=True)
+
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.create_index(
+            "ix_sessions_patient_date",
+            ["patient_id", sa.text("session_date DESC")],
+        )
+        batch_op.drop_index("ix_sessions_patient_id", if_exists=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.create_index("ix_sessions_patient_id", ["patient_id"])
+        batch_op.drop_index("ix_sessions_patient_date")
+
+    with op.batch_alter_table("messages") as batch_op:
+        batch_op.create_index("ix_messages_therapist_id", ["therapist_id"])
+        batch_op.drop_index("ix_messages_therapist_patient_created")
@@ -0,0 +1,65 @@
+"""Validate the foreign keys 001 adds as NOT VALID
+
+Revision ID: 051
+Revises: 050
+Create Date: 2026-10-16
+
+On PostgreSQL, 001 adds its foreign keys with NOT VALID so the initial
+schema (and any bulk seed loaded right after it) skips the per-row FK
+check.  This revision runs VALIDATE CONSTRAINT for each of them:
+
+- VALIDATE takes SHARE UPDATE EXCLUSIVE, so reads and writes continue
+  while the referencing rows are scanned.
+- Each constraint validates in its own autocommit transaction, so a
+  failure leaves the rest already validated and the scan is not repeated.
+- Constraints that are already valid (databases created before 001 was
+  changed, or via the squashed baseline) are skipped.
+
+SQLite: no-op — FKs are declared inline there.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "051"
+down_revision = "050"
+branch_labels = None
+depends_on = None
+
+# (table, constraint) — mirrors FOREIGN_KEYS in 001_initial_schema
+FOREIGN_KEYS = (
+    ("therapist_profiles", "therapist_profiles_therapist_id_fkey"),
+    ("patients", "patients_therapist_id_fkey"),
+    ("sessions", "sessions_therapist_id_fkey"),
+    ("sessions", "sessions_patient_id_fkey"),
+    ("sessions", "sessions_summary_id_fkey"),
+    ("messages", "messages_therapist_id_fkey"),
+    ("messages", "messages_patient_id_fkey"),
+    ("messages", "messages_related_session_id_fkey"),
+)
+
+
+def _is_not_valid(bind, name: str) -> bool:
+    return bind.execute(
+        sa.text(
+            "SELECT 1 FROM pg_constraint "
+            "WHERE conname = :name AND contype = 'f' AND NOT convalidated"
+        ),
+        {"name": name},
+    ).scalar() is not None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, name in FOREIGN_KEYS:
+            if _is_not_valid(bind, name):
+                op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    # A validated constraint cannot be marked NOT VALID again; nothing to undo.
+    pass
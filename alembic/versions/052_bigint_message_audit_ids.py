@@ -0,0 +1,61 @@
+"""Widen messages.id and audit_logs.id to BIGINT
+
+Revision ID: 052
+Revises: 051
+Create Date: 2026-10-16
+
+messages and audit_logs are the append-only, high-volume tables.  001 now
+creates their ids as BIGINT; this brings existing PostgreSQL databases in
+line while the tables are still small, instead of a multi-hour INT4 → INT8
+rewrite once the sequence nears 2^31.
+
+- ALTER COLUMN ... TYPE BIGINT rewrites the table under ACCESS EXCLUSIVE;
+  cheap at today's row counts.
+- The backing sequence is widened too (PostgreSQL 10+ SERIAL sequences are
+  typed AS integer and would still stop at 2^31).
+- Skipped when the column is already bigint (fresh installs).
+
+SQLite: no-op — INTEGER is already 64-bit there.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "052"
+down_revision = "051"
+branch_labels = None
+depends_on = None
+
+TABLES = ("messages", "audit_logs")
+
+
+def _column_type(bind, table: str) -> str | None:
+    return bind.execute(
+        sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = 'id'"
+        ),
+        {"table": table},
+    ).scalar()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        if _column_type(bind, table) == "bigint":
+            continue
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT")
+        sequence = bind.execute(
+            sa.text("SELECT pg_get_serial_sequence(:table, 'id')"),
+            {"table": table},
+        ).scalar()
+        if sequence:
+            op.execute(f"ALTER SEQUENCE {sequence} AS BIGINT")
+
+
+def downgrade() -> None:
+    # Narrowing back to INTEGER could fail on existing ids; intentionally a no-op.
+    pass
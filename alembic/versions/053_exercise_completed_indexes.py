@@ -0,0 +1,57 @@
+"""Composite indexes for exercise completion counts
+
+Revision ID: 053
+Revises: 052
+Create Date: 2026-10-16
+
+Adds:
+- exercises(therapist_id, completed) — open-task count polled by the
+  dashboard (GET /exercises/open-count), answered from the index alone
+- exercises(patient_id, completed) — completed_exercises_count resync on
+  every exercise PATCH / DELETE
+
+Drops the single-column ix_exercises_patient_id: patient_id leads the new
+composite, which covers the same lookups (including FK checks on delete).
+
+PostgreSQL builds the new indexes CONCURRENTLY so writes to exercises are
+not blocked during rollout.
+"""
+
+from alembic import op
+
+revision = "053"
+down_revision = "052"
+branch_labels = None
+depends_on = None
+
+# (name, columns)
+COMPOSITE_INDEXES = (
+    ("ix_exercises_therapist_completed", ["therapist_id", "completed"]),
+    ("ix_exercises_patient_completed", ["patient_id", "completed"]),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, columns in COMPOSITE_INDEXES:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON exercises ({', '.join(columns)})"
+                )
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exercises_patient_id")
+        return
+
+    with op.batch_alter_table("exercises") as batch_op:
+        for name, columns in COMPOSITE_INDEXES:
+            batch_op.create_index(name, columns)
+        batch_op.drop_index("ix_exercises_patient_id", if_exists=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("exercises") as batch_op:
+        batch_op.create_index("ix_exercises_patient_id", ["patient_id"])
+        for name, _columns in COMPOSITE_INDEXES:
+            batch_op.drop_index(name)
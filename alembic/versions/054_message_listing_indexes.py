@@ -0,0 +1,62 @@
+"""Composite indexes for the therapist-wide message listing
+
+Revision ID: 054
+Revises: 053
+Create Date: 2026-10-16
+
+Adds:
+- messages(therapist_id, created_at DESC) — Message Control Center listing
+  (GET /messages/) across all patients, newest first; with the `before`
+  keyset cursor it becomes a backwards index range scan, no sort node
+- messages(therapist_id, status, created_at DESC) — the same listing
+  filtered by status, and the pending-approval queue (status IN ...)
+
+The status index is a full rather than partial index: the listing accepts
+any status as a filter, and a partial index only serves queries whose
+predicate implies its WHERE clause.
+
+PostgreSQL builds the indexes CONCURRENTLY so writes to messages are not
+blocked during rollout.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "054"
+down_revision = "053"
+branch_labels = None
+depends_on = None
+
+# (name, column SQL)
+COMPOSITE_INDEXES = (
+    ("ix_messages_therapist_created", "therapist_id, created_at DESC"),
+    ("ix_messages_therapist_status_created", "therapist_id, status, created_at DESC"),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, columns in COMPOSITE_INDEXES:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON messages ({columns})"
+                )
+        return
+
+    with op.batch_alter_table("messages") as batch_op:
+        batch_op.create_index(
+            "ix_messages_therapist_created",
+            ["therapist_id", sa.text("created_at DESC")],
+        )
+        batch_op.create_index(
+            "ix_messages_therapist_status_created",
+            ["therapist_id", "status", sa.text("created_at DESC")],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("messages") as batch_op:
+        for name, _columns in COMPOSITE_INDEXES:
+            batch_op.drop_index(name)
@@ -0,0 +1,58 @@
+"""Make the patients exercise counters NOT NULL and backfill them
+
+Revision ID: 055
+Revises: 054
+Create Date: 2026-10-16
+
+completed_exercises_count / missed_exercises_count are the denormalized
+counters GET /patients/ reads directly (no join or COUNT per patient).
+They were nullable with only a server default (009), so rows written before
+that could hold NULL, and completed_exercises_count could have drifted
+from the exercises table before the exercise routes kept it in sync.
+
+This migration:
+  1. Recomputes completed_exercises_count from exercises for every patient.
+  2. Sets NULL missed_exercises_count to 0.
+  3. Makes both columns NOT NULL DEFAULT 0.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "055"
+down_revision = "054"
+branch_labels = None
+depends_on = None
+
+COUNTER_COLUMNS = ("completed_exercises_count", "missed_exercises_count")
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE patients SET completed_exercises_count = ("
+        "SELECT COUNT(*) FROM exercises "
+        "WHERE exercises.patient_id = patients.id AND exercises.completed = true)"
+    )
+    op.execute(
+        "UPDATE patients SET missed_exercises_count = 0 WHERE missed_exercises_count IS NULL"
+    )
+
+    with op.batch_alter_table("patients") as batch_op:
+        for column in COUNTER_COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("patients") as batch_op:
+        for column in COUNTER_COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Integer(),
+                nullable=True,
+                server_default="0",
+            )
@@ -0,0 +1,46 @@
+"""Add session_summary_jobs for background from-audio summaries
+
+Revision ID: 056
+Revises: 055
+Create Date: 2026-10-16
+
+POST /sessions/{id}/summary/from-audio now returns 202 with a job id and
+runs transcription + summarization after the response; this table tracks
+each job's status (pending | done | failed) for the polling endpoint.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "056"
+down_revision = "055"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "session_summary_jobs",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("job_id", sa.String(32), nullable=False),
+        sa.Column("session_id", sa.Integer, sa.ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("therapist_id", sa.Integer, sa.ForeignKey("therapists.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column(
+            "summary_id",
+            sa.Integer,
+            sa.ForeignKey("session_summaries.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("error_message", sa.Text, nullable=True),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+    )
+    op.create_index(
+        "ix_session_summary_jobs_job_id", "session_summary_jobs", ["job_id"], unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_session_summary_jobs_job_id", table_name="session_summary_jobs")
+    op.drop_table("session_summary_jobs")
@@ -5,6 +5,7 @@ Public surface:
   AIProvider          — ABC; call provider.generate(messages, model, ...) → GenerationResult
   AnthropicProvider   — Anthropic Claude implementation (primary)
   OpenAIProvider      — OpenAI implementation (kept for Whisper callers; not used for text gen)
+  get_anthropic_provider — shared AnthropicProvider (one client/connection pool per API key)
   ModelRouter         — Resolves flow_type + context → (model_id, route_reason)
   FlowType            — Enum of all generation flows
   GenerationResult    — Dataclass returned by every provider.generate() call
@@ -20,7 +21,7 @@ Usage:
 """
 
 from app.ai.models import FlowType, GenerationResult
-from app.ai.provider import AIProvider, AnthropicProvider, OpenAIProvider
+from app.ai.provider import AIProvider, AnthropicProvider, OpenAIProvider, get_anthropic_provider
 from app.ai.router import ModelRouter
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     "AIProvider",
     "AnthropicProvider",
     "OpenAIProvider",
+    "get_anthropic_provider",
     "ModelRouter",
 ]
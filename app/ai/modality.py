@@ -52,7 +52,14 @@ def is_cbt_active(profile) -> bool:
     return False
 
 
-def resolve_modality_pack(db: "Session", therapist_id: int) -> Optional["ModalityPack"]:
+_UNSET = object()
+
+
+def resolve_modality_pack(
+    db: "Session",
+    therapist_id: int,
+    profile=_UNSET,
+) -> Optional["ModalityPack"]:
     """
     Return the active ModalityPack for the given therapist.
 
@@ -61,15 +68,19 @@ def resolve_modality_pack(db: "Session", therapist_id: int) -> Optional["Modalit
     2. Auto-detect CBT from approach_description / therapeutic_approach
     3. Fallback to 'generic_integrative'    — safe default
     4. None                                 — no packs in DB at all
+
+    Pass `profile` (may be None) when the caller already has the therapist's
+    TherapistProfile loaded, to skip re-selecting it.
     """
     from app.models.therapist import TherapistProfile
     from app.models.modality import ModalityPack
 
-    profile = (
-        db.query(TherapistProfile)
-        .filter(TherapistProfile.therapist_id == therapist_id)
-        .first()
-    )
+    if profile is _UNSET:
+        profile = (
+            db.query(TherapistProfile)
+            .filter(TherapistProfile.therapist_id == therapist_id)
+            .first()
+        )
 
     if profile and profile.modality_pack_id:
         pack = (
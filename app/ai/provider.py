@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import AsyncIterator
 
 from loguru import logger
@@ -175,6 +176,18 @@ class AnthropicProvider(AIProvider):
                 yield text
 
 
+@lru_cache(maxsize=None)
+def get_anthropic_provider(api_key: str) -> AnthropicProvider:
+    """
+    Process-wide AnthropicProvider for `api_key`.
+
+    Agents are built per request; sharing the provider means they share one
+    AsyncAnthropic client and its HTTP connection pool (keep-alive, TLS
+    sessions) instead of opening a fresh one for every call.
+    """
+    return AnthropicProvider(api_key=api_key)
+
+
 class OpenAIProvider(AIProvider):
     """
     OpenAI implementation.
@@ -1,16 +1,47 @@
 """API dependencies - database session, current user, etc."""
 
-from typing import Generator
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+import threading
+import time
+from typing import Any, Dict, Generator, Optional, Tuple
+from fastapi import Depends, Header, HTTPException, Request, status
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.agent import TherapyAgent
 from app.core.database import SessionLocal
 from app.security.auth import decode_access_token
 from app.models.therapist import Therapist
+from app.services.message_service import MessageService
+from app.services.session_service import SessionService
 from app.services.therapist_service import TherapistService
 
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+# In-process cache of the auth lookup:
+#   token → (cached_at, therapist_id, token exp, column snapshot).
+# A hit skips both the JWT decode and the therapists SELECT; the token's own
+# exp is still enforced.  Entries are dropped after _THERAPIST_CACHE_TTL
+# seconds or as soon as the row is updated through the ORM (see
+# _invalidate_on_write below).
+_THERAPIST_CACHE_TTL = 60.0
+_THERAPIST_CACHE_MAX = 10_000
+_therapist_cache: Dict[str, Tuple[float, int, float, Dict[str, Any]]] = {}
+_therapist_cache_lock = threading.Lock()
+
+
+def bearer_token(authorization: Optional[str] = Header(None)) -> str:
+    """
+    Extract the token from `Authorization: Bearer <token>`.
+
+    Replaces OAuth2PasswordBearer: same 401 response, without the
+    Security-scheme machinery on every request.
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
 
 
 def get_db() -> Generator:
@@ -22,41 +53,120 @@ def get_db() -> Generator:
         db.close()
 
 
-async def get_current_therapist(
-    token: str = Depends(oauth2_scheme),
+# The service providers only construct an object (no I/O), so they are
+# `async def`: FastAPI calls them on the event loop instead of hopping to the
+# threadpool as it does for sync dependencies.  Depends caches each one per
+# request, so everything in a request shares one instance.
+
+async def get_therapist_service(db: Session = Depends(get_db)) -> TherapistService:
+    """TherapistService bound to the request's session"""
+    return TherapistService(db)
+
+
+async def get_message_service(db: Session = Depends(get_db)) -> MessageService:
+    """MessageService bound to the request's session"""
+    return MessageService(db)
+
+
+async def get_session_service(db: Session = Depends(get_db)) -> SessionService:
+    """SessionService bound to the request's session"""
+    return SessionService(db)
+
+
+def invalidate_therapist_cache(therapist_id: Optional[int] = None) -> None:
+    """Drop cached auth lookups for one therapist, or all of them."""
+    with _therapist_cache_lock:
+        if therapist_id is None:
+            _therapist_cache.clear()
+            return
+        for key in [k for k, entry in _therapist_cache.items() if entry[1] == therapist_id]:
+            del _therapist_cache[key]
+
+
+@event.listens_for(Therapist, "after_update")
+@event.listens_for(Therapist, "after_delete")
+def _invalidate_on_write(mapper, connection, target) -> None:
+    invalidate_therapist_cache(target.id)
+
+
+def _cached_therapist(db: Session, token: str) -> Optional[Therapist]:
+    """Rebuild a cached therapist and attach it to `db` without a SELECT."""
+    with _therapist_cache_lock:
+        entry = _therapist_cache.get(token)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _THERAPIST_CACHE_TTL or entry[2] <= time.time():
+            del _therapist_cache[token]
+            return None
+        snapshot = entry[3]
+
+    therapist = Therapist(**snapshot)
+    make_transient_to_detached(therapist)
+    db.add(therapist)
+    return therapist
+
+
+def _cache_therapist(token: str, exp: float, therapist: Therapist) -> None:
+    snapshot = {
+        attr.key: getattr(therapist, attr.key)
+        for attr in sa_inspect(Therapist).column_attrs
+    }
+    with _therapist_cache_lock:
+        if len(_therapist_cache) >= _THERAPIST_CACHE_MAX:
+            _therapist_cache.pop(next(iter(_therapist_cache)))
+        _therapist_cache[token] = (time.monotonic(), therapist.id, exp, snapshot)
+
+
+def _credentials_error() -> HTTPException:
+    """
+    401 for every token failure path.  A fresh instance per raise: an
+    exception object shared across threadpool threads would have its
+    __traceback__ / __context__ rewritten concurrently by each raiser.
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_current_therapist(
+    token: str = Depends(bearer_token),
     db: Session = Depends(get_db)
 ) -> Therapist:
     """
     Get current authenticated therapist from JWT token
 
+    Plain `def` on purpose: the lookup uses the sync Session, so FastAPI
+    runs it in the threadpool instead of blocking the event loop.
+
     Raises:
         HTTPException: If token is invalid or therapist not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    # Token seen recently: no decode, no SELECT (see _therapist_cache)
+    therapist = _cached_therapist(db, token)
+    if therapist is not None:
+        if not therapist.is_active:
+            raise HTTPException(status_code=400, detail="Inactive therapist")
+        return therapist
 
     # Decode token
     payload = decode_access_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_error()
 
     therapist_id = payload.get("sub")
     try:
         therapist_id = int(therapist_id)
     except (TypeError, ValueError):
-        raise credentials_exception
-    if therapist_id is None:
-        raise credentials_exception
+        raise _credentials_error() from None
 
-    # Get therapist
     therapist_service = TherapistService(db)
     therapist = therapist_service.get_therapist_by_id(therapist_id)
-
     if therapist is None:
-        raise credentials_exception
+        raise _credentials_error()
+
+    _cache_therapist(token, payload["exp"], therapist)
 
     if not therapist.is_active:
         raise HTTPException(status_code=400, detail="Inactive therapist")
@@ -64,10 +174,25 @@ async def get_current_therapist(
     return therapist
 
 
-async def get_current_active_therapist(
-    current_therapist: Therapist = Depends(get_current_therapist)
-) -> Therapist:
-    """Get current active therapist"""
-    if not current_therapist.is_active:
-        raise HTTPException(status_code=400, detail="Inactive therapist")
-    return current_therapist
+# get_current_therapist already rejects inactive therapists; kept as an
+# alias for existing imports.
+get_current_active_therapist = get_current_therapist
+
+
+async def get_therapist_agent(
+    request: Request,
+    current_therapist: Therapist = Depends(get_current_therapist),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+) -> TherapyAgent:
+    """
+    The current therapist's TherapyAgent, built once per request.
+
+    Kept on request.state.agent so anything else handling the same request
+    reuses it; across requests the inputs come from the agent config cache
+    in TherapistService.get_agent_for_therapist.
+    """
+    agent = getattr(request.state, "agent", None)
+    if agent is None:
+        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
+        request.state.agent = agent
+    return agent
@@ -1,5 +1,6 @@
 """Admin Panel API routes — protected by admin JWT."""
 
+import asyncio
 import secrets
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -884,7 +885,7 @@ async def send_temporary_password(
     temp_pw = _generate_temp_password()
 
     # Update hashed password and flag for forced change
-    t.hashed_password = get_password_hash(temp_pw)
+    t.hashed_password = await asyncio.to_thread(get_password_hash, temp_pw)
     t.must_change_password = True
     db.commit()
 
@@ -1,6 +1,7 @@
 """Authentication routes"""
 
 from datetime import timedelta, datetime, timezone
+import asyncio
 import hashlib
 import hmac
 import secrets
@@ -10,12 +11,15 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from typing import Optional
 from pydantic import BaseModel, EmailStr
-from app.api.deps import get_db, get_current_therapist
+from app.api.deps import get_db, get_current_therapist, get_therapist_service
 from app.services.therapist_service import TherapistService
 from app.security.auth import verify_password, get_password_hash, create_access_token
 from app.models.therapist import Therapist, TherapistProfile, TherapeuticApproach
 from app.models.admin_alert import AdminAlert
 from app.core.config import settings
+from app.services.loops_service import notify_loops_signup
+from app.utils.alerts import create_alert
+from app.utils.phone import normalize_phone
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +60,6 @@ def _record_failed_login(email: str, db) -> None:
     _failed_attempts[email] = attempts
     if len(attempts) >= _FAIL_THRESHOLD:
         try:
-            from app.utils.alerts import create_alert
             create_alert(
                 db,
                 "login_failed",
@@ -89,12 +92,11 @@ class RegisterRequest(BaseModel):
 @router.post("/register", response_model=TokenResponse)
 async def register(
     request: RegisterRequest,
+    therapist_service: TherapistService = Depends(get_therapist_service),
     db: Session = Depends(get_db)
 ):
     """Register a new therapist account"""
 
-    therapist_service = TherapistService(db)
-
     # Guard: terms acceptance is mandatory
     if not request.has_accepted_terms:
         raise HTTPException(
@@ -105,7 +107,6 @@ async def register(
     # Normalize therapist phone to E.164 if provided
     phone = request.phone
     if phone:
-        from app.utils.phone import normalize_phone
         try:
             phone = normalize_phone(phone)
         except ValueError as e:
@@ -146,8 +147,6 @@ async def register(
 
         # Loops.so — fire-and-forget signup notification
         try:
-            from app.services.loops_service import notify_loops_signup
-            import asyncio
             name_parts = (therapist.full_name or "").split(" ", 1)
             asyncio.create_task(notify_loops_signup(
                 email=therapist.email,
@@ -175,17 +174,18 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
+    therapist_service: TherapistService = Depends(get_therapist_service),
     db: Session = Depends(get_db)
 ):
     """Login to get access token"""
 
-    therapist_service = TherapistService(db)
-
     # Get therapist by email
     therapist = therapist_service.get_therapist_by_email(form_data.username)
 
-    # Verify password
-    if not therapist or not verify_password(form_data.password, therapist.hashed_password):
+    # Verify password (bcrypt is ~100 ms of CPU — keep it off the event loop)
+    if not therapist or not await asyncio.to_thread(
+        verify_password, form_data.password, therapist.hashed_password
+    ):
         _record_failed_login(form_data.username, db)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -257,7 +257,9 @@ async def get_admin_token(
     Stored in sessionStorage (never localStorage) — not a regular auth token.
     """
     therapist = db.query(Therapist).filter(Therapist.email == request.email).first()
-    if not therapist or not verify_password(request.password, therapist.hashed_password):
+    if not therapist or not await asyncio.to_thread(
+        verify_password, request.password, therapist.hashed_password
+    ):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     if not therapist.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
@@ -320,13 +322,15 @@ async def change_password(
             detail="הסיסמה החדשה חייבת להכיל לפחות 8 תווים",
         )
 
-    if not verify_password(body.current_password, current_therapist.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, body.current_password, current_therapist.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="הסיסמה הזמנית שגויה",
         )
 
-    current_therapist.hashed_password = get_password_hash(body.new_password)
+    current_therapist.hashed_password = await asyncio.to_thread(get_password_hash, body.new_password)
     current_therapist.must_change_password = False
     db.commit()
 
@@ -596,7 +600,7 @@ async def google_complete_signup(
         # Create the new account now, with consent timestamp
         therapist = Therapist(
             email=email,
-            hashed_password=get_password_hash(secrets.token_urlsafe(32)),
+            hashed_password=await asyncio.to_thread(get_password_hash, secrets.token_urlsafe(32)),
             full_name=full_name,
             auth_provider="google",
             google_sub=google_sub,
@@ -633,8 +637,6 @@ async def google_complete_signup(
 
         # Loops.so — fire-and-forget signup notification
         try:
-            from app.services.loops_service import notify_loops_signup
-            import asyncio
             name_parts = (therapist.full_name or "").split(" ", 1)
             asyncio.create_task(notify_loops_signup(
                 email=therapist.email,
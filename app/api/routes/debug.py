@@ -3,12 +3,20 @@ Debug / diagnostic routes — only mounted in development / staging.
 Never mounted in production (enforced in main.py).
 """
 
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import APIRouter, Depends
 from app.api.deps import get_current_therapist
+from app.core.config import settings
 from app.models.therapist import Therapist
 
 router = APIRouter()
 
+# The shared Sandbox number is Twilio-owned — no ownership check for it.
+SANDBOX_NUMBER = "+14155238886"
+
 
 @router.get("/twilio-test")
 async def twilio_test(
@@ -24,8 +32,6 @@ async def twilio_test(
 
     Returns {"ok": true, ...} on success, {"ok": false, "error": ...} on failure.
     """
-    from app.core.config import settings
-
     # ── 1. Check settings are present ──────────────────────────────────────
     missing = [
         f
@@ -46,56 +52,56 @@ async def twilio_test(
 
     # ── 2. Build client ─────────────────────────────────────────────────────
     try:
-        from twilio.rest import Client
-
         if has_api_key:
-            client = Client(
+            client = _twilio_client(
                 settings.TWILIO_API_KEY_SID,
                 settings.TWILIO_API_KEY_SECRET,
-                account_sid=settings.TWILIO_ACCOUNT_SID,
+                settings.TWILIO_ACCOUNT_SID,
             )
         else:
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+            client = _twilio_client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
     except Exception as exc:
         return {"ok": False, "stage": "client_init", "error": str(exc)}
 
-    # ── 3. Fetch account (proves auth) ──────────────────────────────────────
-    try:
-        account = client.api.accounts(settings.TWILIO_ACCOUNT_SID).fetch()
-    except Exception as exc:
+    whatsapp_number = settings.TWILIO_WHATSAPP_NUMBER  # e.g. "whatsapp:+972..."
+    bare_number = whatsapp_number.replace("whatsapp:", "").strip()
+    check_number = bare_number != SANDBOX_NUMBER
+
+    # ── 3 + 4. Fetch account (proves auth) and look up the WhatsApp number ──
+    # Independent blocking REST calls — run them concurrently off the loop.
+    calls = [asyncio.to_thread(client.api.accounts(settings.TWILIO_ACCOUNT_SID).fetch)]
+    if check_number:
+        calls.append(
+            asyncio.to_thread(client.incoming_phone_numbers.list, phone_number=bare_number, limit=1)
+        )
+    account, *number_result = await asyncio.gather(*calls, return_exceptions=True)
+
+    if isinstance(account, Exception):
         return {
             "ok": False,
             "stage": "account_fetch",
-            "error": str(exc),
-            "hint": _auth_hint(str(exc)),
+            "error": str(account),
+            "hint": _auth_hint(str(account)),
         }
 
-    # ── 4. Verify the WhatsApp number exists in the account ─────────────────
-    whatsapp_number = settings.TWILIO_WHATSAPP_NUMBER  # e.g. "whatsapp:+972..."
-    bare_number = whatsapp_number.replace("whatsapp:", "").strip()
     number_status = "not_checked"
     number_hint = ""
 
-    # The shared Sandbox number (+14155238886) is Twilio-owned — skip ownership check.
-    SANDBOX_NUMBER = "+14155238886"
-    if bare_number == SANDBOX_NUMBER:
+    if not check_number:
         number_status = "sandbox_shared"
         number_hint = "Using the shared WhatsApp Sandbox — no ownership check needed."
+    elif isinstance(number_result[0], Exception):
+        number_status = "check_failed"
+        number_hint = str(number_result[0])
+    elif number_result[0]:
+        number_status = "found_in_account"
     else:
-        try:
-            matches = client.incoming_phone_numbers.list(phone_number=bare_number, limit=1)
-            if matches:
-                number_status = "found_in_account"
-            else:
-                number_status = "not_found_in_account"
-                number_hint = (
-                    f"The number {bare_number} was not found in your Twilio account. "
-                    "Check the TWILIO_WHATSAPP_NUMBER in .env — it must match a number "
-                    "you own in the Twilio console."
-                )
-        except Exception as exc:
-            number_status = "check_failed"
-            number_hint = str(exc)
+        number_status = "not_found_in_account"
+        number_hint = (
+            f"The number {bare_number} was not found in your Twilio account. "
+            "Check the TWILIO_WHATSAPP_NUMBER in .env — it must match a number "
+            "you own in the Twilio console."
+        )
 
     return {
         "ok": number_status not in ("not_found_in_account",),
@@ -113,17 +119,39 @@ async def twilio_test(
 
 # ── helpers ─────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _twilio_client(username: str, password: str, account_sid: Optional[str] = None):
+    """Twilio REST client, reused while the credentials are unchanged."""
+    from twilio.rest import Client
+
+    if account_sid is not None:
+        return Client(username, password, account_sid=account_sid)
+    return Client(username, password)
+
+
+# (needles, hint) — first entry with a needle in the lower-cased error wins
+_AUTH_HINTS = (
+    (
+        ("20003", "authenticate", "unauthorized"),
+        "Authentication failed (HTTP 401 / error 20003). "
+        "Check TWILIO_ACCOUNT_SID and TWILIO_API_KEY_SID + TWILIO_API_KEY_SECRET "
+        "(or TWILIO_AUTH_TOKEN) in your .env. "
+        "API Keys must be created under the same Account SID shown in the Twilio console.",
+    ),
+    (
+        ("20404", "not found"),
+        "Account SID not found — double-check TWILIO_ACCOUNT_SID in .env.",
+    ),
+    (
+        ("connection", "timeout"),
+        "Network error connecting to Twilio. Check your internet / firewall.",
+    ),
+)
+
+
 def _auth_hint(error_msg: str) -> str:
     e = error_msg.lower()
-    if "20003" in e or "authenticate" in e or "unauthorized" in e:
-        return (
-            "Authentication failed (HTTP 401 / error 20003). "
-            "Check TWILIO_ACCOUNT_SID and TWILIO_API_KEY_SID + TWILIO_API_KEY_SECRET "
-            "(or TWILIO_AUTH_TOKEN) in your .env. "
-            "API Keys must be created under the same Account SID shown in the Twilio console."
-        )
-    if "20404" in e or "not found" in e:
-        return "Account SID not found — double-check TWILIO_ACCOUNT_SID in .env."
-    if "connection" in e or "timeout" in e:
-        return "Network error connecting to Twilio. Check your internet / firewall."
+    for needles, hint in _AUTH_HINTS:
+        if any(needle in e for needle in needles):
+            return hint
     return "See Twilio error code at https://www.twilio.com/docs/api/errors"
@@ -1,14 +1,19 @@
 """Exercise / homework management routes."""
 
+import sys
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import case, func, select, update
 from sqlalchemy.orm import Session as DBSession
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict
+from typing import Iterable, Optional, List
 from datetime import datetime
 from app.api.deps import get_db, get_current_therapist
+from app.core import list_cache
 from app.models.therapist import Therapist
 from app.models.exercise import Exercise
 from app.models.patient import Patient
+from app.services.patient_service import PatientService
 
 router = APIRouter()
 
@@ -25,8 +30,7 @@ class ExerciseResponse(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CreateExerciseRequest(BaseModel):
@@ -40,18 +44,58 @@ class PatchExerciseRequest(BaseModel):
     description: Optional[str] = None
 
 
+class BulkPatchExerciseItem(PatchExerciseRequest):
+    id: int
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _sync_completed_count(patient_id: int, db: DBSession) -> None:
-    """Recompute and persist patient.completed_exercises_count."""
-    count = db.query(Exercise).filter(
-        Exercise.patient_id == patient_id,
-        Exercise.completed == True,  # noqa: E712
-    ).count()
-    db.query(Patient).filter(Patient.id == patient_id).update(
-        {"completed_exercises_count": count}
-    )
+# ExerciseResponse field names, resolved once at import (sys.intern keeps the
+# per-row dict keys pointer-equal to the model's own field keys).
+_EXERCISE_RESPONSE_FIELDS = tuple(sys.intern(f) for f in ExerciseResponse.model_fields)
+
+
+# Invariant: only ever pass Exercise rows loaded from our own DB.  The columns
+# already match ExerciseResponse, so model_construct skips re-validating them.
+# Inbound request bodies (CreateExerciseRequest, PatchExerciseRequest) are
+# still validated by FastAPI as usual.
+def _exercise_to_response(e: Exercise, _fields=_EXERCISE_RESPONSE_FIELDS) -> ExerciseResponse:
+    return ExerciseResponse.model_construct(**{f: getattr(e, f) for f in _fields})
+
+
+def _sync_completed_counts(patient_ids: Iterable[int], therapist_id: int, db: DBSession) -> None:
+    """
+    Recompute and persist completed_exercises_count for `patient_ids`.
+
+    Flushes pending exercise changes (the session does not autoflush), then
+    sets every counter with one UPDATE ... SET = (correlated SELECT COUNT(*))
+    instead of a SELECT round-trip followed by an UPDATE per patient.
+    Caller commits.
+    """
     db.flush()
+    # Core UPDATE: no mapper events, so drop the cached patient list explicitly
+    list_cache.mark_stale(db, list_cache.PATIENTS, therapist_id)
+    completed = (
+        select(func.count())
+        .select_from(Exercise)
+        .where(Exercise.patient_id == Patient.id, Exercise.completed.is_(True))
+        .correlate(Patient)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(Patient)
+        .where(Patient.id.in_(list(patient_ids)))
+        .values(completed_exercises_count=completed)
+    )
+
+
+def _sync_completed_count(patient_id: int, therapist_id: int, db: DBSession) -> None:
+    """Recompute and persist one patient's completed_exercises_count."""
+    _sync_completed_counts((patient_id,), therapist_id, db)
+
+
+# ExerciseResponse fields as columns, for the Core read path in list_exercises
+_EXERCISE_RESPONSE_COLUMNS = tuple(getattr(Exercise, f) for f in _EXERCISE_RESPONSE_FIELDS)
 
 
 def _owned_exercise(exercise_id: int, therapist_id: int, db: DBSession) -> Exercise:
@@ -67,31 +111,36 @@ def _owned_exercise(exercise_id: int, therapist_id: int, db: DBSession) -> Exerc
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
 @router.get("/", response_model=List[ExerciseResponse])
-async def list_exercises(
+def list_exercises(
     patient_id: int = Query(...),
     current_therapist: Therapist = Depends(get_current_therapist),
     db: DBSession = Depends(get_db),
 ):
     """List all exercises for a patient (owned by current therapist)."""
-    # Verify patient belongs to therapist
-    patient = db.query(Patient).filter(
-        Patient.id == patient_id,
-        Patient.therapist_id == current_therapist.id,
-    ).first()
-    if not patient:
+    # Read-only: Core select of the response columns, serialized by orjson —
+    # no ORM hydration, no Pydantic pass (response_model is docs-only here).
+    # The join carries the patient ownership check, so rows come back only
+    # for this therapist's own patient.
+    rows = db.execute(
+        select(*_EXERCISE_RESPONSE_COLUMNS)
+        .join(Patient, Patient.id == Exercise.patient_id)
+        .where(
+            Patient.id == patient_id,
+            Patient.therapist_id == current_therapist.id,
+            Exercise.therapist_id == current_therapist.id,
+        )
+        .order_by(Exercise.created_at.desc())
+    ).mappings().all()
+
+    # Only an empty result needs the ownership check, to tell 404 from [].
+    if not rows and not PatientService(db).is_patient_owned(patient_id, current_therapist.id):
         raise HTTPException(status_code=404, detail="Patient not found")
 
-    exercises = (
-        db.query(Exercise)
-        .filter(Exercise.patient_id == patient_id, Exercise.therapist_id == current_therapist.id)
-        .order_by(Exercise.created_at.desc())
-        .all()
-    )
-    return [ExerciseResponse.model_validate(e) for e in exercises]
+    return ORJSONResponse(content=[dict(row) for row in rows])
 
 
 @router.post("/", response_model=ExerciseResponse, status_code=201)
-async def create_exercise(
+def create_exercise(
     request: CreateExerciseRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: DBSession = Depends(get_db),
@@ -113,12 +162,74 @@ async def create_exercise(
     )
     db.add(ex)
     db.commit()
-    db.refresh(ex)
-    return ExerciseResponse.model_validate(ex)
+    return _exercise_to_response(ex)
+
+
+@router.patch("/bulk", response_model=List[ExerciseResponse])
+def bulk_patch_exercises(
+    items: List[BulkPatchExerciseItem],
+    current_therapist: Therapist = Depends(get_current_therapist),
+    db: DBSession = Depends(get_db),
+):
+    """
+    Apply several exercise PATCHes in one request.
+
+    One UPDATE (CASE per changed column) for all exercises, one UPDATE for
+    the affected patients' counters, one commit.  404 if any id is not one
+    of the current therapist's exercises.
+    """
+    if not items:
+        return ORJSONResponse(content=[])
+
+    ids = [item.id for item in items]
+    now = datetime.utcnow()
+    values = {}
+
+    described = [(item.id, item.description) for item in items if item.description is not None]
+    if described:
+        values["description"] = case(
+            *((Exercise.id == ex_id, text) for ex_id, text in described),
+            else_=Exercise.description,
+        )
+
+    toggled = [(item.id, item.completed) for item in items if item.completed is not None]
+    if toggled:
+        values["completed"] = case(
+            *((Exercise.id == ex_id, done) for ex_id, done in toggled),
+            else_=Exercise.completed,
+        )
+        values["completed_at"] = case(
+            *((Exercise.id == ex_id, now if done else None) for ex_id, done in toggled),
+            else_=Exercise.completed_at,
+        )
+
+    stmt = (
+        update(Exercise)
+        .where(Exercise.id.in_(ids), Exercise.therapist_id == current_therapist.id)
+        .returning(*_EXERCISE_RESPONSE_COLUMNS)
+    )
+    if values:
+        stmt = stmt.values(**values)
+    else:
+        # Nothing to change: a no-op SET still returns the rows and checks ownership
+        stmt = stmt.values(id=Exercise.id)
+
+    # No Exercise instances are loaded in this session, so skip ORM sync.
+    rows = db.execute(stmt, execution_options={"synchronize_session": False}).mappings().all()
+    if len(rows) != len(set(ids)):
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Exercise not found")
+
+    if toggled:
+        _sync_completed_counts({row["patient_id"] for row in rows}, current_therapist.id, db)
+    db.commit()
+
+    by_id = {row["id"]: dict(row) for row in rows}
+    return ORJSONResponse(content=[by_id[ex_id] for ex_id in dict.fromkeys(ids)])
 
 
 @router.patch("/{exercise_id}", response_model=ExerciseResponse)
-async def patch_exercise(
+def patch_exercise(
     exercise_id: int,
     request: PatchExerciseRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
@@ -133,30 +244,33 @@ async def patch_exercise(
     if request.completed is not None:
         ex.completed = request.completed
         ex.completed_at = datetime.utcnow() if request.completed else None
+        # Sync patient counter before the single commit (avoids double commit)
+        _sync_completed_count(ex.patient_id, current_therapist.id, db)
 
-    # Sync patient counter before the single commit (avoids double commit)
-    _sync_completed_count(ex.patient_id, db)
     db.commit()
-    db.refresh(ex)
 
-    return ExerciseResponse.model_validate(ex)
+    return _exercise_to_response(ex)
 
 
 @router.get("/open-count")
-async def get_open_tasks_count(
+def get_open_tasks_count(
     current_therapist: Therapist = Depends(get_current_therapist),
     db: DBSession = Depends(get_db),
 ):
     """Return the count of incomplete exercises across all patients for this therapist."""
-    count = db.query(Exercise).filter(
-        Exercise.therapist_id == current_therapist.id,
-        Exercise.completed == False,  # noqa: E712
-    ).count()
+    # Flat SELECT COUNT(*) (Query.count() wraps the query in a subquery);
+    # served by ix_exercises_therapist_completed.
+    count = db.scalar(
+        select(func.count(Exercise.id)).where(
+            Exercise.therapist_id == current_therapist.id,
+            Exercise.completed.is_(False),
+        )
+    )
     return {"open_count": count}
 
 
 @router.delete("/{exercise_id}", status_code=204)
-async def delete_exercise(
+def delete_exercise(
     exercise_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: DBSession = Depends(get_db),
@@ -165,6 +279,5 @@ async def delete_exercise(
     ex = _owned_exercise(exercise_id, current_therapist.id, db)
     patient_id = ex.patient_id
     db.delete(ex)
-    db.flush()
-    _sync_completed_count(patient_id, db)
+    _sync_completed_count(patient_id, current_therapist.id, db)
     db.commit()
@@ -1,11 +1,23 @@
 """Message management routes"""
 
+import sys
+from functools import lru_cache
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from app.api.deps import get_db, get_current_therapist
+from app.api.deps import (
+    get_db,
+    get_current_therapist,
+    get_message_service,
+    get_therapist_service,
+)
+from app.core import list_cache
 from app.models.therapist import Therapist
 from app.models.message import Message, MessageStatus
 from app.services.message_service import MessageService
@@ -37,8 +49,106 @@ class MessageResponse(BaseModel):
     sent_at: Optional[datetime] = None
     related_session_id: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# MessageResponse field names, resolved once at import (sys.intern keeps the
+# per-row dict keys pointer-equal to the model's own field keys).
+_MESSAGE_RESPONSE_FIELDS = tuple(sys.intern(f) for f in MessageResponse.model_fields)
+
+# Columns selected by the read-only list endpoints — exactly the
+# MessageResponse fields, so rows serialize straight to JSON (orjson) with no
+# ORM hydration or Pydantic pass.  response_model stays for the OpenAPI schema.
+# Table columns, not mapped attributes: a statement built only from these is
+# plain Core and bypasses the ORM compile/loading layer altogether.
+_messages = Message.__table__
+_MESSAGE_RESPONSE_COLUMNS = tuple(_messages.c[f] for f in _MESSAGE_RESPONSE_FIELDS)
+_MESSAGE_RESPONSE_COLUMN_BY_FIELD = dict(zip(_MESSAGE_RESPONSE_FIELDS, _MESSAGE_RESPONSE_COLUMNS))
+
+
+def _message_list_fields(fields: Optional[str]) -> tuple:
+    """
+    Field names for a `?fields=a,b,c` projection of MessageResponse.
+
+    None selects every field; `id` is always included.  Unknown names → 422.
+    """
+    if not fields:
+        return _MESSAGE_RESPONSE_FIELDS
+    names = tuple(dict.fromkeys(["id", *(f.strip() for f in fields.split(",") if f.strip())]))
+    unknown = [n for n in names if n not in _MESSAGE_RESPONSE_COLUMN_BY_FIELD]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+
+# Optional GET /messages/ filters, by bind parameter name
+_MESSAGE_LIST_FILTERS = {
+    "patient_id": _messages.c.patient_id == bindparam("patient_id"),
+    "status": _messages.c.status == bindparam("status"),
+    "date_from": _messages.c.created_at >= bindparam("date_from"),
+    "date_to": _messages.c.created_at <= bindparam("date_to"),
+    "before": _messages.c.created_at < bindparam("before"),
+}
+
+
+# Unpaged listings are streamed from a server-side cursor this many rows at a
+# time; bodies up to _LIST_STREAM_CACHE_BYTES are still kept for list_cache.
+_LIST_STREAM_YIELD_PER = 500
+_LIST_STREAM_CACHE_BYTES = 1 << 20
+
+
+def message_list_filters(
+    patient_id: Optional[int] = Query(default=None),
+    status: Optional[str] = Query(default=None),
+    date_from: Optional[datetime] = Query(default=None),
+    date_to: Optional[datetime] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=200),
+    before: Optional[datetime] = Query(default=None),
+) -> Dict[str, Any]:
+    """
+    GET /messages/ filter and paging query params, as bind parameter values.
+
+    Only supplied params are kept, in a fixed order, so the keys double as
+    the `present` key of _message_list_stmt.
+    """
+    supplied = (
+        ("patient_id", patient_id),
+        ("status", status),
+        ("date_from", date_from),
+        ("date_to", date_to),
+        ("before", before),
+        ("limit", limit),
+    )
+    return {name: value for name, value in supplied if value is not None}
+
+
+@lru_cache(maxsize=256)
+def _message_list_stmt(field_names: tuple, present: tuple):
+    """
+    GET /messages/ statement for one field projection and set of supplied filters.
+
+    Built once per combination with bind parameters in place of the values,
+    so a request reuses both the construct and its memoized cache key and
+    goes straight to SQLAlchemy's compiled-SQL cache.  `present` lists the
+    supplied filter names ("limit" included); values are passed at execute.
+    """
+    stmt = select(*(_MESSAGE_RESPONSE_COLUMN_BY_FIELD[f] for f in field_names)).where(
+        _messages.c.therapist_id == bindparam("therapist_id"),
+        _messages.c.status != MessageStatus.DRAFT,  # Drafts are never persisted in new flow
+        *(_MESSAGE_LIST_FILTERS[name] for name in present if name != "limit"),
+    )
+    # Newest first, read straight off ix_messages_therapist_created /
+    # ix_messages_therapist_status_created (no sort, no OFFSET scan)
+    stmt = stmt.order_by(_messages.c.created_at.desc())
+    if "limit" in present:
+        stmt = stmt.limit(bindparam("limit"))
+    return stmt
+
+
+# Invariant: only ever pass Message rows loaded from our own DB.  Their columns
+# already match MessageResponse, so model_construct skips re-validating them.
+def _message_to_response(m: Message, _fields=_MESSAGE_RESPONSE_FIELDS) -> MessageResponse:
+    return MessageResponse.model_construct(**{f: getattr(m, f) for f in _fields})
 
 
 class ApproveMessageRequest(BaseModel):
@@ -59,16 +169,14 @@ class EditMessageRequest(BaseModel):
 async def create_draft_message(
     request: CreateMessageRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
+    therapist_service: TherapistService = Depends(get_therapist_service),
 ):
     """
     Create a draft message for a patient using AI
     This message will NOT be sent until therapist approves!
     """
 
-    message_service = MessageService(db)
-    therapist_service = TherapistService(db)
-
     try:
         # Get personalized agent
         agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
@@ -82,28 +190,86 @@ async def create_draft_message(
             context=request.context
         )
 
-        return MessageResponse.model_validate(message)
+        return _message_to_response(message)
 
+    except ValueError as e:
+        # Expected client error (e.g. foreign patient): no traceback logging
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.exception(f"create_draft_message therapist={current_therapist.id} patient={request.patient_id} failed: {e!r}")
         raise HTTPException(status_code=500, detail="שגיאה זמנית בשליחת ההודעה, נסו שוב בעוד מספר דקות")
 
 
+class BatchDraftResult(BaseModel):
+    """One item of POST /create-batch — the draft, or why it failed."""
+    patient_id: int
+    message: Optional[MessageResponse] = None
+    error: Optional[str] = None
+
+
+@router.post("/create-batch", response_model=List[BatchDraftResult])
+async def create_draft_messages_batch(
+    requests: List[CreateMessageRequest],
+    current_therapist: Therapist = Depends(get_current_therapist),
+    message_service: MessageService = Depends(get_message_service),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+):
+    """
+    Create AI drafts for several patients in one call.
+    The LLM calls run concurrently (bounded), so N drafts take about as long
+    as one.  Results are returned in request order; a failed item carries an
+    error instead of failing the whole batch.
+    """
+
+    try:
+        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
+    except Exception as e:
+        logger.exception(f"create_draft_messages_batch therapist={current_therapist.id} failed: {e!r}")
+        raise HTTPException(status_code=500, detail="שגיאה זמנית בשליחת ההודעה, נסו שוב בעוד מספר דקות")
+
+    outcomes = await message_service.create_draft_messages(
+        therapist_id=current_therapist.id,
+        drafts=[
+            {"patient_id": r.patient_id, "message_type": r.message_type, "context": r.context}
+            for r in requests
+        ],
+        agent=agent,
+    )
+
+    results = []
+    for request, outcome in zip(requests, outcomes):
+        if isinstance(outcome, Exception):
+            if not isinstance(outcome, ValueError):
+                logger.opt(exception=outcome).error(
+                    f"create_draft_messages_batch therapist={current_therapist.id} "
+                    f"patient={request.patient_id} failed: {outcome!r}"
+                )
+            results.append(BatchDraftResult(
+                patient_id=request.patient_id,
+                error=str(outcome) if isinstance(outcome, ValueError)
+                else "שגיאה זמנית בשליחת ההודעה, נסו שוב בעוד מספר דקות",
+            ))
+        else:
+            results.append(BatchDraftResult(
+                patient_id=request.patient_id,
+                message=_message_to_response(outcome),
+            ))
+    return results
+
+
 @router.post("/approve")
-async def approve_message(
+def approve_message(
     request: ApproveMessageRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     Approve a message - it can now be sent
     CRITICAL: Only therapist can approve messages!
     """
 
-    message_service = MessageService(db)
-
     try:
-        message = await message_service.approve_message(
+        message = message_service.approve_message(
             message_id=request.message_id,
             therapist_id=current_therapist.id
         )
@@ -114,23 +280,20 @@ async def approve_message(
             "status": message.status
         }
 
-    except Exception as e:
-        logger.exception(f"approve_message msg={request.message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/reject")
-async def reject_message(
+def reject_message(
     request: RejectMessageRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Reject a message - it will not be sent"""
 
-    message_service = MessageService(db)
-
     try:
-        message = await message_service.reject_message(
+        message = message_service.reject_message(
             message_id=request.message_id,
             therapist_id=current_therapist.id,
             reason=request.reason
@@ -142,23 +305,20 @@ async def reject_message(
             "status": message.status
         }
 
-    except Exception as e:
-        logger.exception(f"reject_message msg={request.message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/edit")
-async def edit_message(
+def edit_message(
     request: EditMessageRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Edit a draft message before approving"""
 
-    message_service = MessageService(db)
-
     try:
-        message = await message_service.edit_message(
+        message = message_service.edit_message(
             message_id=request.message_id,
             therapist_id=current_therapist.id,
             new_content=request.new_content
@@ -169,24 +329,21 @@ async def edit_message(
             "message_id": message.id
         }
 
-    except Exception as e:
-        logger.exception(f"edit_message msg={request.message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/send/{message_id}")
 async def send_message(
     message_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     Actually send an approved message to patient
     Can only send approved messages!
     """
 
-    message_service = MessageService(db)
-
     try:
         message = await message_service.send_message(message_id)
 
@@ -196,57 +353,89 @@ async def send_message(
             "sent_at": message.sent_at
         }
 
-    except Exception as e:
-        logger.exception(f"send_message msg={message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/", response_model=List[MessageResponse])
-async def get_all_messages(
+def get_all_messages(
     current_therapist: Therapist = Depends(get_current_therapist),
     db: Session = Depends(get_db),
-    patient_id: Optional[int] = Query(default=None),
-    status: Optional[str] = Query(default=None),
-    date_from: Optional[datetime] = Query(default=None),
-    date_to: Optional[datetime] = Query(default=None),
+    filters: Dict[str, Any] = Depends(message_list_filters),
+    fields: Optional[str] = Query(default=None),
 ):
     """
     Return ALL messages for the current therapist across all patients.
     Optional query filters: patient_id, status, date_from, date_to.
+    Optional `fields` (comma-separated MessageResponse field names) selects
+    only those columns, e.g. `fields=status,created_at,patient_id` for a
+    header-only listing without message bodies.
+    Optional keyset pagination: `limit` caps the page size and `before`
+    (the created_at of the last row already seen) fetches the next page.
+    Without `limit` the full list is streamed as one JSON array.
     Used by the Message Control Center screen.
     """
-    try:
-        q = db.query(Message).filter(
-            Message.therapist_id == current_therapist.id,
-            Message.status != MessageStatus.DRAFT,  # Drafts are never persisted in new flow
-        )
-        if patient_id is not None:
-            q = q.filter(Message.patient_id == patient_id)
-        if status is not None:
-            q = q.filter(Message.status == status)
-        if date_from is not None:
-            q = q.filter(Message.created_at >= date_from)
-        if date_to is not None:
-            q = q.filter(Message.created_at <= date_to)
-        messages = q.order_by(Message.created_at.desc()).all()
-        return [MessageResponse.model_validate(m) for m in messages]
-    except Exception as e:
-        logger.exception(f"get_all_messages therapist={current_therapist.id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Polled by the Messages Center: serve unchanged lists from the short-TTL
+    # cache (dropped on any message write for this therapist).
+    cache_params = (tuple(filters.items()), fields)
+    cached = list_cache.get_cached(list_cache.MESSAGES, current_therapist.id, cache_params)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    stmt = _message_list_stmt(_message_list_fields(fields), tuple(filters))
+    params = {**filters, "therapist_id": current_therapist.id}
+
+    if "limit" in filters:
+        # One bounded page: build the body in one go
+        rows = db.execute(stmt, params).mappings().all()
+        body = orjson.dumps([dict(row) for row in rows])
+        list_cache.set_cached(list_cache.MESSAGES, current_therapist.id, cache_params, body)
+        return Response(content=body, media_type="application/json")
+
+    # Full listing: stream the JSON array partition by partition so memory
+    # stays at one partition and the first bytes go out with the first rows.
+    # Executed here (not in the generator) so a query error is still a 500.
+    result = db.execute(
+        stmt, params, execution_options={"yield_per": _LIST_STREAM_YIELD_PER}
+    ).mappings()
+    therapist_id = current_therapist.id
+
+    def _stream_json_array():
+        chunks = [b"["]
+        size = 1
+        yield b"["
+        first = True
+        for partition in result.partitions():
+            chunk = b",".join(orjson.dumps(dict(row)) for row in partition)
+            if not first:
+                chunk = b"," + chunk
+            first = False
+            if chunks is not None:
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > _LIST_STREAM_CACHE_BYTES:
+                    chunks = None
+            yield chunk
+        yield b"]"
+        if chunks is not None:
+            chunks.append(b"]")
+            list_cache.set_cached(list_cache.MESSAGES, therapist_id, cache_params, b"".join(chunks))
+
+    return StreamingResponse(_stream_json_array(), media_type="application/json")
 
 
 @router.get("/pending", response_model=List[MessageResponse])
-async def get_pending_messages(
+def get_pending_messages(
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Get all messages pending therapist approval"""
 
-    message_service = MessageService(db)
-
     try:
-        messages = await message_service.get_pending_messages(current_therapist.id)
-        return [MessageResponse.model_validate(msg) for msg in messages]
+        rows = message_service.get_pending_messages(
+            current_therapist.id, columns=_MESSAGE_RESPONSE_COLUMNS
+        )
+        return ORJSONResponse(content=[dict(row) for row in rows])
 
     except Exception as e:
         logger.error(f"get_pending_messages failed for therapist {current_therapist.id}: {e!r}")
@@ -254,26 +443,20 @@ async def get_pending_messages(
 
 
 @router.get("/patient/{patient_id}", response_model=List[MessageResponse])
-async def get_patient_messages(
+def get_patient_messages(
     patient_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db)
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Get message history for a specific patient"""
 
-    message_service = MessageService(db)
-
-    try:
-        messages = await message_service.get_patient_message_history(
-            therapist_id=current_therapist.id,
-            patient_id=patient_id
-        )
-
-        return [MessageResponse.model_validate(msg) for msg in messages]
+    rows = message_service.get_patient_message_history(
+        therapist_id=current_therapist.id,
+        patient_id=patient_id,
+        columns=_MESSAGE_RESPONSE_COLUMNS,
+    )
 
-    except Exception as e:
-        logger.exception(f"get_patient_messages patient={patient_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse(content=[dict(row) for row in rows])
 
 
 # ── Messages Center v1 endpoints (Phase C) ──────────────────────────────────
@@ -320,18 +503,23 @@ class EditScheduledRequest(BaseModel):
 async def generate_draft_message(
     request: GenerateDraftRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db),
+    message_service: MessageService = Depends(get_message_service),
+    therapist_service: TherapistService = Depends(get_therapist_service),
 ):
     """
     Generate Twin-aligned message content (task reminder or session reminder).
     Returns generated text only — no DB record created.
     The therapist reviews/edits the text and calls POST /compose to send/schedule.
     """
-    message_service = MessageService(db)
-    therapist_service = TherapistService(db)
 
     try:
-        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
+        # Only task reminders go through the LLM; session reminders are a
+        # fixed template, so skip assembling an agent for them.
+        agent = (
+            await therapist_service.get_agent_for_therapist(current_therapist.id)
+            if request.message_type == "task_reminder"
+            else None
+        )
         result = await message_service.generate_draft_message(
             therapist_id=current_therapist.id,
             patient_id=request.patient_id,
@@ -348,17 +536,74 @@ async def generate_draft_message(
         raise HTTPException(status_code=500, detail="שגיאה זמנית בייצור ההודעה, נסו שוב בעוד מספר דקות")
 
 
+class BatchGeneratedResult(BaseModel):
+    """One item of POST /generate-batch — the generated text, or why it failed."""
+    patient_id: int
+    content: Optional[str] = None
+    message_type: Optional[str] = None
+    error: Optional[str] = None
+
+
+@router.post("/generate-batch", response_model=List[BatchGeneratedResult])
+async def generate_draft_messages_batch(
+    requests: List[GenerateDraftRequest],
+    current_therapist: Therapist = Depends(get_current_therapist),
+    message_service: MessageService = Depends(get_message_service),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+):
+    """
+    Generate message content for several patients in one call (no DB records).
+    The LLM calls run concurrently (bounded); results are returned in request
+    order, and a failed item carries an error instead of failing the batch.
+    """
+
+    try:
+        agent = (
+            await therapist_service.get_agent_for_therapist(current_therapist.id)
+            if any(r.message_type == "task_reminder" for r in requests)
+            else None
+        )
+    except Exception as e:
+        logger.exception(f"generate_draft_messages_batch therapist={current_therapist.id} failed: {e!r}")
+        raise HTTPException(status_code=500, detail="שגיאה זמנית בייצור ההודעה, נסו שוב בעוד מספר דקות")
+
+    outcomes = await message_service.generate_draft_messages(
+        therapist_id=current_therapist.id,
+        drafts=[
+            {"patient_id": r.patient_id, "message_type": r.message_type, "context": r.context}
+            for r in requests
+        ],
+        agent=agent,
+    )
+
+    results = []
+    for request, outcome in zip(requests, outcomes):
+        if isinstance(outcome, Exception):
+            if not isinstance(outcome, ValueError):
+                logger.opt(exception=outcome).error(
+                    f"generate_draft_messages_batch therapist={current_therapist.id} "
+                    f"patient={request.patient_id} failed: {outcome!r}"
+                )
+            results.append(BatchGeneratedResult(
+                patient_id=request.patient_id,
+                error=str(outcome) if isinstance(outcome, ValueError)
+                else "שגיאה זמנית בייצור ההודעה, נסו שוב בעוד מספר דקות",
+            ))
+        else:
+            results.append(BatchGeneratedResult(patient_id=request.patient_id, **outcome))
+    return results
+
+
 @router.post("/compose", response_model=MessageResponse, status_code=201)
 async def compose_message(
     request: ComposeRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     Create + immediately send or schedule a message in one atomic step.
     Replaces the old two-step draft → confirm flow.
     """
-    message_service = MessageService(db)
 
     try:
         message = await message_service.compose_message(
@@ -370,7 +615,7 @@ async def compose_message(
             send_at=request.send_at,
             related_session_id=request.related_session_id,
         )
-        return MessageResponse.model_validate(message)
+        return _message_to_response(message)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -384,13 +629,12 @@ async def send_or_schedule_message(
     message_id: int,
     request: SendOrScheduleRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     Therapist confirms a draft: sends now (send_at=null/past) or schedules
     for a future date/time. The final edited content is saved before sending.
     """
-    message_service = MessageService(db)
 
     logger.info(
         "send_or_schedule: msg=%d raw_send_at=%r (type=%s)",
@@ -405,78 +649,63 @@ async def send_or_schedule_message(
             recipient_phone=request.recipient_phone,
             send_at=request.send_at,
         )
-        return MessageResponse.model_validate(message)
+        return _message_to_response(message)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.exception(f"send_or_schedule_message msg={message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/{message_id}/cancel", response_model=MessageResponse)
-async def cancel_message(
+def cancel_message(
     message_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Cancel a SCHEDULED message. Removes the pending delivery job."""
-    message_service = MessageService(db)
 
     try:
-        message = await message_service.cancel_message(
+        message = message_service.cancel_message(
             message_id=message_id,
             therapist_id=current_therapist.id,
         )
-        return MessageResponse.model_validate(message)
+        return _message_to_response(message)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.exception(f"cancel_message msg={message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.delete("/{message_id}", status_code=200)
-async def delete_draft_message(
+def delete_draft_message(
     message_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Delete a DRAFT message. Only DRAFT messages can be deleted."""
-    message_service = MessageService(db)
     try:
-        await message_service.delete_message(message_id, current_therapist.id)
+        message_service.delete_message(message_id, current_therapist.id)
         return {"message": "Message deleted"}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.exception(f"delete_draft_message msg={message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.patch("/{message_id}", response_model=MessageResponse)
-async def edit_scheduled_message(
+def edit_scheduled_message(
     message_id: int,
     request: EditScheduledRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: Session = Depends(get_db),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """Edit the content, recipient, or send time of a SCHEDULED message."""
-    message_service = MessageService(db)
 
     try:
-        message = await message_service.edit_scheduled_message(
+        message = message_service.edit_scheduled_message(
             message_id=message_id,
             therapist_id=current_therapist.id,
             content=request.content,
             recipient_phone=request.recipient_phone,
             send_at=request.send_at,
         )
-        return MessageResponse.model_validate(message)
+        return _message_to_response(message)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.exception(f"edit_scheduled_message msg={message_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
@@ -1,16 +1,24 @@
 """Patient management routes"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+import sys
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import delete, desc, exists, func, insert, literal, select
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import date, datetime
 from app.api.deps import get_db, get_current_therapist
-from app.models.therapist import Therapist
-from app.models.patient import PatientStatus
+from app.core import list_cache
+from app.core.protocol_context import build_protocol_context_for_patient
+from app.models.deep_summary import DeepSummary, DeepSummaryStatus
+from app.models.session import Session as TherapySession
+from app.models.therapist import Therapist, TherapistProfile
+from app.models.patient import Patient, PatientNote, PatientStatus
 from app.services.patient_service import PatientService
-from app.services.session_service import SessionService
+from app.services.session_service import NO_APPROVED_SUMMARIES_DETAIL, SessionService
 from app.services.therapist_service import TherapistService
 from app.api.routes.sessions import SummaryResponse, PatientSummaryItem
 from loguru import logger
@@ -81,6 +89,23 @@ class ProtocolProgressItem(BaseModel):
     typical_sessions: int
 
 
+# SummaryResponse field names, for the GET /{patient_id}/summaries rows
+_SUMMARY_RESPONSE_FIELDS = tuple(SummaryResponse.model_fields)
+
+# PatientResponse field names, resolved once at import (sys.intern keeps the
+# per-row dict keys pointer-equal to the model's own field keys).
+_PATIENT_RESPONSE_FIELDS = tuple(sys.intern(f) for f in PatientResponse.model_fields)
+
+
+# Invariant: only ever pass Patient rows loaded from our own DB and run through
+# PatientService._with_decrypted_fields (which sets full_name/phone/email/age).
+# Their values already match PatientResponse, so the dict goes straight to
+# orjson (response_model is for the OpenAPI schema).  Request bodies are
+# still validated by FastAPI.
+def _patient_to_response(p, _fields=_PATIENT_RESPONSE_FIELDS) -> dict:
+    return {f: getattr(p, f) for f in _fields}
+
+
 # --- Endpoints ---
 
 
@@ -107,7 +132,7 @@ async def create_patient(
             preferred_contact_time=request.preferred_contact_time,
             allow_ai_contact=request.allow_ai_contact,
         )
-        return PatientResponse.model_validate(patient)
+        return ORJSONResponse(content=_patient_to_response(patient), status_code=201)
 
     except ValueError as e:
         if str(e) == "patient_limit_reached":
@@ -129,14 +154,24 @@ async def list_patients(
 ):
     """List all patients for the current therapist"""
 
+    # Polled with the Messages Center: serve an unchanged list from the
+    # short-TTL cache (dropped on any patient write for this therapist).
+    cached = list_cache.get_cached(list_cache.PATIENTS, current_therapist.id, status)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = PatientService(db)
 
     try:
-        patients = await service.get_therapist_patients(
+        # Rows are already PatientResponse-shaped dicts; serialize them
+        # directly (response_model is kept for the OpenAPI schema only).
+        rows = await service.get_therapist_patients(
             therapist_id=current_therapist.id,
             status=status,
         )
-        return [PatientResponse.model_validate(p) for p in patients]
+        body = orjson.dumps(rows)
+        list_cache.set_cached(list_cache.PATIENTS, current_therapist.id, status, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.exception(f"list_patients failed for therapist {current_therapist.id}: {e!r}")
@@ -153,15 +188,16 @@ async def get_patient(
 
     service = PatientService(db)
 
-    patient = await service.get_patient(
+    # Already PatientResponse-shaped; response_model is for the OpenAPI schema
+    item = await service.get_patient_item(
         patient_id=patient_id,
         therapist_id=current_therapist.id,
     )
 
-    if not patient:
+    if not item:
         raise HTTPException(status_code=404, detail="Patient not found")
 
-    return PatientResponse.model_validate(patient)
+    return ORJSONResponse(content=item)
 
 
 @router.put("/{patient_id}", response_model=PatientResponse)
@@ -178,12 +214,13 @@ async def update_patient(
     update_data = request.model_dump(exclude_unset=True)
 
     try:
-        patient = await service.update_patient(
+        # Already PatientResponse-shaped (straight from UPDATE ... RETURNING)
+        item = await service.update_patient(
             patient_id=patient_id,
             therapist_id=current_therapist.id,
             update_data=update_data,
         )
-        return PatientResponse.model_validate(patient)
+        return ORJSONResponse(content=item)
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -192,7 +229,7 @@ async def update_patient(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.delete("/{patient_id}")
+@router.delete("/{patient_id}", status_code=204)
 async def delete_patient(
     patient_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
@@ -207,7 +244,6 @@ async def delete_patient(
             patient_id=patient_id,
             therapist_id=current_therapist.id,
         )
-        return {"message": "Patient deleted successfully"}
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -229,10 +265,6 @@ async def get_protocol_progress(
     vs. the protocol's typical session count. Returns [] when no protocols
     are assigned to either the patient or the therapist.
     """
-    from app.models.session import Session as TherapySession
-    from app.models.therapist import TherapistProfile
-    from app.core.protocol_context import build_protocol_context_for_patient
-
     service = PatientService(db)
     patient = await service.get_patient(patient_id=patient_id, therapist_id=current_therapist.id)
     if not patient:
@@ -269,48 +301,79 @@ async def get_protocol_progress(
         .scalar()
     ) or 0
 
-    return [
-        ProtocolProgressItem(
-            id=p["id"],
-            name=p["name"],
-            current_stage=min(session_count, p.get("typical_sessions") or 12),
-            typical_sessions=p.get("typical_sessions") or 12,
-        )
-        for p in active_protocols
-    ]
+    # Plain dicts for orjson: no per-item ProtocolProgressItem validation
+    # (response_model is for the OpenAPI schema)
+    items = []
+    for p in active_protocols:
+        typical_sessions = p.get("typical_sessions") or 12
+        items.append({
+            "id": p["id"],
+            "name": p["name"],
+            "current_stage": min(session_count, typical_sessions),
+            "typical_sessions": typical_sessions,
+        })
+    return ORJSONResponse(content=items)
+
+
+_NDJSON = "application/x-ndjson"
 
 
 @router.get("/{patient_id}/summaries", response_model=List[PatientSummaryItem])
-async def get_patient_summaries(
+def get_patient_summaries(
     patient_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: Session = Depends(get_db),
+    accept: Optional[str] = Header(default=None),
 ):
-    """Get all session summaries for a patient"""
+    """
+    Get all session summaries for a patient.
+
+    Streamed as the summaries are read: a JSON array by default, or one
+    JSON object per line with `Accept: application/x-ndjson`.
+    """
 
     service = SessionService(db)
 
     try:
-        results = await service.get_patient_summaries(
+        # Checks ownership now; the rows are read while streaming
+        results = service.iter_patient_summaries(
             patient_id=patient_id,
             therapist_id=current_therapist.id,
         )
-        return [
-            PatientSummaryItem(
-                session_id=r["session_id"],
-                session_date=r["session_date"],
-                session_number=r["session_number"],
-                summary=SummaryResponse.model_validate(r["summary"]),
-            )
-            for r in results
-        ]
-
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.exception(f"get_patient_summaries patient={patient_id} failed: {e!r}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Rows straight from our own DB: copy the SummaryResponse fields off
+    # each summary and let orjson encode them, with no Pydantic pass.
+    def _items():
+        try:
+            for r in results:
+                yield orjson.dumps({
+                    "session_id": r["session_id"],
+                    "session_date": r["session_date"],
+                    "session_number": r["session_number"],
+                    "summary": {f: getattr(r["summary"], f, None) for f in _SUMMARY_RESPONSE_FIELDS},
+                })
+        except Exception as e:
+            # Headers are already sent: log and re-raise so the server aborts
+            # the connection instead of closing a silently truncated body
+            logger.exception(f"get_patient_summaries patient={patient_id} failed mid-stream: {e!r}")
+            raise
+
+    if accept and _NDJSON in accept:
+        return StreamingResponse((item + b"\n" for item in _items()), media_type=_NDJSON)
+
+    def _json_array():
+        yield b"["
+        for i, item in enumerate(_items()):
+            yield item if i == 0 else b"," + item
+        yield b"]"
+
+    return StreamingResponse(_json_array(), media_type="application/json")
+
 
 class NoteCreate(BaseModel):
     content: str
@@ -325,80 +388,100 @@ class NoteResponse(BaseModel):
         from_attributes = True
 
 
+# NoteResponse fields as columns: the note routes read and write rows with
+# Core statements and hand the row mappings straight to orjson.
+_NOTE_RESPONSE_COLUMNS = tuple(PatientNote.__table__.c[f] for f in NoteResponse.model_fields)
+
+
+# The note routes are plain `def`: the session is sync, so FastAPI runs them
+# in its threadpool instead of blocking the event loop on each round-trip.
+
+
+def _check_patient_owned(patient_id: int, therapist_id: int, db: Session) -> None:
+    if not PatientService(db).is_patient_owned(patient_id, therapist_id):
+        raise HTTPException(status_code=404, detail="Patient not found")
+
+
 @router.get("/{patient_id}/notes", response_model=List[NoteResponse])
-async def list_patient_notes(
+def list_patient_notes(
     patient_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: Session = Depends(get_db),
 ):
     """List therapist notebook notes for a patient (newest first)"""
-    from app.models.patient import PatientNote
-    from sqlalchemy import desc
+    # One query: the join carries the ownership check, so rows come back only
+    # for this therapist's own patient
+    rows = db.execute(
+        select(*_NOTE_RESPONSE_COLUMNS)
+        .join(Patient, Patient.id == PatientNote.patient_id)
+        .where(
+            Patient.id == patient_id,
+            Patient.therapist_id == current_therapist.id,
+            PatientNote.therapist_id == current_therapist.id,
+        )
+        .order_by(desc(PatientNote.created_at))
+    ).mappings().all()
 
-    service = PatientService(db)
-    patient = await service.get_patient(patient_id=patient_id, therapist_id=current_therapist.id)
-    if not patient:
-        raise HTTPException(status_code=404, detail="Patient not found")
+    # Only an empty result needs the ownership check, to tell 404 from [].
+    if not rows:
+        _check_patient_owned(patient_id, current_therapist.id, db)
 
-    notes = (
-        db.query(PatientNote)
-        .filter(PatientNote.patient_id == patient_id, PatientNote.therapist_id == current_therapist.id)
-        .order_by(desc(PatientNote.created_at))
-        .all()
-    )
-    return [NoteResponse.model_validate(n) for n in notes]
+    return ORJSONResponse(content=[dict(row) for row in rows])
 
 
 @router.post("/{patient_id}/notes", response_model=NoteResponse, status_code=201)
-async def create_patient_note(
+def create_patient_note(
     patient_id: int,
     request: NoteCreate,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: Session = Depends(get_db),
 ):
     """Create a therapist notebook note for a patient"""
-    from app.models.patient import PatientNote
-
-    service = PatientService(db)
-    patient = await service.get_patient(patient_id=patient_id, therapist_id=current_therapist.id)
-    if not patient:
+    # One round trip: INSERT ... SELECT ... WHERE EXISTS (owned patient)
+    # RETURNING the response columns.  No row back means no such patient.
+    now = datetime.utcnow()
+    owned = exists().where(Patient.id == patient_id, Patient.therapist_id == current_therapist.id)
+    row = db.execute(
+        insert(PatientNote.__table__)
+        .from_select(
+            ["patient_id", "therapist_id", "content", "created_at", "updated_at"],
+            select(
+                literal(patient_id),
+                literal(current_therapist.id),
+                literal(request.content),
+                literal(now),
+                literal(now),
+            ).where(owned),
+        )
+        .returning(*_NOTE_RESPONSE_COLUMNS)
+    ).mappings().first()
+    if row is None:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Patient not found")
-
-    note = PatientNote(
-        patient_id=patient_id,
-        therapist_id=current_therapist.id,
-        content=request.content,
-    )
-    db.add(note)
     db.commit()
-    db.refresh(note)
-    return NoteResponse.model_validate(note)
+    return ORJSONResponse(content=dict(row), status_code=201)
 
 
-@router.delete("/{patient_id}/notes/{note_id}", status_code=200)
-async def delete_patient_note(
+@router.delete("/{patient_id}/notes/{note_id}", status_code=204)
+def delete_patient_note(
     patient_id: int,
     note_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: Session = Depends(get_db),
 ):
     """Delete a therapist notebook note"""
-    from app.models.patient import PatientNote
-
-    note = (
-        db.query(PatientNote)
-        .filter(
+    # One DELETE; ownership is part of the WHERE clause
+    result = db.execute(
+        delete(PatientNote).where(
             PatientNote.id == note_id,
             PatientNote.patient_id == patient_id,
             PatientNote.therapist_id == current_therapist.id,
         )
-        .first()
     )
-    if not note:
+    if result.rowcount == 0:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Note not found")
-    db.delete(note)
     db.commit()
-    return {"message": "Note deleted"}
 
 
 class PatientInsightResponse(BaseModel):
@@ -431,6 +514,66 @@ class TreatmentPlanResponse(BaseModel):
     suggested_interventions: List[str]
 
 
+class AIBundleResponse(BaseModel):
+    insight: PatientInsightResponse
+    deep: DeepSummaryResponse
+    plan: TreatmentPlanResponse
+
+
+# The AI report responses are output-only: the agent results are copied into
+# plain dicts for orjson, and the models above only document the schema.
+_INSIGHT_RESPONSE_FIELDS = tuple(PatientInsightResponse.model_fields)
+_DEEP_SUMMARY_RESPONSE_FIELDS = tuple(DeepSummaryResponse.model_fields)
+_TREATMENT_GOAL_FIELDS = tuple(TreatmentPlanGoal.model_fields)
+
+
+def _insight_to_response(result, _fields=_INSIGHT_RESPONSE_FIELDS) -> dict:
+    return {f: getattr(result, f) for f in _fields}
+
+
+def _deep_summary_to_response(result, _fields=_DEEP_SUMMARY_RESPONSE_FIELDS) -> dict:
+    return {f: getattr(result, f) for f in _fields}
+
+
+def _treatment_plan_to_response(result, _goal_fields=_TREATMENT_GOAL_FIELDS) -> dict:
+    return {
+        "goals": [{f: getattr(g, f) for f in _goal_fields} for g in result.goals],
+        "focus_areas": result.focus_areas,
+        "suggested_interventions": result.suggested_interventions,
+    }
+
+
+def _store_deep_summary(
+    result, patient_id: int, therapist_id: int, session_service: SessionService, db: Session
+) -> None:
+    """Persist a generated deep summary to deep_summaries so history can be retrieved."""
+    summary_json = {
+        "overall_treatment_picture": result.overall_treatment_picture,
+        "timeline_highlights": result.timeline_highlights,
+        "goals_and_tasks": result.goals_and_tasks,
+        "measurable_progress": result.measurable_progress,
+        "directions_for_next_phase": result.directions_for_next_phase,
+    }
+    rendered = "\n\n".join(filter(None, [
+        result.overall_treatment_picture,
+        result.goals_and_tasks,
+        result.measurable_progress,
+        result.directions_for_next_phase,
+    ]))
+    # Retrieve fingerprint computed inside generate_deep_summary (avoids re-querying)
+    _fp_data = getattr(session_service, "_last_deep_summary_fingerprint", (None, None))
+    db.add(DeepSummary(
+        patient_id=patient_id,
+        therapist_id=therapist_id,
+        summary_json=summary_json,
+        rendered_text=rendered or None,
+        status=DeepSummaryStatus.APPROVED.value,
+        input_fingerprint=_fp_data[0],
+        input_fingerprint_version=_fp_data[1],
+    ))
+    db.commit()
+
+
 @router.post("/{patient_id}/insight-summary", response_model=PatientInsightResponse)
 async def generate_patient_insight_summary(
     patient_id: int,
@@ -442,6 +585,10 @@ async def generate_patient_insight_summary(
     session_service = SessionService(db)
     therapist_service = TherapistService(db)
 
+    # Nothing to summarize yet (new patient): answer before building the agent
+    if not await session_service.has_approved_summary(patient_id, current_therapist.id):
+        raise HTTPException(status_code=400, detail=NO_APPROVED_SUMMARIES_DETAIL)
+
     try:
         agent = await therapist_service.get_agent_for_therapist(
             current_therapist.id,
@@ -453,13 +600,7 @@ async def generate_patient_insight_summary(
             agent=agent,
         )
 
-        return PatientInsightResponse(
-            overview=result.overview,
-            progress=result.progress,
-            patterns=result.patterns,
-            risks=result.risks,
-            suggestions_for_next_sessions=result.suggestions_for_next_sessions,
-        )
+        return ORJSONResponse(content=_insight_to_response(result))
 
     except ValueError as e:
         logger.exception(f"generate_patient_insight patient={patient_id} ValueError: {e!r}")
@@ -485,6 +626,10 @@ async def generate_deep_summary(
     session_service = SessionService(db)
     therapist_service = TherapistService(db)
 
+    # Nothing to summarize yet (new patient): answer before building the agent
+    if not await session_service.has_approved_summary(patient_id, current_therapist.id):
+        raise HTTPException(status_code=400, detail=NO_APPROVED_SUMMARIES_DETAIL)
+
     try:
         agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
         result = await session_service.generate_deep_summary(
@@ -493,42 +638,8 @@ async def generate_deep_summary(
             agent=agent,
         )
 
-        # Persist to deep_summaries table so history can be retrieved
-        from app.models.deep_summary import DeepSummary, DeepSummaryStatus
-        summary_json = {
-            "overall_treatment_picture": result.overall_treatment_picture,
-            "timeline_highlights": result.timeline_highlights,
-            "goals_and_tasks": result.goals_and_tasks,
-            "measurable_progress": result.measurable_progress,
-            "directions_for_next_phase": result.directions_for_next_phase,
-        }
-        rendered = "\n\n".join(filter(None, [
-            result.overall_treatment_picture,
-            result.goals_and_tasks,
-            result.measurable_progress,
-            result.directions_for_next_phase,
-        ]))
-        # Retrieve fingerprint computed inside generate_deep_summary (avoids re-querying)
-        _fp_data = getattr(session_service, "_last_deep_summary_fingerprint", (None, None))
-        db_row = DeepSummary(
-            patient_id=patient_id,
-            therapist_id=current_therapist.id,
-            summary_json=summary_json,
-            rendered_text=rendered or None,
-            status=DeepSummaryStatus.APPROVED.value,
-            input_fingerprint=_fp_data[0],
-            input_fingerprint_version=_fp_data[1],
-        )
-        db.add(db_row)
-        db.commit()
-
-        return DeepSummaryResponse(
-            overall_treatment_picture=result.overall_treatment_picture,
-            timeline_highlights=result.timeline_highlights,
-            goals_and_tasks=result.goals_and_tasks,
-            measurable_progress=result.measurable_progress,
-            directions_for_next_phase=result.directions_for_next_phase,
-        )
+        _store_deep_summary(result, patient_id, current_therapist.id, session_service, db)
+        return ORJSONResponse(content=_deep_summary_to_response(result))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -554,6 +665,10 @@ async def preview_treatment_plan(
     session_service = SessionService(db)
     therapist_service = TherapistService(db)
 
+    # Nothing to summarize yet (new patient): answer before building the agent
+    if not await session_service.has_approved_summary(patient_id, current_therapist.id):
+        raise HTTPException(status_code=400, detail=NO_APPROVED_SUMMARIES_DETAIL)
+
     try:
         agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
         result = await session_service.generate_treatment_plan_preview(
@@ -561,14 +676,7 @@ async def preview_treatment_plan(
             therapist_id=current_therapist.id,
             agent=agent,
         )
-        return TreatmentPlanResponse(
-            goals=[
-                TreatmentPlanGoal(id=g.id, title=g.title, description=g.description)
-                for g in result.goals
-            ],
-            focus_areas=result.focus_areas,
-            suggested_interventions=result.suggested_interventions,
-        )
+        return ORJSONResponse(content=_treatment_plan_to_response(result))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -578,3 +686,46 @@ async def preview_treatment_plan(
     except Exception as e:
         logger.exception(f"preview_treatment_plan patient={patient_id} failed: {e!r}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/{patient_id}/ai-bundle", response_model=AIBundleResponse)
+async def generate_ai_bundle(
+    patient_id: int,
+    current_therapist: Therapist = Depends(get_current_therapist),
+    db: Session = Depends(get_db),
+):
+    """
+    Generate the insight report, deep summary and treatment plan preview in one
+    request, for the patient's AI dashboard.  The approved summaries and tasks
+    are loaded once and the three generations run concurrently; each part has
+    the same shape as its own endpoint, and the deep summary is stored the same way.
+    """
+    session_service = SessionService(db)
+    therapist_service = TherapistService(db)
+
+    # Nothing to summarize yet (new patient): answer before building the agent
+    if not await session_service.has_approved_summary(patient_id, current_therapist.id):
+        raise HTTPException(status_code=400, detail=NO_APPROVED_SUMMARIES_DETAIL)
+
+    try:
+        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
+        bundle = await session_service.generate_ai_bundle(
+            patient_id=patient_id,
+            therapist_id=current_therapist.id,
+            agent=agent,
+        )
+        _store_deep_summary(bundle["deep"], patient_id, current_therapist.id, session_service, db)
+        return ORJSONResponse(content={
+            "insight": _insight_to_response(bundle["insight"]),
+            "deep": _deep_summary_to_response(bundle["deep"]),
+            "plan": _treatment_plan_to_response(bundle["plan"]),
+        })
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        logger.exception(f"generate_ai_bundle patient={patient_id} RuntimeError: {e!r}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.exception(f"generate_ai_bundle patient={patient_id} failed: {e!r}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -2,15 +2,28 @@
 
 import asyncio
 import json
+import os
+import sys
+import tempfile
 import time
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
-from fastapi.responses import StreamingResponse
+import uuid
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session as DBSession
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
-from app.api.deps import get_db, get_current_therapist
+from app.api.deps import (
+    get_db,
+    get_current_therapist,
+    get_session_service,
+    get_therapist_agent,
+    get_therapist_service,
+)
 from app.api.errors import AIMeta
+from app.core.error_log import log_failure
+from app.core.agent import TherapyAgent
 from app.models.therapist import Therapist
 from app.models.session import SessionType
 from app.services.session_service import SessionService
@@ -33,6 +46,50 @@ def _require_session(db: "DBSession", session_id: int, therapist_id: int):
     return session
 
 
+# Uploads are copied to disk in chunks of this size, never read whole
+_AUDIO_CHUNK_SIZE = 1 << 20
+
+
+async def _save_audio_upload(audio: UploadFile, default_filename: str) -> str:
+    """
+    Copy an uploaded audio file to a temp file chunk by chunk; return its path.
+
+    Memory stays at one chunk however large the recording.  400 if the file
+    is empty, 413 as soon as it passes MAX_AUDIO_SIZE_MB.  The extension of
+    the original filename is kept (Whisper infers the format from it).
+    The caller deletes the file.
+    """
+    from app.core.config import settings as app_settings
+
+    max_size = app_settings.MAX_AUDIO_SIZE_MB * 1024 * 1024
+    ext = os.path.splitext(audio.filename or default_filename)[1].lower() or ".webm"
+    tmp = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
+    try:
+        total = 0
+        with tmp:
+            while chunk := await audio.read(_AUDIO_CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Audio file too large. Max: {app_settings.MAX_AUDIO_SIZE_MB} MB.",
+                    )
+                tmp.write(chunk)
+        if total == 0:
+            raise HTTPException(status_code=400, detail="Empty audio file")
+    except BaseException:
+        _remove_file(tmp.name)
+        raise
+    return tmp.name
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
 # --- Request / Response models ---
 
 
@@ -165,19 +222,117 @@ class PatientSummaryItem(BaseModel):
         from_attributes = True
 
 
+# SessionResponse column fields, resolved once at import (sys.intern keeps the
+# per-row dict keys pointer-equal to the model's own field keys).
+# summary_status is not a Session column; _session_items fills it in.
+_SESSION_RESPONSE_FIELDS = tuple(
+    sys.intern(f) for f in SessionResponse.model_fields if f != "summary_status"
+)
+
+
+# SummaryResponse column fields; ai_meta is attached by _summary_response_with_meta.
+_SUMMARY_RESPONSE_FIELDS = tuple(
+    sys.intern(f) for f in SummaryResponse.model_fields if f != "ai_meta"
+)
+
+
+# Invariant: only ever pass Session / SessionSummary rows loaded from our own
+# DB.  Their columns already match the response models, so model_construct
+# skips re-validating them.  Request bodies are still validated by FastAPI.
+def _session_to_response(s, _fields=_SESSION_RESPONSE_FIELDS) -> SessionResponse:
+    return SessionResponse.model_construct(**{f: getattr(s, f) for f in _fields})
+
+
+def _summary_to_response(summary, _fields=_SUMMARY_RESPONSE_FIELDS) -> SummaryResponse:
+    return SummaryResponse.model_construct(**{f: getattr(summary, f) for f in _fields})
+
+
+# Plain-dict variants for the GET routes: orjson encodes them directly, with
+# no response model built or serialized in between (response_model is kept
+# for the OpenAPI schema only).
+def _session_item(s, _fields=_SESSION_RESPONSE_FIELDS) -> dict:
+    d = {f: getattr(s, f) for f in _fields}
+    d["summary_status"] = None
+    return d
+
+
+def _summary_item(summary, _fields=_SUMMARY_RESPONSE_FIELDS) -> dict:
+    d = {f: getattr(summary, f) for f in _fields}
+    d["ai_meta"] = None
+    return d
+
+
+def _session_items(sessions, db: DBSession, _fields=_SESSION_RESPONSE_FIELDS) -> List[dict]:
+    """
+    SessionResponse-shaped dicts for `sessions`, summary statuses batch-loaded
+    in one query.  Read straight off our own rows, so they go to orjson as-is
+    (response_model is kept for the OpenAPI schema only).
+    """
+    from app.models.session import SessionSummary as _SessionSummary
+    summary_ids = [s.summary_id for s in sessions if s.summary_id]
+    status_map: dict = {}
+    if summary_ids:
+        rows = db.query(
+            _SessionSummary.id,
+            _SessionSummary.status,
+            _SessionSummary.approved_by_therapist,
+        ).filter(_SessionSummary.id.in_(summary_ids)).all()
+        for row in rows:
+            status_map[row.id] = (
+                "approved" if row.approved_by_therapist else (row.status or "draft")
+            )
+
+    result = []
+    for s in sessions:
+        d = {f: getattr(s, f) for f in _fields}
+        d["summary_status"] = status_map.get(s.summary_id) if s.summary_id else None
+        result.append(d)
+    return result
+
+
+def _row_etag(row_id: int, updated_at: datetime) -> str:
+    """Weak ETag for a row: changes whenever updated_at does."""
+    return f'W/"{row_id}-{int(updated_at.timestamp() * 1_000_000)}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match check, with the weak comparison RFC 9110 asks for."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (t.strip() for t in header.split(","))
+    )
+
+
+# Clients (and the browser cache) must revalidate; never shared (PHI)
+_REVALIDATE = "private, no-cache"
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _REVALIDATE})
+
+
+def _with_etag(content: Any, etag: str) -> ORJSONResponse:
+    return ORJSONResponse(content=content, headers={"ETag": etag, "Cache-Control": _REVALIDATE})
+
+
 # --- CRUD endpoints ---
 
+# The DB-only read and delete routes are plain `def`: the session is sync, so
+# FastAPI runs them in its threadpool instead of blocking the event loop.
+
 
 @router.post("/", response_model=SessionResponse, status_code=201)
 async def create_session(
     request: CreateSessionRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Create a new therapy session"""
 
-    service = SessionService(db)
-
     try:
         session = await service.create_session(
             therapist_id=current_therapist.id,
@@ -191,93 +346,73 @@ async def create_session(
             recurrence_rule=request.recurrence_rule,
             recurrence_ends_at=request.recurrence_ends_at,
         )
-        return SessionResponse.model_validate(session)
+        return _session_to_response(session)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"create_session therapist={current_therapist.id} failed: {e!r}")
+        log_failure("create_session therapist={} failed: {!r}", current_therapist.id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/", response_model=List[SessionResponse])
-async def list_sessions(
+def list_sessions(
     limit: int = Query(default=50, le=200),
     current_therapist: Therapist = Depends(get_current_therapist),
+    service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """List recent sessions for the current therapist"""
 
-    service = SessionService(db)
-
     try:
-        sessions = await service.get_therapist_sessions(
+        sessions = service.get_therapist_sessions(
             therapist_id=current_therapist.id,
             limit=limit,
         )
-
-        # Batch-load summary statuses in one query
-        from app.models.session import SessionSummary as _SessionSummary
-        summary_ids = [s.summary_id for s in sessions if s.summary_id]
-        status_map: dict = {}
-        if summary_ids:
-            rows = db.query(
-                _SessionSummary.id,
-                _SessionSummary.status,
-                _SessionSummary.approved_by_therapist,
-            ).filter(_SessionSummary.id.in_(summary_ids)).all()
-            for row in rows:
-                status_map[row.id] = (
-                    "approved" if row.approved_by_therapist else (row.status or "draft")
-                )
-
-        result = []
-        for s in sessions:
-            d = SessionResponse.model_validate(s).model_dump()
-            d["summary_status"] = status_map.get(s.summary_id) if s.summary_id else None
-            result.append(d)
-        return result
+        return ORJSONResponse(content=_session_items(sessions, db))
 
     except Exception as e:
-        logger.exception(f"list_sessions therapist={current_therapist.id} failed: {e!r}")
+        log_failure("list_sessions therapist={} failed: {!r}", current_therapist.id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/by-date", response_model=List[DailySessionItem])
-async def get_sessions_by_date(
+def get_sessions_by_date(
     target_date: Optional[date] = Query(default=None, alias="date"),
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Get sessions for a specific date (defaults to today)"""
     from datetime import date as date_type
 
     effective_date = target_date or date_type.today()
-    service = SessionService(db)
 
     try:
-        items = await service.get_sessions_by_date(
+        items = service.get_sessions_by_date(
             therapist_id=current_therapist.id,
             target_date=effective_date,
         )
-        return [DailySessionItem(**item) for item in items]
+        # Already DailySessionItem-shaped; response_model is for the OpenAPI schema
+        return ORJSONResponse(content=items)
 
     except Exception as e:
-        logger.exception(f"get_sessions_by_date therapist={current_therapist.id} date={effective_date} failed: {e!r}")
+        log_failure(
+            "get_sessions_by_date therapist={} date={} failed: {!r}",
+            current_therapist.id, effective_date, e,
+        )
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
-async def get_session(
+def get_session(
     session_id: int,
+    request: Request,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
-    """Get a single session by ID"""
-
-    service = SessionService(db)
+    """Get a single session by ID (ETag / If-None-Match: 304 when unchanged)"""
 
-    session = await service.get_session(
+    session = service.get_session(
         session_id=session_id,
         therapist_id=current_therapist.id,
     )
@@ -285,85 +420,68 @@ async def get_session(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return SessionResponse.model_validate(session)
+    etag = _row_etag(session.id, session.updated_at)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    return _with_etag(_session_item(session), etag)
 
 
 @router.get(
     "/patient/{patient_id}",
     response_model=List[SessionResponse],
 )
-async def get_patient_sessions(
+def get_patient_sessions(
     patient_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
+    service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """Get all sessions for a specific patient"""
 
-    service = SessionService(db)
-
     try:
-        sessions = await service.get_patient_sessions(
+        sessions = service.get_patient_sessions(
             patient_id=patient_id,
             therapist_id=current_therapist.id,
         )
-
-        # Batch-load summary statuses in one query
-        from app.models.session import SessionSummary as _SessionSummary
-        summary_ids = [s.summary_id for s in sessions if s.summary_id]
-        status_map: dict = {}
-        if summary_ids:
-            rows = db.query(
-                _SessionSummary.id,
-                _SessionSummary.status,
-                _SessionSummary.approved_by_therapist,
-            ).filter(_SessionSummary.id.in_(summary_ids)).all()
-            for row in rows:
-                status_map[row.id] = (
-                    "approved" if row.approved_by_therapist else (row.status or "draft")
-                )
-
-        result = []
-        for s in sessions:
-            d = SessionResponse.model_validate(s).model_dump()
-            d["summary_status"] = status_map.get(s.summary_id) if s.summary_id else None
-            result.append(d)
-        return result
+        return ORJSONResponse(content=_session_items(sessions, db))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.exception(f"get_patient_sessions patient={patient_id} failed: {e!r}")
+        log_failure("get_patient_sessions patient={} failed: {!r}", patient_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.delete("/{session_id}", status_code=204)
-async def delete_session(
+def delete_session(
     session_id: int,
     notify_patient: bool = Query(default=False, description="Log intent to notify patient of cancellation"),
     current_therapist: Therapist = Depends(get_current_therapist),
+    service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """
     Delete a session and its associated summary.
     notify_patient flag is accepted and logged; no message is sent yet.
     """
-    service = SessionService(db)
 
     try:
         # Log notify intent before deleting (need patient_id from the session)
         if notify_patient:
             from app.models.session import Session as _SessionModel
-            s = db.query(_SessionModel).filter(
-                _SessionModel.id == session_id,
-                _SessionModel.therapist_id == current_therapist.id,
-            ).first()
-            if s:
+            notify_patient_id = db.scalar(
+                select(_SessionModel.patient_id).where(
+                    _SessionModel.id == session_id,
+                    _SessionModel.therapist_id == current_therapist.id,
+                )
+            )
+            if notify_patient_id is not None:
                 logger.info(
                     f"[session_delete] therapist={current_therapist.id} "
-                    f"session={session_id} patient={s.patient_id} "
+                    f"session={session_id} patient={notify_patient_id} "
                     f"notify_patient=True - notification queued (not yet implemented)"
                 )
-        await service.delete_session(session_id, current_therapist.id)
+        service.delete_session(session_id, current_therapist.id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -373,12 +491,17 @@ async def update_session(
     session_id: int,
     request: UpdateSessionRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Update session details"""
 
-    service = SessionService(db)
     update_data = request.model_dump(exclude_unset=True)
+    if not update_data:
+        # Nothing to change (e.g. a client sending {}): no UPDATE, no audit row
+        session = service.get_session(session_id, current_therapist.id)
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+        return _session_to_response(session)
 
     try:
         session = await service.update_session(
@@ -386,12 +509,12 @@ async def update_session(
             therapist_id=current_therapist.id,
             update_data=update_data,
         )
-        return SessionResponse.model_validate(session)
+        return _session_to_response(session)
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.exception(f"update_session session={session_id} failed: {e!r}")
+        log_failure("update_session session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -407,25 +530,19 @@ async def set_session_paid(
     db: DBSession = Depends(get_db),
 ):
     """Mark a session as paid or unpaid"""
-    from app.models.session import Session as _Session
-
-    session = db.query(_Session).filter(
-        _Session.id == session_id,
-        _Session.therapist_id == current_therapist.id,
-    ).first()
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _require_session(db, session_id, current_therapist.id)
     session.is_paid = body.is_paid
     session.paid_at = datetime.utcnow() if body.is_paid else None
     db.commit()
     db.refresh(session)
-    return SessionResponse.model_validate(session)
+    return _session_to_response(session)
 
 
 @router.post("/{session_id}/next-occurrence", response_model=SessionResponse, status_code=201)
 async def create_next_occurrence(
     session_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
+    service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """
@@ -433,16 +550,10 @@ async def create_next_occurrence(
     Computes the next date from recurrence_rule (weekly/biweekly/monthly),
     validates against recurrence_ends_at, then creates a new session record.
     """
-    from app.models.session import Session as _Session
     from datetime import timedelta
     from dateutil.relativedelta import relativedelta
 
-    parent = db.query(_Session).filter(
-        _Session.id == session_id,
-        _Session.therapist_id == current_therapist.id,
-    ).first()
-    if not parent:
-        raise HTTPException(status_code=404, detail="Session not found")
+    parent = _require_session(db, session_id, current_therapist.id)
     if not parent.recurrence_rule:
         raise HTTPException(status_code=400, detail="Session is not recurring")
 
@@ -462,7 +573,6 @@ async def create_next_occurrence(
         raise HTTPException(status_code=409, detail="recurrence_ends_at reached — no more occurrences")
 
     root_id = parent.recurrence_parent_id or parent.id
-    service = SessionService(db)
     next_session = await service.create_session(
         therapist_id=current_therapist.id,
         patient_id=parent.patient_id,
@@ -473,7 +583,7 @@ async def create_next_occurrence(
         recurrence_ends_at=ends_at,
         recurrence_parent_id=root_id,
     )
-    return SessionResponse.model_validate(next_session)
+    return _session_to_response(next_session)
 
 
 # --- Summary endpoints ---
@@ -482,7 +592,7 @@ async def create_next_occurrence(
 def _summary_response_with_meta(summary) -> SummaryResponse:
     """Build SummaryResponse and attach an AIMeta block from the summary's AI fields."""
     import dataclasses
-    resp = SummaryResponse.model_validate(summary)
+    resp = _summary_to_response(summary)
     if summary.ai_model:
         meta = AIMeta(
             model_used=summary.ai_model,
@@ -501,18 +611,12 @@ async def generate_summary_from_text(
     session_id: int,
     request: GenerateSummaryFromTextRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    session_service: SessionService = Depends(get_session_service),
+    agent: TherapyAgent = Depends(get_therapist_agent),
 ):
     """Generate a structured AI session summary from therapist text notes"""
 
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
-
     try:
-        agent = await therapist_service.get_agent_for_therapist(
-            current_therapist.id,
-        )
-
         summary = await session_service.generate_summary_from_text(
             session_id=session_id,
             therapist_notes=request.notes,
@@ -524,16 +628,34 @@ async def generate_summary_from_text(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
-        logger.exception(f"generate_summary_from_text session={session_id} RuntimeError: {e!r}")
+        log_failure("generate_summary_from_text session={} RuntimeError: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.exception(f"generate_summary_from_text session={session_id} failed: {e!r}")
+        log_failure("generate_summary_from_text session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/{session_id}/summary/from-audio", response_model=SummaryResponse)
+class SummaryJobCreatedResponse(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+
+
+class SummaryJobResponse(BaseModel):
+    job_id: str
+    status: str  # pending | done | failed
+    summary: Optional[SummaryResponse] = None
+    error: Optional[str] = None
+
+
+@router.post(
+    "/{session_id}/summary/from-audio",
+    response_model=SummaryJobCreatedResponse,
+    status_code=202,
+)
 async def generate_summary_from_audio(
     session_id: int,
+    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     language: Optional[str] = Form(default=None),
     current_therapist: Therapist = Depends(get_current_therapist),
@@ -543,60 +665,117 @@ async def generate_summary_from_audio(
     PRD Golden Path — Voice Recap:
     Upload audio → ASR transcription → AI structured summary.
 
+    Transcription and summarization take tens of seconds, so they run after
+    the response: this returns 202 with a job id, and the client polls
+    GET /sessions/{id}/summary/job/{job_id} for the result.
+
     Accepts any audio format supported by Whisper (mp3, wav, m4a, ogg, webm).
     Language defaults to settings.DEFAULT_LANGUAGE (Hebrew) if not specified.
     """
-    from app.core.config import settings as app_settings
-
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
-
-    # Read uploaded file
-    audio_bytes = await audio.read()
-    if not audio_bytes:
-        raise HTTPException(status_code=400, detail="Empty audio file")
+    from app.models.summary_job import SessionSummaryJob, SummaryJobStatus
+    from app.services.session_service import run_audio_summary_job
 
-    max_size = app_settings.MAX_AUDIO_SIZE_MB * 1024 * 1024
-    if len(audio_bytes) > max_size:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Audio file too large ({len(audio_bytes)} bytes). Max: {max_size} bytes.",
-        )
+    _require_session(db, session_id, current_therapist.id)
+    audio_path = await _save_audio_upload(audio, "recording.webm")
 
     try:
-        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
-        summary = await session_service.generate_summary_from_audio(
+        job = SessionSummaryJob(
+            job_id=uuid.uuid4().hex,
             session_id=session_id,
-            audio_bytes=audio_bytes,
-            filename=audio.filename or "recording.webm",
-            agent=agent,
             therapist_id=current_therapist.id,
-            language=language,
+            status=SummaryJobStatus.PENDING,
         )
-        return _summary_response_with_meta(summary)
+        db.add(job)
+        db.commit()
+    except BaseException:
+        _remove_file(audio_path)
+        raise
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        logger.exception(f"generate_summary_from_audio session={session_id} RuntimeError: {e!r}")
-        raise HTTPException(status_code=503, detail=str(e))
-    except Exception as e:
-        logger.exception(f"generate_summary_from_audio session={session_id} failed: {e!r}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # The job owns (and deletes) the audio file from here on
+    background_tasks.add_task(run_audio_summary_job, job.job_id, audio_path, language)
+    return SummaryJobCreatedResponse(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=f"/api/v1/sessions/{session_id}/summary/job/{job.job_id}",
+    )
 
 
-@router.get("/{session_id}/summary", response_model=SummaryResponse)
-async def get_session_summary(
+@router.get("/{session_id}/summary/job/{job_id}", response_model=SummaryJobResponse)
+def get_summary_job(
     session_id: int,
+    job_id: str,
     current_therapist: Therapist = Depends(get_current_therapist),
     db: DBSession = Depends(get_db),
 ):
-    """Get the AI-generated summary for a session"""
+    """
+    Status of a from-audio summary job; includes the summary once done.
 
-    service = SessionService(db)
+    A job pending for longer than SUMMARY_JOB_STALE_AFTER was lost to a
+    restart: it is marked failed here, with an error asking to re-upload.
+    """
+    from app.models.session import SessionSummary
+    from app.models.summary_job import (
+        SUMMARY_JOB_STALE_AFTER,
+        SUMMARY_JOB_STALE_ERROR,
+        SessionSummaryJob,
+        SummaryJobStatus,
+    )
+
+    job = db.execute(
+        select(SessionSummaryJob).where(
+            SessionSummaryJob.job_id == job_id,
+            SessionSummaryJob.session_id == session_id,
+            SessionSummaryJob.therapist_id == current_therapist.id,
+        )
+    ).scalar_one_or_none()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Summary job not found")
+
+    if (
+        job.status == SummaryJobStatus.PENDING
+        and datetime.utcnow() - job.created_at > SUMMARY_JOB_STALE_AFTER
+    ):
+        logger.warning(f"[summary_job] {job.job_id} session={session_id} stale — marking failed")
+        job.status = SummaryJobStatus.FAILED
+        job.error_message = SUMMARY_JOB_STALE_ERROR
+        db.commit()
+
+    response = SummaryJobResponse(job_id=job.job_id, status=job.status, error=job.error_message)
+    if job.status == SummaryJobStatus.DONE and job.summary_id is not None:
+        summary = db.get(SessionSummary, job.summary_id)
+        if summary is not None:
+            response.summary = _summary_response_with_meta(summary)
+    return response
+
+
+@router.get("/{session_id}/summary", response_model=SummaryResponse)
+def get_session_summary(
+    session_id: int,
+    request: Request,
+    current_therapist: Therapist = Depends(get_current_therapist),
+    service: SessionService = Depends(get_session_service),
+    db: DBSession = Depends(get_db),
+):
+    """
+    Get the AI-generated summary for a session.
 
+    Sends an ETag; a matching If-None-Match gets 304 after reading only the
+    summary's id and updated_at.
+    """
+    from app.models.session import SessionSummary
+
+    version = service.get_summary_version(session_id, current_therapist.id)
+    if version is not None:
+        etag = _row_etag(*version)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        summary = db.get(SessionSummary, version.id)
+        if summary is not None:
+            return _with_etag(_summary_item(summary), _row_etag(summary.id, summary.updated_at))
+
+    # No summary (or the session isn't ours): the usual lookup picks the 404
     try:
-        summary = await service.get_summary(
+        summary = service.get_summary(
             session_id=session_id,
             therapist_id=current_therapist.id,
         )
@@ -604,14 +783,14 @@ async def get_session_summary(
         if not summary:
             raise HTTPException(status_code=404, detail="No summary found for this session")
 
-        return SummaryResponse.model_validate(summary)
+        return ORJSONResponse(content=_summary_item(summary))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"get_session_summary session={session_id} failed: {e!r}")
+        log_failure("get_session_summary session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -620,12 +799,20 @@ async def patch_session_summary(
     session_id: int,
     request: PatchSummaryRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Edit or approve a session summary (save draft / approve)"""
 
-    service = SessionService(db)
     updates = request.model_dump(exclude_unset=True)
+    if not updates:
+        # Nothing to change: return the summary as-is, no UPDATE or commit
+        try:
+            summary = service.get_summary(session_id, current_therapist.id)
+        except ValueError:
+            summary = None
+        if not summary:
+            raise HTTPException(status_code=404, detail="Session or summary not found")
+        return _summary_to_response(summary)
 
     try:
         summary = await service.update_summary(
@@ -633,12 +820,12 @@ async def patch_session_summary(
             therapist_id=current_therapist.id,
             updates=updates,
         )
-        return SummaryResponse.model_validate(summary)
+        return _summary_to_response(summary)
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.exception(f"patch_session_summary session={session_id} failed: {e!r}")
+        log_failure("patch_session_summary session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -646,13 +833,12 @@ async def patch_session_summary(
 async def delete_session_summary(
     session_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """
     Delete a session's AI-generated summary (keeps the session record).
     After deletion the session can receive a new summary via from-text or from-audio.
     """
-    service = SessionService(db)
     try:
         await service.delete_session_summary(session_id, current_therapist.id)
     except ValueError as e:
@@ -668,6 +854,8 @@ async def regenerate_summary_from_transcript(
     session_id: int,
     request: RegenerateFromTranscriptRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+    session_service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """
@@ -676,8 +864,6 @@ async def regenerate_summary_from_transcript(
     The transcript is stored on the existing summary row and used as the input
     to generate a fresh AI summary. Returns the updated SummaryResponse.
     """
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
 
     _require_session(db, session_id, current_therapist.id)
 
@@ -700,10 +886,10 @@ async def regenerate_summary_from_transcript(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
-        logger.exception(f"regenerate_from_transcript session={session_id} RuntimeError: {e!r}")
+        log_failure("regenerate_from_transcript session={} RuntimeError: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.exception(f"regenerate_from_transcript session={session_id} failed: {e!r}")
+        log_failure("regenerate_from_transcript session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -747,10 +933,9 @@ async def source_save_summary(
     session_id: int,
     request: SourceSaveRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Task source_save — save source text as-is, no AI call. Preserves provenance."""
-    service = SessionService(db)
     if request.source_origin not in ("manual", "transcription"):
         raise HTTPException(status_code=422, detail="source_origin must be 'manual' or 'transcription'")
     try:
@@ -764,7 +949,7 @@ async def source_save_summary(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"source_save_summary session={session_id} failed: {e!r}")
+        log_failure("source_save_summary session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -773,13 +958,11 @@ async def suggest_on_source(
     session_id: int,
     request: SuggestRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    session_service: SessionService = Depends(get_session_service),
+    agent: TherapyAgent = Depends(get_therapist_agent),
 ):
     """Task source_summary_suggest — advisory suggestions only; never rewrites or persists."""
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
     try:
-        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
         result = await session_service.suggest_on_source(
             session_id=session_id,
             source_text=request.source_text,
@@ -796,10 +979,10 @@ async def suggest_on_source(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except (RuntimeError, asyncio.TimeoutError) as e:
-        logger.exception(f"suggest_on_source session={session_id} provider error: {e!r}")
+        log_failure("suggest_on_source session={} provider error: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail="שירות ה-AI אינו זמין כעת. נסה שוב מאוחר יותר.")
     except Exception as e:
-        logger.exception(f"suggest_on_source session={session_id} failed: {e!r}")
+        log_failure("suggest_on_source session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -808,13 +991,11 @@ async def revise_summary(
     session_id: int,
     request: ReviseRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    session_service: SessionService = Depends(get_session_service),
+    agent: TherapyAgent = Depends(get_therapist_agent),
 ):
     """Task ai_summary_revise — single-shot revision of an existing draft. Never auto-approves."""
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
     try:
-        agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
         summary = await session_service.revise_summary(
             session_id=session_id,
             instruction=request.instruction,
@@ -825,10 +1006,10 @@ async def revise_summary(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except (RuntimeError, asyncio.TimeoutError) as e:
-        logger.exception(f"revise_summary session={session_id} provider error: {e!r}")
+        log_failure("revise_summary session={} provider error: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail="שירות ה-AI אינו זמין כעת. נסה שוב מאוחר יותר.")
     except Exception as e:
-        logger.exception(f"revise_summary session={session_id} failed: {e!r}")
+        log_failure("revise_summary session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -836,23 +1017,21 @@ async def revise_summary(
 async def approve_summary(
     request: ApproveSummaryRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Approve an AI-generated session summary"""
 
-    service = SessionService(db)
-
     try:
         summary = await service.approve_summary(
             session_id=request.session_id,
             therapist_id=current_therapist.id,
         )
-        return SummaryResponse.model_validate(summary)
+        return _summary_to_response(summary)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"approve_summary session={request.session_id} failed: {e!r}")
+        log_failure("approve_summary session={} failed: {!r}", request.session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -860,24 +1039,22 @@ async def approve_summary(
 async def edit_summary(
     request: EditSummaryRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Edit an AI-generated session summary"""
 
-    service = SessionService(db)
-
     try:
         summary = await service.edit_summary(
             session_id=request.session_id,
             therapist_id=current_therapist.id,
             edited_content=request.edited_content,
         )
-        return SummaryResponse.model_validate(summary)
+        return _summary_to_response(summary)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"edit_summary session={request.session_id} failed: {e!r}")
+        log_failure("edit_summary session={} failed: {!r}", request.session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -893,18 +1070,12 @@ class SessionPrepBriefResponse(BaseModel):
 async def generate_session_prep_brief(
     session_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    session_service: SessionService = Depends(get_session_service),
+    agent: TherapyAgent = Depends(get_therapist_agent),
 ):
     """Generate a concise AI prep brief for an upcoming session"""
 
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
-
     try:
-        agent = await therapist_service.get_agent_for_therapist(
-            current_therapist.id,
-        )
-
         result = await session_service.generate_prep_brief(
             session_id=session_id,
             therapist_id=current_therapist.id,
@@ -922,10 +1093,10 @@ async def generate_session_prep_brief(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
-        logger.exception(f"generate_prep_brief session={session_id} RuntimeError: {e!r}")
+        log_failure("generate_prep_brief session={} RuntimeError: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.exception(f"generate_prep_brief session={session_id} failed: {e!r}")
+        log_failure("generate_prep_brief session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -973,7 +1144,8 @@ async def generate_prep_v2(
     session_id: int,
     request: PrepRequest,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+    session_service: SessionService = Depends(get_session_service),
 ):
     """
     Generate a structured pre-session prep brief (Phase 4).
@@ -991,9 +1163,6 @@ async def generate_prep_v2(
             detail=f"Invalid mode '{request.mode}'. Must be one of: {valid}",
         )
 
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
-
     try:
         agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
         result = await session_service.generate_prep_v2(
@@ -1007,10 +1176,10 @@ async def generate_prep_v2(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
-        logger.exception(f"generate_prep_v2 session={session_id} RuntimeError: {e!r}")
+        log_failure("generate_prep_v2 session={} RuntimeError: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.exception(f"generate_prep_v2 session={session_id} failed: {e!r}")
+        log_failure("generate_prep_v2 session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1019,6 +1188,8 @@ async def stream_prep_v2(
     session_id: int,
     mode: str = Query(default="deep"),
     current_therapist: Therapist = Depends(get_current_therapist),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+    session_service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """
@@ -1044,9 +1215,6 @@ async def stream_prep_v2(
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid prep mode: {mode_str}")
 
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
-
     session = _require_session(db, session_id, current_therapist.id)
 
     agent = await therapist_service.get_agent_for_therapist(current_therapist.id)
@@ -1243,7 +1411,7 @@ async def stream_prep_v2(
             db.add(session)
             db.commit()
         except Exception as exc:
-            logger.exception(f"stream_prep session={session_id} error: {exc!r}")
+            log_failure("stream_prep session={} error: {!r}", session_id, exc)
             yield f"data: {json.dumps({'error': str(exc)})}\n\n"
 
     return StreamingResponse(
@@ -1265,6 +1433,9 @@ class ClipResponse(BaseModel):
     created_at: datetime
 
 
+_CLIP_RESPONSE_FIELDS = tuple(sys.intern(f) for f in ClipResponse.model_fields)
+
+
 @router.post(
     "/{session_id}/clips",
     response_model=ClipResponse,
@@ -1287,27 +1458,17 @@ async def upload_clip(
     """
     from app.models.audio_clip import AudioClip
     from app.services.audio_service import AudioService
-    from app.core.config import settings as app_settings
 
     session = _require_session(db, session_id, current_therapist.id)
 
-    audio_bytes = await audio.read()
-    if not audio_bytes:
-        raise HTTPException(status_code=400, detail="Empty audio file")
-
-    max_size = app_settings.MAX_AUDIO_SIZE_MB * 1024 * 1024
-    if len(audio_bytes) > max_size:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Audio file too large. Max: {app_settings.MAX_AUDIO_SIZE_MB} MB.",
-        )
-
     # Determine clip index (next in sequence for this session)
     existing_count = db.query(AudioClip).filter(
         AudioClip.session_id == session_id,
     ).count()
     clip_index = existing_count + 1
 
+    audio_path = await _save_audio_upload(audio, f"clip_{clip_index}.webm")
+
     clip = AudioClip(
         session_id=session_id,
         therapist_id=current_therapist.id,
@@ -1321,17 +1482,15 @@ async def upload_clip(
     # Transcribe immediately
     try:
         audio_service = AudioService()
-        transcript = await audio_service.transcribe_upload(
-            file_bytes=audio_bytes,
-            filename=audio.filename or f"clip_{clip_index}.webm",
-            language=language,
-        )
+        transcript = await audio_service.transcribe_audio(audio_path, language=language)
         clip.transcript = transcript
         clip.status = "transcribed"
     except Exception as exc:
         logger.warning(f"upload_clip session={session_id} clip={clip_index} transcription failed: {exc!r}")
         clip.status = "error"
         clip.error_message = str(exc)
+    finally:
+        _remove_file(audio_path)
 
     db.commit()
     db.refresh(clip)
@@ -1353,26 +1512,18 @@ async def upload_clip(
 async def list_clips(
     session_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """List all audio clips for a session, ordered by clip_index."""
-    service = SessionService(db)
     try:
         clips = service.list_clips_for_session(session_id, current_therapist.id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-    return [
-        ClipResponse(
-            id=c.id,
-            clip_index=c.clip_index,
-            duration_seconds=c.duration_seconds,
-            transcript=c.transcript,
-            status=c.status,
-            created_at=c.created_at,
-        )
-        for c in clips
-    ]
+    # One dict per clip straight to orjson, no per-item ClipResponse
+    return ORJSONResponse(
+        content=[{f: getattr(c, f) for f in _CLIP_RESPONSE_FIELDS} for c in clips]
+    )
 
 
 @router.delete("/{session_id}/clips/{clip_id}", status_code=204)
@@ -1380,10 +1531,9 @@ async def delete_clip(
     session_id: int,
     clip_id: int,
     current_therapist: Therapist = Depends(get_current_therapist),
-    db: DBSession = Depends(get_db),
+    service: SessionService = Depends(get_session_service),
 ):
     """Delete a single clip. Reorders remaining clips to fill the gap."""
-    service = SessionService(db)
     try:
         service.delete_clip(clip_id, session_id, current_therapist.id)
     except ValueError as e:
@@ -1404,6 +1554,8 @@ async def finalize_clips(
     session_id: int,
     body: Optional[FinalizeClipsRequest] = None,
     current_therapist: Therapist = Depends(get_current_therapist),
+    therapist_service: TherapistService = Depends(get_therapist_service),
+    session_service: SessionService = Depends(get_session_service),
     db: DBSession = Depends(get_db),
 ):
     """
@@ -1441,8 +1593,6 @@ async def finalize_clips(
             parts.append(f"[קטע {c.clip_index}]\n{c.transcript.strip()}")
         merged_transcript = "\n\n".join(parts)
 
-    session_service = SessionService(db)
-    therapist_service = TherapistService(db)
     _t0 = time.monotonic()
 
     try:
@@ -1469,8 +1619,8 @@ async def finalize_clips(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
-        logger.exception(f"finalize_clips session={session_id} RuntimeError: {e!r}")
+        log_failure("finalize_clips session={} RuntimeError: {!r}", session_id, e)
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.exception(f"finalize_clips session={session_id} failed: {e!r}")
+        log_failure("finalize_clips session={} failed: {!r}", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
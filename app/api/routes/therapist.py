@@ -3,9 +3,10 @@
 import uuid
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session as DBSession
 from sqlalchemy import desc
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from app.api.deps import get_db, get_current_therapist
@@ -674,6 +675,10 @@ class SideNoteResponse(BaseModel):
         from_attributes = True
 
 
+# Validates and serializes a whole note list in one pydantic-core pass
+_SIDE_NOTES_ADAPTER = TypeAdapter(List[SideNoteResponse])
+
+
 @router.get("/notes", response_model=List[SideNoteResponse])
 async def list_side_notes(
     current_therapist: Therapist = Depends(get_current_therapist),
@@ -686,7 +691,12 @@ async def list_side_notes(
         .order_by(desc(TherapistNote.created_at))
         .all()
     )
-    return [SideNoteResponse.model_validate(n) for n in notes]
+    return Response(
+        content=_SIDE_NOTES_ADAPTER.dump_json(
+            _SIDE_NOTES_ADAPTER.validate_python(notes, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post("/notes", response_model=SideNoteResponse, status_code=201)
@@ -8,7 +8,7 @@ import json
 from app.core.config import settings
 from app.models.therapist import TherapistProfile
 from app.ai.models import FlowType, GenerationResult
-from app.ai.provider import AIProvider, AnthropicProvider
+from app.ai.provider import AIProvider, get_anthropic_provider
 from app.ai.router import ModelRouter
 from loguru import logger
 
@@ -157,12 +157,16 @@ class TherapyAgent:
         therapist_profile: Optional[TherapistProfile] = None,
         provider: Optional[AIProvider] = None,
         modality_pack=None,  # Optional[ModalityPack] — typed loosely to avoid circular import
+        system_prompt: Optional[str] = None,
     ):
         """
         Args:
             therapist_profile: personalises prompts.
-            provider:          AI provider; defaults to AnthropicProvider from settings.
+            provider:          AI provider; defaults to the shared AnthropicProvider.
             modality_pack:     Active ModalityPack; triggers three-layer prompt assembly.
+            system_prompt:     Prebuilt system prompt for this profile + pack
+                               (see TherapistService.get_agent_for_therapist);
+                               skips rebuilding it.
         """
         from app.core.config import is_placeholder_key
 
@@ -174,15 +178,18 @@ class TherapyAgent:
         if provider is not None:
             self.provider: Optional[AIProvider] = provider
         elif not is_placeholder_key(settings.ANTHROPIC_API_KEY):
-            self.provider = AnthropicProvider(api_key=settings.ANTHROPIC_API_KEY)
+            self.provider = get_anthropic_provider(settings.ANTHROPIC_API_KEY)
         else:
             logger.warning("ANTHROPIC_API_KEY is missing - AI text generation will not work")
             self.provider = None
 
-        base_prompt = self._build_system_prompt()
-        # Phase 2: apply three-layer assembly (modality → quality rule → base)
-        from app.ai.modality import assemble_system_prompt
-        self.system_prompt = assemble_system_prompt(base_prompt, modality_pack)
+        if system_prompt is not None:
+            self.system_prompt = system_prompt
+        else:
+            base_prompt = self._build_system_prompt()
+            # Phase 2: apply three-layer assembly (modality → quality rule → base)
+            from app.ai.modality import assemble_system_prompt
+            self.system_prompt = assemble_system_prompt(base_prompt, modality_pack)
 
     def _build_system_prompt(self) -> str:
         """
@@ -37,6 +37,18 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # "external": migrations run before the server starts (Dockerfile / Render build).
+    # "sync": alembic upgrade head in startup, before serving.
+    # "background": upgrade in a background thread; /readyz returns 503 until done.
+    MIGRATION_MODE: Literal["external", "sync", "background"] = "external"
+    # Connection pool (PostgreSQL only).  Sync routes run in AnyIO's threadpool
+    # (40 threads by default); pool_size + max_overflow must cover it or
+    # requests queue for a connection.  Unset sizes derive from CPU count.
+    DB_POOL_SIZE: int | None = None        # default: max(20, 2 * CPUs)
+    DB_MAX_OVERFLOW: int | None = None     # default: 2 * pool size
+    DB_POOL_TIMEOUT: int = 5               # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 300             # Render PostgreSQL drops idle connections
+    DB_POOL_WARM: int = 4                  # connections opened at startup (first requests skip the handshake)
     REDIS_URL: str = "redis://localhost:6379/0"
 
     # AI Configuration
@@ -55,6 +67,9 @@ class Settings(BaseSettings):
 
     # Audio Processing
     MAX_AUDIO_SIZE_MB: int = 25
+    # Whisper requests in flight at once (each streams up to MAX_AUDIO_SIZE_MB);
+    # further uploads wait their turn instead of piling onto the worker
+    MAX_CONCURRENT_TRANSCRIPTIONS: int = 4
     SUPPORTED_AUDIO_FORMATS: str = "mp3,wav,m4a,ogg"
 
     # Privacy & Security (CRITICAL)
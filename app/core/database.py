@@ -1,6 +1,8 @@
 """Database configuration and session management"""
 
-from sqlalchemy import create_engine, event
+import os
+
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
@@ -15,8 +17,22 @@ engine_kwargs = {
 if _is_sqlite:
     engine_kwargs["connect_args"] = {"check_same_thread": False}
 else:
+    # Explicit QueuePool sizing: connections are reused across requests
+    # instead of paying a TCP/TLS handshake per get_db().  Sized to cover the
+    # sync-route threadpool (see DB_POOL_* in config); pool_timeout fails fast
+    # instead of stalling a request for the 30 s default.
+    pool_size = settings.DB_POOL_SIZE or max(20, 2 * (os.cpu_count() or 1))
+    engine_kwargs["pool_size"] = pool_size
+    engine_kwargs["max_overflow"] = (
+        settings.DB_MAX_OVERFLOW if settings.DB_MAX_OVERFLOW is not None else 2 * pool_size
+    )
+    engine_kwargs["pool_timeout"] = settings.DB_POOL_TIMEOUT
     engine_kwargs["pool_pre_ping"] = True
-    engine_kwargs["pool_recycle"] = 300   # recycle connections every 5 min (Render PostgreSQL)
+    engine_kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE
+    # LIFO checkout keeps reusing the few most recently returned connections,
+    # so at low traffic the rest sit idle and are left to pool_recycle instead
+    # of every one being cycled through (and pre-pinged) in turn.
+    engine_kwargs["pool_use_lifo"] = True
 
 # Create database engine
 engine = create_engine(settings.DATABASE_URL, **engine_kwargs)
@@ -30,8 +46,38 @@ if _is_sqlite:
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory.
+# expire_on_commit=False: instances keep their flushed values after commit,
+# so returning a just-written row does not cost a reload SELECT.  Call
+# db.refresh() explicitly where DB-side changes must be re-read.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+
+def warm_pool(connections: int) -> None:
+    """
+    Open up to `connections` pooled connections and hand them back, so the
+    first requests after startup reuse them instead of each connecting.
+    No-op for SQLite.
+    """
+    if _is_sqlite:
+        return
+    opened = []
+    try:
+        for _ in range(min(connections, engine.pool.size())):
+            conn = engine.connect()
+            opened.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            conn.close()
+
+
+def ping() -> None:
+    """SELECT 1 through the pool; raises if the database is unreachable."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
 
 
 def get_db():
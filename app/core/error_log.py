@@ -0,0 +1,57 @@
+"""Failure logging for route exception handlers, with sampled tracebacks
+
+Route handlers log every unexpected failure before turning it into a 500.
+A full traceback per failure is what we want for the odd error, but during
+an outage (database down, provider timing out) it means formatting and
+writing thousands of near-identical stacks, which makes the incident worse.
+
+log_failure keeps the first _TRACEBACK_BURST tracebacks per
+_TRACEBACK_WINDOW seconds (a token bucket).  Beyond that each failure is
+still logged, as one line with the exception's repr and no traceback.
+Messages use loguru's lazy "{}" formatting, so arguments are only formatted
+when a sink accepts the record.
+"""
+
+import threading
+import time
+
+from loguru import logger
+
+_TRACEBACK_BURST = 10
+_TRACEBACK_WINDOW = 60.0
+
+
+class _TracebackBudget:
+    """Token bucket: `burst` tokens, refilled evenly over `window` seconds."""
+
+    def __init__(self, burst: int, window: float) -> None:
+        self.burst = burst
+        self.rate = burst / window
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+_budget = _TracebackBudget(_TRACEBACK_BURST, _TRACEBACK_WINDOW)
+
+
+def log_failure(message: str, *args) -> None:
+    """
+    Log the exception being handled at ERROR, with its traceback while the
+    budget allows.  Call from an `except` block, like logger.exception.
+    """
+    if _budget.allow():
+        logger.opt(exception=True, depth=1).error(message, *args)
+    else:
+        logger.opt(depth=1).error(message, *args)
+
@@ -0,0 +1,52 @@
+"""In-process cache of AI generation results, keyed by an input fingerprint
+
+The patient insight report and the treatment plan preview are re-requested
+with the same inputs (approved summaries and tasks change rarely), and each
+call costs seconds of LLM time.  Results are cached here per
+(flow, patient_id, fingerprint of everything the prompt is built from), see
+app.core.fingerprint.
+
+No explicit invalidation: approving or editing a summary changes the inputs
+and so the fingerprint, and the old entry simply ages out.  Entries are
+returned as deep copies, since callers post-process results in place.
+
+Process-local on purpose: the app runs as a single worker (render.yaml).
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+_GENERATION_CACHE_TTL = 3600.0
+_GENERATION_CACHE_MAX = 512
+
+_cache: Dict[Tuple[str, int, str], Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_cached(flow: str, patient_id: int, fingerprint: str) -> Optional[Any]:
+    """Return a copy of the cached result for these inputs, or None."""
+    key = (flow, patient_id, fingerprint)
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _GENERATION_CACHE_TTL:
+            del _cache[key]
+            return None
+        result = entry[1]
+    return copy.deepcopy(result)
+
+
+def set_cached(flow: str, patient_id: int, fingerprint: str, result: Any) -> None:
+    result = copy.deepcopy(result)
+    with _cache_lock:
+        if len(_cache) >= _GENERATION_CACHE_MAX:
+            _cache.pop(next(iter(_cache)))
+        _cache[(flow, patient_id, fingerprint)] = (time.monotonic(), result)
+
+
+def clear() -> None:
+    with _cache_lock:
+        _cache.clear()
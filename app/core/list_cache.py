@@ -0,0 +1,107 @@
+"""Short-TTL in-process cache for polled list responses
+
+GET /messages/ and GET /patients/ are polled by the Messages Center and the
+dashboard and return the same rows between writes.  Their serialized JSON
+bodies are cached here per (namespace, therapist_id, query params).
+
+Invalidation: ORM inserts/updates/deletes of Message / Patient rows mark
+the owning therapist's namespace stale on the session, and the entries are
+dropped once that session commits (dropping at flush time would let a
+concurrent request re-cache the pre-commit rows).  Core UPDATE statements
+bypass mapper events, so their callers use mark_stale() explicitly.  The TTL
+bounds staleness for anything else (e.g. another process writing the DB).
+
+Process-local on purpose: the app runs as a single worker (render.yaml).
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.models.message import Message
+from app.models.patient import Patient
+
+MESSAGES = "messages"
+PATIENTS = "patients"
+
+_LIST_CACHE_TTL = 15.0
+_LIST_CACHE_MAX = 10_000
+_STALE_KEY = "list_cache_stale"
+
+_cache: Dict[Tuple[str, int, Hashable], Tuple[float, bytes]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_cached(namespace: str, therapist_id: int, params: Hashable) -> Optional[bytes]:
+    """Return the cached body for this list query, or None."""
+    key = (namespace, therapist_id, params)
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _LIST_CACHE_TTL:
+            del _cache[key]
+            return None
+        return entry[1]
+
+
+def set_cached(namespace: str, therapist_id: int, params: Hashable, body: bytes) -> None:
+    with _cache_lock:
+        if len(_cache) >= _LIST_CACHE_MAX:
+            _cache.pop(next(iter(_cache)))
+        _cache[(namespace, therapist_id, params)] = (time.monotonic(), body)
+
+
+def invalidate(namespace: Optional[str] = None, therapist_id: Optional[int] = None) -> None:
+    """Drop cached lists for one namespace / therapist, or everything."""
+    with _cache_lock:
+        if namespace is None and therapist_id is None:
+            _cache.clear()
+            return
+        for key in [
+            k for k in _cache
+            if (namespace is None or k[0] == namespace)
+            and (therapist_id is None or k[1] == therapist_id)
+        ]:
+            del _cache[key]
+
+
+def mark_stale(db: Session, namespace: str, therapist_id: int) -> None:
+    """Drop `namespace` lists for `therapist_id` once `db` commits."""
+    db.info.setdefault(_STALE_KEY, set()).add((namespace, therapist_id))
+
+
+def _mark_target_stale(namespace: str, target: Any) -> None:
+    session = object_session(target)
+    if session is not None:
+        mark_stale(session, namespace, target.therapist_id)
+    else:
+        invalidate(namespace, target.therapist_id)
+
+
+@event.listens_for(Message, "after_insert")
+@event.listens_for(Message, "after_update")
+@event.listens_for(Message, "after_delete")
+def _message_written(mapper, connection, target) -> None:
+    _mark_target_stale(MESSAGES, target)
+
+
+@event.listens_for(Patient, "after_insert")
+@event.listens_for(Patient, "after_update")
+@event.listens_for(Patient, "after_delete")
+def _patient_written(mapper, connection, target) -> None:
+    _mark_target_stale(PATIENTS, target)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_stale_on_commit(session) -> None:
+    for namespace, therapist_id in session.info.pop(_STALE_KEY, ()):
+        invalidate(namespace, therapist_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_on_rollback(session) -> None:
+    session.info.pop(_STALE_KEY, None)
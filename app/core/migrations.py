@@ -0,0 +1,26 @@
+"""In-process Alembic runner used when MIGRATION_MODE is "sync" or "background"."""
+
+import os
+
+from loguru import logger
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_migrations() -> None:
+    """
+    Blocking `alembic upgrade head`.
+
+    Call via asyncio.to_thread from async code.  configure_logger=False stops
+    env.py from re-running fileConfig, which would disable uvicorn's loggers.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(_PROJECT_ROOT, "alembic.ini"))
+    # alembic.ini's script_location is relative to the CWD; pin it.
+    config.set_main_option("script_location", os.path.join(_PROJECT_ROOT, "alembic"))
+    config.attributes["configure_logger"] = False
+    logger.info("Running database migrations (alembic upgrade head)")
+    command.upgrade(config, "head")
+    logger.info("Database migrations complete")
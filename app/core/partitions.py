@@ -0,0 +1,31 @@
+"""Monthly RANGE partition naming and bounds (PostgreSQL).
+
+Shared by the migrations (alembic/migration_helpers.create_month_partitions)
+and the daily job that keeps partitions ahead
+(app.services.audit_service.ensure_audit_log_partitions), so both agree on
+names and ranges.  Pure date math: no database access here.
+"""
+
+from datetime import date
+from typing import List, Optional, Tuple
+
+
+def _month_start(year: int, month: int) -> date:
+    year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return date(year, month, 1)
+
+
+def month_partitions(
+    table: str, months_ahead: int = 2, today: Optional[date] = None
+) -> List[Tuple[str, date, date]]:
+    """
+    (name, start, end) for `<table>_yYYYYmMM` covering this month and the
+    next `months_ahead`.  `end` is exclusive (the next month's first day).
+    """
+    today = today or date.today()
+    partitions = []
+    for offset in range(months_ahead + 1):
+        start = _month_start(today.year, today.month + offset)
+        end = _month_start(today.year, today.month + offset + 1)
+        partitions.append((f"{table}_y{start:%Y}m{start:%m}", start, end))
+    return partitions
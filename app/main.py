@@ -4,26 +4,40 @@ TherapyCompanion.AI - Virtual Therapist Assistant
 """
 
 
+import asyncio
+import re
+import sys
 import traceback
 from datetime import datetime
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.core.config import settings
+from app.core.database import ping as ping_db, warm_pool
 from app.api.routes import auth, agent, messages, patients, sessions, therapist, debug, exercises, admin
 from app.api.routes import formal_records, treatment_plans, deep_summaries, ui_affordances, eval as eval_routes
 from app.api.routes import admin_panel, whatsapp as whatsapp_routes
+from app.core.migrations import run_migrations
 from app.core.scheduler import scheduler
 from app.services.message_service import deliver_due_scheduled_messages
 from loguru import logger
 
 
-# Configure logger
+# Configure logger.  enqueue=True: records go through a queue and are written
+# (and rotated) by loguru's worker thread, so file I/O never runs on the event
+# loop.  Same for stderr: loguru's default handler writes synchronously, so it
+# is replaced with a queued one (tracebacks included).
+try:
+    logger.remove(0)
+except ValueError:
+    pass  # default handler already removed
+logger.add(sys.stderr, enqueue=True)
 logger.add(
     settings.LOG_FILE,
     rotation="500 MB",
     retention="30 days",
-    level=settings.LOG_LEVEL
+    level=settings.LOG_LEVEL,
+    enqueue=True,
 )
 
 
@@ -33,10 +47,39 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="AI-powered virtual therapist assistant",
     docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None
+    redoc_url="/redoc" if settings.DEBUG else None,
+    # orjson for every route's response body instead of stdlib json.dumps
+    default_response_class=ORJSONResponse,
 )
 
 
+# ── Audio upload size guard ───────────────────────────────────────────────────
+# FastAPI parses the whole multipart body before the route (or any dependency)
+# runs, so an oversize recording would be received and spooled in full before
+# the route's own 413.  Reject on Content-Length up front instead.  Registered
+# before CORS so the 413 still carries CORS headers.  Chunked uploads (no
+# Content-Length) are still capped while copying, in _save_audio_upload.
+_AUDIO_UPLOAD_PATH = re.compile(r"^/api/v1/sessions/\d+/(summary/from-audio|clips)$")
+# Room for the multipart boundaries and the small form fields around the file
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
+@app.middleware("http")
+async def audio_upload_size_guard(request: Request, call_next):
+    if request.method == "POST" and _AUDIO_UPLOAD_PATH.match(request.url.path):
+        max_bytes = settings.MAX_AUDIO_SIZE_MB * 1024 * 1024 + _MULTIPART_OVERHEAD
+        try:
+            content_length = int(request.headers.get("content-length") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_bytes:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"Audio file too large. Max: {settings.MAX_AUDIO_SIZE_MB} MB."},
+            )
+    return await call_next(request)
+
+
 # CORS middleware
 # Origins come from CORS_ORIGINS env var (comma-separated list of exact origins).
 # For multiple domains set: CORS_ORIGINS="https://a.vercel.app,https://app.metapel.online"
@@ -142,11 +185,53 @@ def _check_inactive_therapists():
         logger.warning(f"_check_inactive_therapists failed (non-blocking): {exc!r}")
 
 
+def _ensure_audit_log_partitions():
+    """Daily job: keep monthly audit_logs partitions created ahead of time."""
+    try:
+        from app.core.database import SessionLocal
+        from app.services.audit_service import ensure_audit_log_partitions
+        db = SessionLocal()
+        try:
+            created = ensure_audit_log_partitions(db)
+            if created:
+                logger.info(f"[audit_partitions] created {', '.join(created)}")
+        finally:
+            db.close()
+    except Exception as exc:
+        logger.warning(f"_ensure_audit_log_partitions failed (non-blocking): {exc!r}")
+
+
+async def _run_migrations_in_background() -> None:
+    """MIGRATION_MODE=background: upgrade off the event loop, report via /readyz."""
+    try:
+        await asyncio.to_thread(run_migrations)
+        app.state.migration_status = "complete"
+    except Exception as exc:
+        app.state.migration_status = "failed"
+        logger.error(f"Background migrations failed: {exc!r}")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Startup event handler"""
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
 
+    # Schema migrations — "external" (default) means they already ran
+    # before the server started (Dockerfile CMD / Render buildCommand).
+    app.state.migration_status = "skipped"
+    if settings.MIGRATION_MODE == "sync":
+        await asyncio.to_thread(run_migrations)
+        app.state.migration_status = "complete"
+    elif settings.MIGRATION_MODE == "background":
+        app.state.migration_status = "running"
+        app.state.migration_task = asyncio.create_task(_run_migrations_in_background())
+
+    # Connect part of the pool now rather than on the first requests
+    try:
+        await asyncio.to_thread(warm_pool, settings.DB_POOL_WARM)
+    except Exception as exc:
+        logger.warning(f"DB pool warm-up failed: {exc!r}")
+
     # Auto-resolve latest Anthropic model IDs — falls back to config if API unreachable
     from app.ai.model_registry import resolve_models
     await resolve_models(settings.ANTHROPIC_API_KEY)
@@ -168,6 +253,15 @@ async def startup_event():
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        _ensure_audit_log_partitions,
+        trigger="interval",
+        hours=24,
+        id="ensure_audit_log_partitions",
+        replace_existing=True,
+        next_run_time=datetime.utcnow(),
+    )
+
     scheduler.start()
     logger.info("APScheduler started — polling for scheduled messages every 30s")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
@@ -216,3 +310,35 @@ async def health_check():
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
     }
+
+
+@app.get("/healthz/migrations")
+async def migration_status():
+    """Schema migration state: skipped | running | complete | failed."""
+    return {
+        "mode": settings.MIGRATION_MODE,
+        "status": getattr(app.state, "migration_status", "skipped"),
+    }
+
+
+@app.get("/healthz/db")
+def db_health_check():
+    """Database probe — SELECT 1 through the connection pool; 503 if unreachable."""
+    try:
+        ping_db()
+    except Exception as exc:
+        logger.warning(f"DB health check failed: {exc!r}")
+        return JSONResponse(status_code=503, content={"status": "unavailable"})
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readiness_check():
+    """Readiness probe — 503 while background migrations are running or failed."""
+    migration = getattr(app.state, "migration_status", "skipped")
+    if migration in ("running", "failed"):
+        return JSONResponse(
+            status_code=503,
+            content={"status": "not_ready", "migrations": migration},
+        )
+    return {"status": "ready", "migrations": migration}
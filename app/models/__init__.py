@@ -11,6 +11,7 @@ from app.models.signature import TherapistSignatureProfile
 from app.models.ai_log import AIGenerationLog
 from app.models.reference_vault import TherapistReferenceVault
 from app.models.audio_clip import AudioClip
+from app.models.summary_job import SessionSummaryJob
 
 __all__ = [
     "Therapist",
@@ -30,4 +31,5 @@ __all__ = [
     "AIGenerationLog",
     "TherapistReferenceVault",
     "AudioClip",
+    "SessionSummaryJob",
 ]
@@ -1,6 +1,6 @@
 """Audit log model - tracks all system actions for security and compliance"""
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, JSON, DateTime
+from sqlalchemy import BigInteger, Column, String, Text, Boolean, Integer, JSON, DateTime
 from app.models.base import BaseModel
 from datetime import datetime
 
@@ -13,6 +13,10 @@ class AuditLog(BaseModel):
 
     __tablename__ = "audit_logs"
 
+    # 64-bit id: high-volume append-only table (INTEGER on SQLite so the
+    # primary key still aliases the rowid and autoincrements)
+    id = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, index=True)
+
     # Who
     user_id = Column(Integer)  # Therapist ID
     user_type = Column(String(50))  # "therapist", "patient", "system", "admin"
@@ -1,6 +1,6 @@
 """Message models - messages between therapist AI and patients"""
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy import BigInteger, Column, String, Text, Boolean, Integer, ForeignKey, DateTime, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 import enum
@@ -35,6 +35,10 @@ class Message(BaseModel):
 
     __tablename__ = "messages"
 
+    # 64-bit id: high-volume append-only table (INTEGER on SQLite so the
+    # primary key still aliases the rowid and autoincrements)
+    id = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, index=True)
+
     therapist_id = Column(Integer, ForeignKey("therapists.id"), nullable=False)
     patient_id = Column(Integer, ForeignKey("patients.id"), nullable=False)
 
@@ -45,8 +45,10 @@ class Patient(BaseModel):
 
     # Follow-up Tracking
     pending_followups = Column(JSON)  # List of pending follow-ups
-    completed_exercises_count = Column(Integer, default=0)
-    missed_exercises_count = Column(Integer, default=0)
+    # Denormalized counters read by GET /patients/; completed_exercises_count
+    # is kept in sync by the exercise routes in the same transaction.
+    completed_exercises_count = Column(Integer, default=0, server_default="0", nullable=False)
+    missed_exercises_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     # AI Interaction Settings
     allow_ai_contact = Column(Boolean, default=True)  # Patient consent for AI messages
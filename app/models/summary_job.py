@@ -0,0 +1,46 @@
+"""SessionSummaryJob model — background audio → summary generations.
+
+POST /sessions/{id}/summary/from-audio stores the upload, creates a job row
+and returns 202; transcription and summarization run after the response.
+Clients poll GET /sessions/{id}/summary/job/{job_id} until the job is done.
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from app.models.base import BaseModel
+
+# Jobs run in-process, so a restart (every deploy) orphans any job in flight
+# along with its temp audio file.  A job still pending after this long is
+# reported as failed so the client stops polling and re-uploads.
+SUMMARY_JOB_STALE_AFTER = timedelta(minutes=10)
+SUMMARY_JOB_STALE_ERROR = (
+    "Processing of this recording was interrupted. Please upload the recording again."
+)
+
+
+class SummaryJobStatus:
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class SessionSummaryJob(BaseModel):
+    """One from-audio summary generation for a session."""
+
+    __tablename__ = "session_summary_jobs"
+
+    # Public, unguessable id returned to the client (uuid4 hex)
+    job_id = Column(String(32), nullable=False, unique=True, index=True)
+
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False)
+    therapist_id = Column(Integer, ForeignKey("therapists.id", ondelete="CASCADE"), nullable=False)
+
+    # pending | done | failed
+    status = Column(String(20), nullable=False, default=SummaryJobStatus.PENDING)
+
+    # Set when status == done
+    summary_id = Column(Integer, ForeignKey("session_summaries.id", ondelete="SET NULL"), nullable=True)
+
+    # Set when status == failed
+    error_message = Column(Text, nullable=True)
@@ -1,8 +1,10 @@
 """Authentication and authorization module"""
 
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
+import jwt as pyjwt
 from passlib.context import CryptContext
 from app.core.config import settings
 from loguru import logger
@@ -11,6 +13,19 @@ from loguru import logger
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Token encoding and verification are configured once per process.
+# verify_sub is off because PyJWT 2.10+ rejects non-string "sub" claims;
+# tokens we issue carry str(therapist.id) but the int form is still
+# accepted downstream.
+_jwt_decoder = pyjwt.PyJWT(options={
+    "verify_aud": False,
+    "verify_sub": False,
+    "require": ["exp", "sub"],
+})
+_jwt_encoder = pyjwt.PyJWT()
+_JWT_KEY = settings.SECRET_KEY
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
 
 def get_password_hash(password: str) -> str:
     """Hash a password for storing"""
@@ -35,26 +50,28 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    # Integer epoch seconds — what the "exp" claim holds on the wire anyway
+    to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
 
-    to_encode.update({"exp": expire})
+    return _jwt_encoder.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
-    )
 
-    return encoded_jwt
+@lru_cache(maxsize=4096)
+def _verify_token(token: str) -> dict:
+    """Signature + claims check; invalid tokens raise and are not cached."""
+    return _jwt_decoder.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT token
 
+    A token's signature is verified once and the payload reused for later
+    requests with the same token; expiry is re-checked on every call.
+
     Args:
         token: JWT token to decode
 
@@ -62,16 +79,16 @@ def decode_access_token(token: str) -> Optional[dict]:
         Decoded token data or None if invalid
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        return payload
-    except JWTError as e:
+        payload = _verify_token(token)
+    except pyjwt.PyJWTError as e:
         logger.error(f"JWT decode error: {str(e)}")
         return None
 
+    if payload["exp"] <= time.time():
+        logger.error("JWT decode error: Signature has expired.")
+        return None
+    return dict(payload)
+
 
 def verify_therapist_access(therapist_id: int, resource_therapist_id: int) -> bool:
     """
@@ -4,13 +4,31 @@ Service boundary: accepts raw audio bytes or file path, returns transcript text.
 Language is explicit (never hardcoded) to support Hebrew, English, and future locales.
 """
 
+import asyncio
 import os
 import tempfile
+from functools import lru_cache
 from typing import Optional
 from app.core.config import settings
 from loguru import logger
 
 
+# Caps concurrent Whisper calls for the whole process (see
+# MAX_CONCURRENT_TRANSCRIPTIONS); shared by every AudioService instance.
+_transcription_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_TRANSCRIPTIONS)
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(api_key: str):
+    """
+    Process-wide AsyncOpenAI client for `api_key`, so transcriptions share one
+    HTTP connection pool (like get_anthropic_provider for text generation).
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key)
+
+
 class AudioService:
     """Service for processing audio recordings via ASR (Whisper)."""
 
@@ -99,7 +117,6 @@ class AudioService:
         self, audio_file_path: str, language: str
     ) -> str:
         """Transcribe using OpenAI Whisper API (v1+ SDK)."""
-        from openai import AsyncOpenAI
         from app.core.config import is_placeholder_key
 
         if is_placeholder_key(settings.OPENAI_API_KEY):
@@ -108,14 +125,15 @@ class AudioService:
                 "Set a valid OPENAI_API_KEY in .env to use audio transcription."
             )
 
-        client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        client = _get_openai_client(settings.OPENAI_API_KEY)
 
-        with open(audio_file_path, "rb") as audio_file:
-            transcript = await client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=language,
-            )
+        async with _transcription_slots:
+            with open(audio_file_path, "rb") as audio_file:
+                transcript = await client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=audio_file,
+                    language=language,
+                )
 
         return transcript.text
 
@@ -1,8 +1,10 @@
 """Audit service - comprehensive logging for compliance and security"""
 
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from datetime import datetime
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+from app.core.partitions import month_partitions
 from app.models.audit import AuditLog
 from loguru import logger
 
@@ -16,7 +18,7 @@ class AuditService:
     def __init__(self, db: Session):
         self.db = db
 
-    async def log_action(
+    def record(
         self,
         action: str,
         resource_type: str,
@@ -35,7 +37,8 @@ class AuditService:
         data_category: Optional[str] = None
     ) -> AuditLog:
         """
-        Log an action to the audit trail
+        Log an action to the audit trail (synchronous; for `def` routes and
+        services running in the threadpool)
 
         Args:
             action: Action performed (create, read, update, delete, approve, etc.)
@@ -87,6 +90,26 @@ class AuditService:
 
         return audit_entry
 
+    def record_many(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Log several actions with one commit (record() kwargs per entry)
+
+        Commits whatever else is pending on the session along with them.
+        """
+        now = datetime.utcnow()
+        self.db.add_all([AuditLog(timestamp=now, **entry) for entry in entries])
+        self.db.commit()
+
+        for entry in entries:
+            logger.info(
+                f"AUDIT: {entry.get('user_type', 'system')}:{entry.get('user_id')} performed "
+                f"{entry['action']} on {entry['resource_type']}:{entry.get('resource_id')}"
+            )
+
+    async def log_action(self, action: str, resource_type: str, **kwargs: Any) -> AuditLog:
+        """Log an action to the audit trail — see record() for the arguments"""
+        return self.record(action, resource_type, **kwargs)
+
     def get_user_audit_trail(
         self,
         user_id: int,
@@ -130,3 +153,55 @@ class AuditService:
             query = query.filter(AuditLog.resource_id == resource_id)
 
         return query.order_by(AuditLog.timestamp.desc()).limit(limit).all()
+
+
+def ensure_audit_log_partitions(db: Session, months_ahead: int = 2) -> List[str]:
+    """
+    Create any missing monthly audit_logs partitions up to `months_ahead`.
+
+    No-op unless audit_logs is a partitioned table (PostgreSQL installs built
+    from 001 / the squashed baseline; see alembic/migration_helpers.py).
+    Same names and ranges as create_month_partitions there
+    (app.core.partitions), including RLS on each partition.
+
+    A month that already has rows in audit_logs_default is skipped with a
+    warning: PostgreSQL refuses CREATE ... PARTITION OF while the DEFAULT
+    partition holds rows in the new range.  Those rows stay readable, and new
+    rows keep landing in the DEFAULT partition until they are moved by hand.
+
+    Returns the names of partitions created.
+    """
+    if db.bind.dialect.name != "postgresql":
+        return []
+    is_partitioned = db.execute(text(
+        "SELECT 1 FROM pg_class WHERE relname = 'audit_logs' AND relkind = 'p'"
+    )).scalar()
+    if not is_partitioned:
+        return []
+    has_default = db.execute(text("SELECT to_regclass('audit_logs_default')")).scalar()
+
+    created = []
+    for name, start, end in month_partitions("audit_logs", months_ahead):
+        exists = db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+        if exists:
+            continue
+        if has_default and db.execute(
+            text(
+                "SELECT 1 FROM audit_logs_default "
+                "WHERE created_at >= :start AND created_at < :end LIMIT 1"
+            ),
+            {"start": start, "end": end},
+        ).scalar():
+            logger.warning(
+                f"[audit_partitions] skipping {name}: audit_logs_default already "
+                f"has rows in [{start}, {end}); move them out to create it"
+            )
+            continue
+        db.execute(text(
+            f"CREATE TABLE {name} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        ))
+        db.execute(text(f"ALTER TABLE {name} ENABLE ROW LEVEL SECURITY"))
+        created.append(name)
+    db.commit()
+    return created
@@ -1,8 +1,11 @@
 """Message service - handles patient messages and approval workflow"""
 
-from typing import Optional, List
+import asyncio
+from typing import Any, Dict, Optional, List, Sequence, Union
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, joinedload, selectinload
 from app.models.message import Message, MessageStatus, MessageDirection
 from app.models.patient import Patient
 from app.models.therapist import Therapist
@@ -11,6 +14,9 @@ from app.services.audit_service import AuditService
 from app.core.config import settings
 from loguru import logger
 
+# Max concurrent LLM calls per create_draft_messages batch
+DRAFT_BATCH_CONCURRENCY = 8
+
 _QUOTA_REJECTION_REASON = "greenapi_quota_exceeded_correspondents"
 _QUOTA_KEYWORDS = ("CORRESPONDENTS_QUOTA_EXCEEDED", "correspondentsStatus", "Monthly quota has been exceeded")
 
@@ -114,6 +120,90 @@ class MessageService:
         logger.info(f"Created draft message {message.id} for patient {patient_id}")
         return message
 
+    async def create_draft_messages(
+        self,
+        therapist_id: int,
+        drafts: List[Dict[str, Any]],
+        agent: TherapyAgent,
+        max_concurrency: int = DRAFT_BATCH_CONCURRENCY,
+    ) -> List[Union[Message, Exception]]:
+        """
+        Create several drafts at once, generating their content concurrently.
+
+        `drafts` holds create_draft_message kwargs (patient_id, message_type,
+        context).  Patients are loaded in one query; at most
+        `max_concurrency` LLM calls are in flight, to stay inside provider
+        rate limits.  The successful drafts are then written with a single
+        INSERT ... RETURNING and their audit entries in the same commit.
+        Results come back in input order; a failed item is returned as its
+        exception instead of failing the batch.
+
+        The agent is shared: create_draft_message does not read
+        agent._last_result.
+        """
+        patients = {
+            p.id: p
+            for p in self.db.query(Patient).filter(
+                Patient.id.in_({draft["patient_id"] for draft in drafts}),
+                Patient.therapist_id == therapist_id,
+            )
+        }
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(draft: Dict[str, Any]) -> Dict[str, Any]:
+            patient = patients.get(draft["patient_id"])
+            if patient is None:
+                raise ValueError("Patient not found or does not belong to this therapist")
+            message_type, context = draft["message_type"], draft.get("context")
+            async with semaphore:
+                prompt = await self._build_message_prompt(
+                    patient=patient, message_type=message_type, context=context
+                )
+                content = await agent.generate_response(prompt, context=context)
+            return dict(
+                therapist_id=therapist_id,
+                patient_id=patient.id,
+                direction=MessageDirection.TO_PATIENT,
+                content=content,
+                status=MessageStatus.DRAFT,
+                requires_approval=settings.REQUIRE_THERAPIST_APPROVAL,
+                message_type=message_type,
+                generated_by_ai=True,
+                ai_model=settings.AI_FAST_MODEL,
+                ai_prompt_used=prompt,
+            )
+
+        outcomes = await asyncio.gather(
+            *(generate_one(draft) for draft in drafts), return_exceptions=True
+        )
+
+        rows = [o for o in outcomes if not isinstance(o, Exception)]
+        if not rows:
+            return outcomes
+
+        # ORM bulk INSERT ... RETURNING: one round trip, Message objects back
+        # in row order, no per-instance unit-of-work bookkeeping.
+        created = iter(self.db.scalars(
+            insert(Message).returning(Message, sort_by_parameter_order=True), rows
+        ).all())
+        outcomes = [o if isinstance(o, Exception) else next(created) for o in outcomes]
+        messages = [o for o in outcomes if isinstance(o, Message)]
+
+        self.audit_service.record_many([
+            dict(
+                user_id=therapist_id,
+                user_type="therapist",
+                action="create",
+                resource_type="message_draft",
+                resource_id=m.id,
+                action_details={"patient_id": m.patient_id, "message_type": m.message_type},
+            )
+            for m in messages
+        ])  # commits the drafts and their audit entries together
+
+        logger.info(f"Created {len(messages)} draft messages for therapist {therapist_id}")
+        return outcomes
+
     async def _build_message_prompt(
         self,
         patient: Patient,
@@ -158,7 +248,7 @@ class MessageService:
 
         return base_prompt
 
-    async def approve_message(self, message_id: int, therapist_id: int) -> Message:
+    def approve_message(self, message_id: int, therapist_id: int) -> Message:
         """
         Therapist approves a message - it can now be sent
         This is CRITICAL for ethical operation!
@@ -181,7 +271,7 @@ class MessageService:
         self.db.commit()
 
         # Audit log
-        await self.audit_service.log_action(
+        self.audit_service.record(
             user_id=therapist_id,
             user_type="therapist",
             action="approve",
@@ -193,7 +283,7 @@ class MessageService:
         logger.info(f"Therapist approved message {message_id}")
         return message
 
-    async def reject_message(
+    def reject_message(
         self,
         message_id: int,
         therapist_id: int,
@@ -216,7 +306,7 @@ class MessageService:
         self.db.commit()
 
         # Audit log
-        await self.audit_service.log_action(
+        self.audit_service.record(
             user_id=therapist_id,
             user_type="therapist",
             action="reject",
@@ -228,7 +318,7 @@ class MessageService:
         logger.info(f"Therapist rejected message {message_id}")
         return message
 
-    async def edit_message(
+    def edit_message(
         self,
         message_id: int,
         therapist_id: int,
@@ -253,7 +343,7 @@ class MessageService:
         self.db.commit()
 
         # Audit log
-        await self.audit_service.log_action(
+        self.audit_service.record(
             user_id=therapist_id,
             user_type="therapist",
             action="edit",
@@ -299,31 +389,41 @@ class MessageService:
         logger.info(f"Sent message {message_id} to patient {message.patient_id}")
         return message
 
-    async def get_pending_messages(self, therapist_id: int) -> List[Message]:
-        """Get all messages pending therapist approval"""
+    def get_pending_messages(
+        self,
+        therapist_id: int,
+        columns: Sequence[Any],
+    ) -> List[RowMapping]:
+        """
+        Get all messages pending therapist approval.
 
-        messages = self.db.query(Message).filter(
-            Message.therapist_id == therapist_id,
-            Message.status.in_([MessageStatus.DRAFT, MessageStatus.PENDING_APPROVAL])
-        ).order_by(Message.created_at.desc()).all()
+        Read-only list path: selects just `columns` with a Core statement and
+        returns row mappings, skipping ORM instance hydration.
+        """
 
-        return messages
+        return self.db.execute(
+            select(*columns).where(
+                Message.therapist_id == therapist_id,
+                Message.status.in_([MessageStatus.DRAFT, MessageStatus.PENDING_APPROVAL])
+            ).order_by(Message.created_at.desc())
+        ).mappings().all()
 
-    async def get_patient_message_history(
+    def get_patient_message_history(
         self,
         therapist_id: int,
         patient_id: int,
+        columns: Sequence[Any],
         limit: int = 50
-    ) -> List[Message]:
-        """Get message history for a specific patient (drafts excluded)."""
+    ) -> List[RowMapping]:
+        """Get message history for a specific patient (drafts excluded), as row mappings of `columns`."""
 
-        messages = self.db.query(Message).filter(
-            Message.therapist_id == therapist_id,
-            Message.patient_id == patient_id,
-            Message.status != MessageStatus.DRAFT,
-        ).order_by(Message.created_at.desc()).limit(limit).all()
-
-        return messages
+        return self.db.execute(
+            select(*columns).where(
+                Message.therapist_id == therapist_id,
+                Message.patient_id == patient_id,
+                Message.status != MessageStatus.DRAFT,
+            ).order_by(Message.created_at.desc()).limit(limit)
+        ).mappings().all()
 
     # ── Messages Center v1 methods (Phase C) ─────────────────────────────────
 
@@ -332,7 +432,7 @@ class MessageService:
         therapist_id: int,
         patient_id: int,
         message_type: str,  # "task_reminder" | "session_reminder"
-        agent: TherapyAgent,
+        agent: Optional[TherapyAgent],
         context: Optional[dict] = None,
     ) -> dict:
         """
@@ -341,9 +441,9 @@ class MessageService:
         Returns {"content": str, "message_type": str}.
         The therapist reviews/edits the text and then calls compose_message()
         to create + send/schedule atomically.
+        `agent` is only used for task reminders (session reminders are a
+        fixed template), so callers may pass None for those.
         """
-        from app.security.encryption import decrypt_data
-
         # Verify patient belongs to therapist
         patient = self.db.query(Patient).filter(
             Patient.id == patient_id,
@@ -352,8 +452,66 @@ class MessageService:
         if not patient:
             raise ValueError("Patient not found or does not belong to this therapist")
 
-        # Get therapist for name
-        therapist = self.db.query(Therapist).filter(Therapist.id == therapist_id).first()
+        # Get therapist for name (and profile, for task reminder style)
+        therapist = self.db.query(Therapist).options(
+            joinedload(Therapist.profile)
+        ).filter(Therapist.id == therapist_id).first()
+
+        return await self._generate_content(patient, therapist, message_type, agent, context)
+
+    async def generate_draft_messages(
+        self,
+        therapist_id: int,
+        drafts: List[Dict[str, Any]],
+        agent: Optional[TherapyAgent],
+        max_concurrency: int = DRAFT_BATCH_CONCURRENCY,
+    ) -> List[Union[dict, Exception]]:
+        """
+        Generate content for several patients at once, WITHOUT saving to DB.
+
+        `drafts` holds generate_draft_message kwargs (patient_id, message_type,
+        context).  The therapist and all patients are loaded up front in two
+        queries; the LLM calls then run concurrently, at most
+        `max_concurrency` in flight.  Results come back in input order; a
+        failed item is returned as its exception instead of failing the batch.
+        """
+        patient_ids = {draft["patient_id"] for draft in drafts}
+        patients = {
+            p.id: p
+            for p in self.db.query(Patient).filter(
+                Patient.id.in_(patient_ids),
+                Patient.therapist_id == therapist_id,
+            )
+        }
+        therapist = self.db.query(Therapist).options(
+            joinedload(Therapist.profile)
+        ).filter(Therapist.id == therapist_id).first()
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(draft: Dict[str, Any]) -> dict:
+            patient = patients.get(draft["patient_id"])
+            if patient is None:
+                raise ValueError("Patient not found or does not belong to this therapist")
+            async with semaphore:
+                return await self._generate_content(
+                    patient, therapist, draft["message_type"], agent, draft.get("context")
+                )
+
+        return await asyncio.gather(
+            *(generate_one(draft) for draft in drafts), return_exceptions=True
+        )
+
+    async def _generate_content(
+        self,
+        patient: Patient,
+        therapist: Optional[Therapist],
+        message_type: str,
+        agent: Optional[TherapyAgent],
+        context: Optional[dict],
+    ) -> dict:
+        """Build (and for task reminders, AI-generate) the text for one patient"""
+        from app.security.encryption import decrypt_data
 
         patient_name = decrypt_data(patient.full_name_encrypted)
         therapist_name = therapist.full_name if therapist else ""
@@ -377,10 +535,7 @@ class MessageService:
         elif message_type == "task_reminder":
             # AI-generated, Twin-aligned
             task = (context or {}).get("task", "")
-            profile = getattr(
-                self.db.query(Therapist).filter(Therapist.id == therapist_id).first(),
-                "profile", None
-            )
+            profile = getattr(therapist, "profile", None)
             tone_warmth = (profile.tone_warmth or 3) if profile else 3
             directiveness = (profile.directiveness or 3) if profile else 3
             prohibitions = (profile.prohibitions or []) if profile else []
@@ -415,7 +570,7 @@ class MessageService:
         else:
             raise ValueError(f"Unknown message_type: '{message_type}'. Use 'task_reminder' or 'session_reminder'.")
 
-        logger.info(f"Generated content (type={message_type}) for patient {patient_id} — not saved to DB")
+        logger.info(f"Generated content (type={message_type}) for patient {patient.id} — not saved to DB")
         return {"content": content, "message_type": message_type}
 
     async def send_or_schedule_message(
@@ -541,7 +696,7 @@ class MessageService:
             send_at=send_at,
         )
 
-    async def cancel_message(self, message_id: int, therapist_id: int) -> Message:
+    def cancel_message(self, message_id: int, therapist_id: int) -> Message:
         """Cancel a SCHEDULED message. Removes the APScheduler job."""
         message = self.db.query(Message).filter(
             Message.id == message_id,
@@ -558,7 +713,7 @@ class MessageService:
 
         # No APScheduler job to remove — the polling job skips non-SCHEDULED messages.
 
-        await self.audit_service.log_action(
+        self.audit_service.record(
             user_id=therapist_id,
             user_type="therapist",
             action="cancel",
@@ -568,7 +723,7 @@ class MessageService:
         logger.info(f"Cancelled scheduled message {message_id}")
         return message
 
-    async def edit_scheduled_message(
+    def edit_scheduled_message(
         self,
         message_id: int,
         therapist_id: int,
@@ -603,7 +758,7 @@ class MessageService:
         self.db.refresh(message)
         return message
 
-    async def delete_message(self, message_id: int, therapist_id: int) -> None:
+    def delete_message(self, message_id: int, therapist_id: int) -> None:
         """Delete a DRAFT message. Only DRAFT status can be deleted."""
         message = self.db.query(Message).filter(
             Message.id == message_id,
@@ -794,7 +949,9 @@ def _deliver_due_messages_sync() -> int:
     db = SessionLocal()
     try:
         now_naive = datetime.utcnow()
-        due = db.query(Message).filter(
+        # Patients loaded up front in one IN query for the phone fallback
+        # below, instead of one SELECT per due message.
+        due = db.query(Message).options(selectinload(Message.patient)).filter(
             Message.status == MessageStatus.SCHEDULED,
             Message.scheduled_send_at <= now_naive,
         ).all()
@@ -812,7 +969,7 @@ def _deliver_due_messages_sync() -> int:
                 to_phone = message.recipient_phone
                 if not to_phone:
                     from app.security.encryption import decrypt_data
-                    patient = db.query(Patient).filter(Patient.id == message.patient_id).first()
+                    patient = message.patient
                     if patient and patient.phone_encrypted:
                         to_phone = decrypt_data(patient.phone_encrypted)
 
@@ -1,9 +1,12 @@
 """Patient service - manages patient records with encryption"""
 
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import date
-from sqlalchemy import func
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
+from app.core import list_cache
 from app.models.patient import Patient, PatientStatus
 from app.security.encryption import encrypt_data, decrypt_data
 from app.services.audit_service import AuditService
@@ -21,6 +24,61 @@ ENCRYPTED_FIELDS = {
 }
 
 
+# Columns read by get_therapist_patients: the plain PatientResponse fields
+# plus the encrypted / JSON columns full_name, phone, email and age come from.
+# Table columns rather than mapped attributes, so the statement is plain Core
+# and skips the ORM compile/loading layer (see get_therapist_patients).
+_patients = Patient.__table__
+_PATIENT_LIST_COLUMNS = tuple(_patients.c[name] for name in (
+    "id",
+    "therapist_id",
+    "full_name_encrypted",
+    "phone_encrypted",
+    "email_encrypted",
+    "status",
+    "start_date",
+    "allow_ai_contact",
+    "preferred_contact_time",
+    "completed_exercises_count",
+    "missed_exercises_count",
+    "created_at",
+    "protocol_ids",
+    "demographics",
+))
+
+
+def _patient_list_item(row) -> Dict[str, Any]:
+    """Shape one _PATIENT_LIST_COLUMNS row like PatientResponse."""
+    item = dict(row)
+    item["full_name"] = decrypt_data(item.pop("full_name_encrypted"))
+    phone = item.pop("phone_encrypted")
+    item["phone"] = decrypt_data(phone) if phone else None
+    email = item.pop("email_encrypted")
+    item["email"] = decrypt_data(email) if email else None
+    item["age"] = (item.pop("demographics") or {}).get("age")
+    return item
+
+
+# Recent positive ownership checks: (patient_id, therapist_id) -> monotonic
+# time of the check.  A patient never moves to another therapist, so only a
+# delete ends ownership; delete_patient drops its entry and the short TTL
+# covers deletes made elsewhere (therapist cascades).  Misses are not cached,
+# so foreign ids are always re-checked.  Process-local: single worker.
+_OWNERSHIP_TTL = 5.0
+_OWNERSHIP_MAX = 10_000
+_ownership_cache: Dict[Tuple[int, int], float] = {}
+_ownership_lock = threading.Lock()
+
+
+def invalidate_ownership_cache(patient_id: Optional[int] = None, therapist_id: Optional[int] = None) -> None:
+    """Forget one (patient_id, therapist_id) ownership check, or all of them."""
+    with _ownership_lock:
+        if patient_id is None:
+            _ownership_cache.clear()
+        else:
+            _ownership_cache.pop((patient_id, therapist_id), None)
+
+
 class PatientService:
     """Service for managing patient records"""
 
@@ -115,47 +173,104 @@ class PatientService:
 
         return self._with_decrypted_fields(patient)
 
+    def is_patient_owned(self, patient_id: int, therapist_id: int) -> bool:
+        """
+        Whether the patient exists and belongs to the therapist.
+
+        For the id-only ownership checks in front of other reads; a recent
+        positive answer is served from _ownership_cache without a query.
+        """
+        key = (patient_id, therapist_id)
+        with _ownership_lock:
+            checked_at = _ownership_cache.get(key)
+        if checked_at is not None and time.monotonic() - checked_at <= _OWNERSHIP_TTL:
+            return True
+
+        owned = self.db.scalar(
+            select(_patients.c.id).where(
+                _patients.c.id == patient_id,
+                _patients.c.therapist_id == therapist_id,
+            )
+        ) is not None
+        if owned:
+            with _ownership_lock:
+                if len(_ownership_cache) >= _OWNERSHIP_MAX:
+                    _ownership_cache.pop(next(iter(_ownership_cache)))
+                _ownership_cache[key] = time.monotonic()
+        return owned
+
+    async def get_patient_item(
+        self,
+        patient_id: int,
+        therapist_id: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        One patient as a PatientResponse-shaped dict (ownership verified).
+
+        Read-only counterpart of get_patient, on the same Core select and
+        row shaping as get_therapist_patients.
+        """
+
+        row = self.db.execute(
+            select(*_PATIENT_LIST_COLUMNS).where(
+                _patients.c.id == patient_id,
+                _patients.c.therapist_id == therapist_id,
+            )
+        ).mappings().first()
+        return _patient_list_item(row) if row else None
+
     async def get_therapist_patients(
         self,
         therapist_id: int,
         status: Optional[PatientStatus] = None,
-    ) -> List[Patient]:
-        """List all patients for a therapist"""
+    ) -> List[Dict[str, Any]]:
+        """
+        List all patients for a therapist, as PatientResponse-shaped dicts.
 
-        query = self.db.query(Patient).filter(
-            Patient.therapist_id == therapist_id,
-        )
+        Read-only list path: a Core select of just the listed columns, with
+        name/phone/email decrypted in place — no ORM instance hydration.
+        Table columns throughout (WHERE / ORDER BY included): one mapped
+        attribute anywhere would make it an ORM-enabled statement again.
+        """
 
+        stmt = select(*_PATIENT_LIST_COLUMNS).where(_patients.c.therapist_id == therapist_id)
         if status:
-            query = query.filter(Patient.status == status)
+            stmt = stmt.where(_patients.c.status == status)
 
-        patients = query.order_by(Patient.created_at.desc()).all()
-        return [self._with_decrypted_fields(p) for p in patients]
+        rows = self.db.execute(stmt.order_by(_patients.c.created_at.desc())).mappings().all()
+        return [_patient_list_item(row) for row in rows]
 
     async def update_patient(
         self,
         patient_id: int,
         therapist_id: int,
         update_data: Dict[str, Any],
-    ) -> Patient:
-        """Update patient fields (re-encrypts sensitive data)"""
-
-        patient = self.db.query(Patient).filter(
-            Patient.id == patient_id,
-            Patient.therapist_id == therapist_id,
-        ).first()
+    ) -> Dict[str, Any]:
+        """
+        Update patient fields (re-encrypts sensitive data).
 
-        if not patient:
-            raise ValueError("Patient not found")
+        One UPDATE ... RETURNING of just the supplied columns, with the
+        ownership check in the WHERE clause; returns the updated patient as
+        a PatientResponse-shaped dict.  Only an age change reads the row
+        first, to merge it into the demographics JSON.  With nothing to
+        change, just reads the row.
+        """
 
         # Normalize phone to E.164 before encrypting
         if update_data.get("phone"):
             update_data = {**update_data, "phone": normalize_phone(update_data["phone"])}
 
+        values: Dict[str, Any] = {}
+
         # Age is stored inside the demographics JSON column
         if "age" in update_data and update_data["age"] is not None:
-            current_demo = patient.demographics or {}
-            patient.demographics = {**current_demo, "age": update_data["age"]}
+            current_demo = self.db.scalar(
+                select(_patients.c.demographics).where(
+                    _patients.c.id == patient_id,
+                    _patients.c.therapist_id == therapist_id,
+                )
+            )
+            values["demographics"] = {**(current_demo or {}), "age": update_data["age"]}
 
         for field, value in update_data.items():
             if field == "age":
@@ -163,20 +278,38 @@ class PatientService:
             if value is None:
                 continue
             if field in ENCRYPTED_FIELDS:
-                db_field = ENCRYPTED_FIELDS[field]
-                setattr(patient, db_field, encrypt_data(value))
-            elif hasattr(patient, field):
-                setattr(patient, field, value)
+                values[ENCRYPTED_FIELDS[field]] = encrypt_data(value)
+            elif field in _patients.c:
+                values[field] = value
+
+        if not values:
+            # Nothing to change (empty or all-null body): no UPDATE, which
+            # would still bump updated_at, and no commit or audit entry
+            item = await self.get_patient_item(patient_id, therapist_id)
+            if item is None:
+                raise ValueError("Patient not found")
+            return item
+
+        row = self.db.execute(
+            update(_patients)
+            .where(_patients.c.id == patient_id, _patients.c.therapist_id == therapist_id)
+            .values(**values)
+            .returning(*_PATIENT_LIST_COLUMNS)
+        ).mappings().first()
+        if not row:
+            self.db.rollback()
+            raise ValueError("Patient not found")
 
+        # Core UPDATE: no mapper events, so drop the cached patient list explicitly
+        list_cache.mark_stale(self.db, list_cache.PATIENTS, therapist_id)
         self.db.commit()
-        self.db.refresh(patient)
 
         await self.audit_service.log_action(
             user_id=therapist_id,
             user_type="therapist",
             action="update",
             resource_type="patient",
-            resource_id=patient.id,
+            resource_id=patient_id,
             action_details={"updated_fields": list(update_data.keys())},
             gdpr_relevant=True,
             data_category="personal",
@@ -200,7 +333,7 @@ class PatientService:
                 pass  # no event loop in tests — skip silently
 
         logger.info(f"Updated patient {patient_id}")
-        return self._with_decrypted_fields(patient)
+        return _patient_list_item(row)
 
     async def delete_patient(
         self,
@@ -219,6 +352,7 @@ class PatientService:
 
         self.db.delete(patient)
         self.db.commit()
+        invalidate_ownership_cache(patient_id, therapist_id)
 
         await self.audit_service.log_action(
             user_id=therapist_id,
@@ -1,9 +1,12 @@
 """Session service - handles therapy sessions and summary generation"""
 
 import asyncio
-from typing import Optional, Dict, Any, List
+import json
+import time
+from typing import Optional, Dict, Any, Iterator, List
 from datetime import date, datetime, timedelta
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, literal, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload
 from app.models.session import Session as TherapySession, SessionSummary, SessionType, SummaryStatus
 from app.models.patient import Patient
 from app.models.exercise import Exercise
@@ -30,13 +33,35 @@ from app.ai.summary_models import SourceSaveResult, SuggestResult, ReviseResult
 from app.ai.router import ModelRouter
 from app.ai.prep import PrepInput, PrepMode, PrepPipeline, PrepResult
 from app.ai.signature import SignatureEngine, inject_into_prompt
+from app.services.patient_service import PatientService
 from app.services.treatment_plan_service import TreatmentPlanService
 from app.services.audit_service import AuditService
 from app.security.encryption import decrypt_data
 from app.core.ai_context import build_ai_context_for_patient
+from app.core import generation_cache
+from app.core.error_log import log_failure
+from app.core.fingerprint import compute_fingerprint, FINGERPRINT_VERSION
 from loguru import logger
 
 
+def _generation_fingerprint(agent: TherapyAgent, **inputs: Any) -> str:
+    """
+    Fingerprint of everything an AI generation is built from: the given
+    inputs plus the agent's system prompt (profile + modality pack).
+    Keys app.core.generation_cache.
+    """
+    return compute_fingerprint({
+        "version": FINGERPRINT_VERSION,
+        "system_prompt": agent.system_prompt,
+        # session_date etc. are date objects; canonical JSON needs strings
+        "inputs": json.loads(json.dumps(inputs, default=str)),
+    })
+
+
+# 400 detail for the AI reports that need at least one approved summary
+NO_APPROVED_SUMMARIES_DETAIL = "אין סיכומים מאושרים עבור מטופל זה. יש לאשר לפחות סיכום אחד."
+
+
 # Twilio Content Template SID for appointment reminders.
 # Template variables: 1=patient name, 2=therapist name, 3=session date, 4=session time
 APPOINTMENT_TEMPLATE_SID = "HX6975c9f8284208ae4b202035dac62c85"
@@ -162,6 +187,63 @@ def _save_failed_record(
         db.rollback()
 
 
+async def run_audio_summary_job(job_id: str, audio_path: str, language: str | None = None) -> None:
+    """
+    Background job behind POST /sessions/{id}/summary/from-audio:
+    transcribe the saved upload, generate the summary, record the outcome
+    on the SessionSummaryJob row (done + summary_id, or failed + error).
+
+    Opens its own DB session (the request's is closed by now).  Never raises;
+    always deletes the audio file.
+    """
+    import os
+    from app.core.database import SessionLocal
+    from app.models.summary_job import SessionSummaryJob, SummaryJobStatus
+    from app.services.therapist_service import TherapistService
+
+    db = SessionLocal()
+    t0 = time.monotonic()
+    try:
+        job = db.execute(
+            select(SessionSummaryJob).where(SessionSummaryJob.job_id == job_id)
+        ).scalar_one_or_none()
+        if job is None:
+            logger.warning(f"[summary_job] {job_id} not found — skip")
+            return
+
+        try:
+            agent = await TherapistService(db).get_agent_for_therapist(job.therapist_id)
+            summary = await SessionService(db).generate_summary_from_audio(
+                session_id=job.session_id,
+                audio_path=audio_path,
+                agent=agent,
+                therapist_id=job.therapist_id,
+                language=language,
+            )
+        except Exception as exc:
+            log_failure("[summary_job] {} session={} failed: {!r}", job_id, job.session_id, exc)
+            db.rollback()
+            job.status = SummaryJobStatus.FAILED
+            job.error_message = str(exc)
+        else:
+            job.status = SummaryJobStatus.DONE
+            job.summary_id = summary.id
+            logger.info(
+                f"[summary_job] {job_id} session={job.session_id} done "
+                f"in {time.monotonic() - t0:.1f}s"
+            )
+        db.commit()
+    except Exception as exc:
+        logger.error(f"[summary_job] {job_id}: could not record job status — {exc!r}")
+        db.rollback()
+    finally:
+        db.close()
+        try:
+            os.unlink(audio_path)
+        except OSError:
+            pass
+
+
 class SessionService:
     """Service for managing therapy sessions and generating summaries"""
 
@@ -385,8 +467,7 @@ class SessionService:
     async def generate_summary_from_audio(
         self,
         session_id: int,
-        audio_bytes: bytes,
-        filename: str,
+        audio_path: str,
         agent: TherapyAgent,
         therapist_id: int,
         language: str | None = None,
@@ -394,7 +475,7 @@ class SessionService:
         """
         PRD Golden Path: Record → Transcribe → Summarise → Review → Approve.
 
-        1. Transcribe audio via AudioService (Whisper ASR).
+        1. Transcribe the saved audio file via AudioService (Whisper ASR).
         2. Feed transcript to agent.generate_session_summary (structured JSON).
         3. Store transcript *and* summary separately (PRD audit requirement).
         """
@@ -410,11 +491,7 @@ class SessionService:
         # Step 1 — ASR transcription
         audio_service = AudioService()
         logger.info(f"Transcribing audio for session {session_id}")
-        transcript = await audio_service.transcribe_upload(
-            file_bytes=audio_bytes,
-            filename=filename,
-            language=language,
-        )
+        transcript = await audio_service.transcribe_audio(audio_path, language=language)
 
         # Step 2 — Summary 2.0: two-call pipeline (extraction → rendering)
         summary_input = await self._assemble_summary_input(
@@ -921,12 +998,14 @@ class SessionService:
         )
         return summary
 
-    async def get_summary(self, session_id: int, therapist_id: int) -> Optional[SessionSummary]:
+    def get_summary(self, session_id: int, therapist_id: int) -> Optional[SessionSummary]:
         """Get the summary for a session, verifying therapist ownership."""
 
-        session = self.db.query(TherapySession).filter(
-            TherapySession.id == session_id,
-            TherapySession.therapist_id == therapist_id,
+        session = self.db.scalars(
+            select(TherapySession).where(
+                TherapySession.id == session_id,
+                TherapySession.therapist_id == therapist_id,
+            )
         ).first()
 
         if not session:
@@ -934,6 +1013,21 @@ class SessionService:
 
         return session.summary
 
+    def get_summary_version(self, session_id: int, therapist_id: int):
+        """
+        (id, updated_at) of the session's summary, or None if the session is
+        not this therapist's or has no summary.  Reads no summary content;
+        used to answer conditional GETs.
+        """
+        return self.db.execute(
+            select(SessionSummary.id, SessionSummary.updated_at)
+            .join(TherapySession, TherapySession.summary_id == SessionSummary.id)
+            .where(
+                TherapySession.id == session_id,
+                TherapySession.therapist_id == therapist_id,
+            )
+        ).first()
+
     async def approve_summary(self, session_id: int, therapist_id: int) -> SessionSummary:
         """
         Approve a session summary.
@@ -1066,121 +1160,118 @@ class SessionService:
         logger.info(f"Therapist edited summary {summary.id}")
         return summary
 
-    async def get_session(
+    def get_session(
         self,
         session_id: int,
         therapist_id: int,
     ) -> Optional[TherapySession]:
         """Get a single session by ID (verify ownership)"""
 
-        return self.db.query(TherapySession).filter(
-            TherapySession.id == session_id,
-            TherapySession.therapist_id == therapist_id,
+        return self.db.scalars(
+            select(TherapySession).where(
+                TherapySession.id == session_id,
+                TherapySession.therapist_id == therapist_id,
+            )
         ).first()
 
-    async def get_patient_sessions(
+    def get_patient_sessions(
         self,
         patient_id: int,
         therapist_id: int,
     ) -> List[TherapySession]:
         """Get all sessions for a patient (verify ownership)"""
 
-        patient = self.db.query(Patient).filter(
-            Patient.id == patient_id,
-            Patient.therapist_id == therapist_id,
-        ).first()
-
-        if not patient:
+        if not PatientService(self.db).is_patient_owned(patient_id, therapist_id):
             raise ValueError("Patient not found")
 
-        return (
-            self.db.query(TherapySession)
-            .filter(TherapySession.patient_id == patient_id)
+        return self.db.scalars(
+            select(TherapySession)
+            .where(TherapySession.patient_id == patient_id)
             .order_by(TherapySession.session_date.desc())
-            .all()
-        )
+        ).all()
 
-    async def get_therapist_sessions(
+    def get_therapist_sessions(
         self,
         therapist_id: int,
         limit: int = 50,
     ) -> List[TherapySession]:
         """Get recent sessions for a therapist"""
 
-        return (
-            self.db.query(TherapySession)
-            .filter(TherapySession.therapist_id == therapist_id)
+        return self.db.scalars(
+            select(TherapySession)
+            .where(TherapySession.therapist_id == therapist_id)
             .order_by(TherapySession.session_date.desc())
             .limit(limit)
-            .all()
-        )
+        ).all()
 
-    async def get_sessions_by_date(
+    def get_sessions_by_date(
         self,
         therapist_id: int,
         target_date: date,
     ) -> List[Dict[str, Any]]:
         """Get sessions for a therapist on a specific date, with patient names."""
 
-        sessions = (
-            self.db.query(TherapySession)
-            .filter(
+        # One query however many sessions: only the columns the daily view
+        # shows, with the patient's name and the summary's status joined in.
+        # No ORM entities are built.
+        rows = self.db.execute(
+            select(
+                TherapySession.id,
+                TherapySession.patient_id,
+                TherapySession.session_date,
+                TherapySession.start_time,
+                TherapySession.end_time,
+                TherapySession.session_type,
+                TherapySession.session_number,
+                TherapySession.summary_id,
+                Patient.id.label("patient_row_id"),
+                Patient.full_name_encrypted,
+                SessionSummary.status.label("summary_row_status"),
+                SessionSummary.approved_by_therapist,
+            )
+            .outerjoin(Patient, Patient.id == TherapySession.patient_id)
+            .outerjoin(SessionSummary, SessionSummary.id == TherapySession.summary_id)
+            .where(
                 TherapySession.therapist_id == therapist_id,
                 TherapySession.session_date == target_date,
             )
             .order_by(TherapySession.start_time.asc().nullslast())
-            .all()
-        )
-
-        # Batch-load summary statuses in one query
-        summary_ids = [s.summary_id for s in sessions if s.summary_id]
-        status_map: dict = {}
-        if summary_ids:
-            rows = self.db.query(
-                SessionSummary.id,
-                SessionSummary.status,
-                SessionSummary.approved_by_therapist,
-            ).filter(SessionSummary.id.in_(summary_ids)).all()
-            for row in rows:
-                status_map[row.id] = (
-                    "approved" if row.approved_by_therapist else (row.status or "draft")
-                )
+        ).all()
 
-        # Batch-load all patient names in one query (avoids N+1 per session)
-        patient_ids = list({s.patient_id for s in sessions})
         patient_name_map: dict = {}
-        if patient_ids:
-            patient_rows = (
-                self.db.query(Patient.id, Patient.full_name_encrypted)
-                .filter(Patient.id.in_(patient_ids))
-                .all()
-            )
-            for row in patient_rows:
-                try:
-                    patient_name_map[row.id] = decrypt_data(row.full_name_encrypted)
-                except Exception:
-                    patient_name_map[row.id] = row.full_name_encrypted or f"מטופל #{row.id}"
-
         results = []
-        for s in sessions:
-            patient_name = patient_name_map.get(s.patient_id, f"מטופל #{s.patient_id}")
-
-            # Convert session_type enum to its string value for JSON serialisation
-            session_type_value = (
-                s.session_type.value if s.session_type else None
-            )
+        for row in rows:
+            # Decrypt each patient's name once, however many sessions they have
+            patient_name = patient_name_map.get(row.patient_id)
+            if patient_name is None:
+                if row.patient_row_id is None:
+                    patient_name = f"מטופל #{row.patient_id}"
+                else:
+                    try:
+                        patient_name = decrypt_data(row.full_name_encrypted)
+                    except Exception:
+                        patient_name = row.full_name_encrypted or f"מטופל #{row.patient_id}"
+                patient_name_map[row.patient_id] = patient_name
+
+            summary_status = None
+            if row.summary_id is not None:
+                summary_status = (
+                    "approved" if row.approved_by_therapist
+                    else (row.summary_row_status or "draft")
+                )
 
             results.append({
-                "id": s.id,
-                "patient_id": s.patient_id,
+                "id": row.id,
+                "patient_id": row.patient_id,
                 "patient_name": patient_name,
-                "session_date": s.session_date,
-                "start_time": s.start_time,
-                "end_time": s.end_time,
-                "session_type": session_type_value,
-                "session_number": s.session_number,
-                "has_summary": s.summary_id is not None,
-                "summary_status": status_map.get(s.summary_id) if s.summary_id else None,
+                "session_date": row.session_date,
+                "start_time": row.start_time,
+                "end_time": row.end_time,
+                # Enum → its string value for JSON serialisation
+                "session_type": row.session_type.value if row.session_type else None,
+                "session_number": row.session_number,
+                "has_summary": row.summary_id is not None,
+                "summary_status": summary_status,
             })
 
         return results
@@ -1191,23 +1282,38 @@ class SessionService:
         therapist_id: int,
         update_data: Dict[str, Any],
     ) -> TherapySession:
-        """Update session details"""
+        """
+        Update session details in one UPDATE ... RETURNING (no SELECT first).
+        With nothing to change, just loads the session.
+        """
 
-        session = self.db.query(TherapySession).filter(
-            TherapySession.id == session_id,
-            TherapySession.therapist_id == therapist_id,
-        ).first()
+        protected = {"id", "created_at", "therapist_id", "patient_id"}
+        columns = TherapySession.__table__.columns
+        values = {
+            field: value for field, value in update_data.items()
+            if field not in protected and field in columns
+        }
+        if not values:
+            session = self.get_session(session_id, therapist_id)
+            if not session:
+                raise ValueError("Session not found")
+            return session
+
+        session = self.db.execute(
+            update(TherapySession)
+            .where(
+                TherapySession.id == session_id,
+                TherapySession.therapist_id == therapist_id,
+            )
+            .values(**values)
+            .returning(TherapySession)
+        ).scalar_one_or_none()
 
         if not session:
+            self.db.rollback()
             raise ValueError("Session not found")
 
-        protected = {"id", "created_at", "therapist_id", "patient_id"}
-        for field, value in update_data.items():
-            if field not in protected and hasattr(session, field):
-                setattr(session, field, value)
-
         self.db.commit()
-        self.db.refresh(session)
 
         await self.audit_service.log_action(
             user_id=therapist_id,
@@ -1293,96 +1399,159 @@ class SessionService:
         logger.info(f"Updated summary {summary.id} (status={summary.status})")
         return summary
 
+    async def has_approved_summary(self, patient_id: int, therapist_id: int) -> bool:
+        """
+        Whether any of the patient's sessions has an approved summary.
+
+        One indexed SELECT 1 ... LIMIT 1, cheap enough to run before building
+        the therapist's agent for the AI reports that need approved summaries.
+        """
+        return self.db.scalar(
+            select(literal(1))
+            .select_from(TherapySession)
+            .join(SessionSummary, SessionSummary.id == TherapySession.summary_id)
+            .where(
+                TherapySession.patient_id == patient_id,
+                TherapySession.therapist_id == therapist_id,
+                SessionSummary.status == SummaryStatus.APPROVED,
+            )
+            .limit(1)
+        ) is not None
+
     async def get_patient_summaries(
         self,
         patient_id: int,
         therapist_id: int,
     ) -> List[Dict[str, Any]]:
         """Get all summaries for a patient's sessions, with session metadata."""
+        return list(self.iter_patient_summaries(patient_id, therapist_id))
 
-        patient = self.db.query(Patient).filter(
-            Patient.id == patient_id,
-            Patient.therapist_id == therapist_id,
-        ).first()
+    def iter_patient_summaries(
+        self,
+        patient_id: int,
+        therapist_id: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield a patient's summaries (newest session first), with
+        session metadata.
+
+        The ownership check runs immediately (ValueError if the patient is
+        not the therapist's); the sessions are then fetched 100 rows at a
+        time as the iterator is consumed.  Two queries regardless of the
+        number of sessions: the ownership check and the sessions with their
+        summaries joined in.  Any other relationship access on the results
+        raises instead of lazy-loading one row at a time.
+        """
 
-        if not patient:
+        if not PatientService(self.db).is_patient_owned(patient_id, therapist_id):
             raise ValueError("Patient not found")
 
         sessions = (
             self.db.query(TherapySession)
-            .options(joinedload(TherapySession.summary))
+            .options(
+                joinedload(TherapySession.summary).raiseload("*"),
+                raiseload("*"),
+            )
             .filter(
                 TherapySession.patient_id == patient_id,
                 TherapySession.summary_id.isnot(None),
             )
             .order_by(TherapySession.session_date.desc())
-            .all()
+            .yield_per(100)
         )
 
-        results = []
-        for s in sessions:
-            summary = s.summary
-            if summary:
-                results.append({
-                    "session_id": s.id,
-                    "session_date": s.session_date,
-                    "session_number": s.session_number,
-                    "summary": summary,
-                })
-
-        return results
+        return (
+            {
+                "session_id": s.id,
+                "session_date": s.session_date,
+                "session_number": s.session_number,
+                "summary": s.summary,
+            }
+            for s in sessions
+            if s.summary
+        )
 
     async def generate_patient_insight(
         self,
         patient_id: int,
         therapist_id: int,
         agent: TherapyAgent,
+        context: Optional[tuple] = None,
+        audit_entries: Optional[List[Dict[str, Any]]] = None,
     ) -> PatientInsightResult:
-        """Generate a cross-session AI insight report for a patient."""
+        """
+        Generate a cross-session AI insight report for a patient.
 
-        patient = self.db.query(Patient).filter(
-            Patient.id == patient_id,
-            Patient.therapist_id == therapist_id,
-        ).first()
+        `context` is a _build_patient_summary_context() result the caller has
+        already loaded (see generate_ai_bundle); otherwise it is queried here.
+        With `audit_entries`, the audit entry is appended there for the
+        caller to write instead of being committed here.
+        """
 
-        if not patient:
-            raise ValueError("Patient not found")
+        if context is not None:
+            patient, summaries, _, _ = context
+            # Same last-10 approved list; the insight prompt has no homework
+            approved_summaries = [
+                {k: v for k, v in s.items() if k != "homework_assigned"}
+                for s in summaries
+            ]
+        else:
+            patient = self.db.query(Patient).filter(
+                Patient.id == patient_id,
+                Patient.therapist_id == therapist_id,
+            ).first()
 
-        # Fetch only approved summaries, ordered chronologically
-        sessions = (
-            self.db.query(TherapySession)
-            .options(joinedload(TherapySession.summary))
-            .filter(
-                TherapySession.patient_id == patient_id,
-                TherapySession.summary_id.isnot(None),
+            if not patient:
+                raise ValueError("Patient not found")
+
+            # Fetch only approved summaries, ordered chronologically
+            sessions = (
+                self.db.query(TherapySession)
+                .options(joinedload(TherapySession.summary))
+                .filter(
+                    TherapySession.patient_id == patient_id,
+                    TherapySession.summary_id.isnot(None),
+                )
+                .order_by(TherapySession.session_date.asc())
+                .all()
             )
-            .order_by(TherapySession.session_date.asc())
-            .all()
-        )
 
-        approved_summaries = []
-        for s in sessions:
-            summary = s.summary
-            if summary and summary.status == SummaryStatus.APPROVED:
-                approved_summaries.append({
-                    "session_date": s.session_date,
-                    "session_number": s.session_number,
-                    "full_summary": summary.full_summary,
-                    "topics_discussed": summary.topics_discussed,
-                    "patient_progress": summary.patient_progress,
-                    "risk_assessment": summary.risk_assessment,
-                })
-        approved_summaries = approved_summaries[-10:]  # last 10 — older sessions add noise
+            approved_summaries = []
+            for s in sessions:
+                summary = s.summary
+                if summary and summary.status == SummaryStatus.APPROVED:
+                    approved_summaries.append({
+                        "session_date": s.session_date,
+                        "session_number": s.session_number,
+                        "full_summary": summary.full_summary,
+                        "topics_discussed": summary.topics_discussed,
+                        "patient_progress": summary.patient_progress,
+                        "risk_assessment": summary.risk_assessment,
+                    })
+            approved_summaries = approved_summaries[-10:]  # last 10 — older sessions add noise
 
         if not approved_summaries:
-            raise ValueError("אין סיכומים מאושרים עבור מטופל זה. יש לאשר לפחות סיכום אחד.")
+            raise ValueError(NO_APPROVED_SUMMARIES_DETAIL)
+
+        # Same inputs as a recent call: reuse its report instead of the LLM
+        fingerprint = _generation_fingerprint(
+            agent,
+            patient_name=patient.full_name_encrypted,
+            summaries=approved_summaries,
+        )
+        cached = generation_cache.get_cached("patient_insight", patient_id, fingerprint)
+        if cached is not None:
+            logger.info(f"[patient_insight] patient={patient_id} — fingerprint cache hit, skipping AI call")
+            return cached
 
         result = await agent.generate_patient_insight_summary(
             patient_name=patient.full_name_encrypted,  # display name
             summaries_timeline=approved_summaries,
         )
+        generation_cache.set_cached("patient_insight", patient_id, fingerprint, result)
 
-        await self.audit_service.log_action(
+        await self._log_generation(
+            audit_entries,
             user_id=therapist_id,
             user_type="therapist",
             action="generate",
@@ -1811,51 +1980,46 @@ class SessionService:
                 })
         return result[-limit:]
 
-    async def delete_session(self, session_id: int, therapist_id: int) -> None:
+    def delete_session(self, session_id: int, therapist_id: int) -> None:
         """
         Delete a session and its associated summary (if any).
 
         FK order:
-        1. Null exercises.session_summary_id for any exercises linked to this summary —
+        1. Delete the session row (removes the sessions.summary_id FK reference);
+           DELETE ... RETURNING summary_id, with ownership in the WHERE clause,
+           so no SELECT is needed first.
+        2. Null exercises.session_summary_id for any exercises linked to this summary —
            exercises (patient homework) survive, only their summary attribution is cleared.
            Migration 045 enforces this at the DB level via ON DELETE SET NULL; the
            explicit UPDATE here is defense-in-depth and makes the intent clear.
-        2. Delete the session row (removes the sessions.summary_id FK reference).
         3. Delete the now-orphaned summary row.
 
         Raises ValueError if the session is not found or not owned by this therapist.
         """
-        from app.models.exercise import Exercise
-
-        session = self.db.query(TherapySession).filter(
-            TherapySession.id == session_id,
-            TherapySession.therapist_id == therapist_id,
+        deleted = self.db.execute(
+            delete(TherapySession)
+            .where(
+                TherapySession.id == session_id,
+                TherapySession.therapist_id == therapist_id,
+            )
+            .returning(TherapySession.summary_id)
         ).first()
-        if not session:
+        if deleted is None:
             raise ValueError("Session not found")
 
-        summary_id = session.summary_id
-
+        summary_id = deleted.summary_id
         if summary_id:
-            # Null the summary link on any exercises that reference this summary.
-            self.db.query(Exercise).filter(
-                Exercise.session_summary_id == summary_id,
-            ).update({"session_summary_id": None}, synchronize_session=False)
-            self.db.flush()
-
-        self.db.delete(session)
-        self.db.flush()
-
-        if summary_id:
-            summary = self.db.query(SessionSummary).filter(
-                SessionSummary.id == summary_id,
-            ).first()
-            if summary:
-                self.db.delete(summary)
+            self.db.execute(
+                update(Exercise)
+                .where(Exercise.session_summary_id == summary_id)
+                .values(session_summary_id=None),
+                execution_options={"synchronize_session": False},
+            )
+            self.db.execute(delete(SessionSummary).where(SessionSummary.id == summary_id))
 
         self.db.commit()
 
-        await self.audit_service.log_action(
+        self.audit_service.record(
             user_id=therapist_id,
             user_type="therapist",
             action="delete",
@@ -2036,15 +2200,17 @@ class SessionService:
         patient_id: int,
         therapist_id: int,
         agent: TherapyAgent,
+        context: Optional[tuple] = None,
+        audit_entries: Optional[List[Dict[str, Any]]] = None,
     ) -> DeepSummaryResult:
         """Generate a comprehensive deep treatment summary from all approved data."""
 
-        patient, approved_summaries, all_tasks, metrics = self._build_patient_summary_context(
-            patient_id, therapist_id
+        patient, approved_summaries, all_tasks, metrics = (
+            context or self._build_patient_summary_context(patient_id, therapist_id)
         )
 
         if not approved_summaries:
-            raise ValueError("אין סיכומים מאושרים עבור מטופל זה. יש לאשר לפחות סיכום אחד.")
+            raise ValueError(NO_APPROVED_SUMMARIES_DETAIL)
 
         # Fingerprint-based cache: if inputs unchanged since last generation, skip AI call
         from app.core.fingerprint import compute_fingerprint, FINGERPRINT_VERSION
@@ -2113,7 +2279,8 @@ class SessionService:
                 f"goals_and_tasks should only reflect session focus areas"
             )
 
-        await self.audit_service.log_action(
+        await self._log_generation(
+            audit_entries,
             user_id=therapist_id,
             user_type="therapist",
             action="generate",
@@ -2136,23 +2303,40 @@ class SessionService:
         patient_id: int,
         therapist_id: int,
         agent: TherapyAgent,
+        context: Optional[tuple] = None,
+        audit_entries: Optional[List[Dict[str, Any]]] = None,
     ) -> TreatmentPlanResult:
         """Generate a treatment plan preview (goals, focus areas, interventions) from approved data."""
 
-        patient, approved_summaries, all_tasks, _ = self._build_patient_summary_context(
-            patient_id, therapist_id
+        patient, approved_summaries, all_tasks, _ = (
+            context or self._build_patient_summary_context(patient_id, therapist_id)
         )
 
         therapist_locale = (agent.profile.language if agent.profile else None) or "he"
 
+        # Same inputs as a recent call: reuse its preview instead of the LLM
+        fingerprint = _generation_fingerprint(
+            agent,
+            patient_name=patient.full_name_encrypted,
+            summaries=approved_summaries,
+            tasks=all_tasks,
+            locale=therapist_locale,
+        )
+        cached = generation_cache.get_cached("treatment_plan_preview", patient_id, fingerprint)
+        if cached is not None:
+            logger.info(f"[treatment_plan_preview] patient={patient_id} — fingerprint cache hit, skipping AI call")
+            return cached
+
         result = await agent.generate_treatment_plan_preview(
             patient_name=patient.full_name_encrypted,
             approved_summaries=approved_summaries,
             all_tasks=all_tasks,
             therapist_locale=therapist_locale,
         )
+        generation_cache.set_cached("treatment_plan_preview", patient_id, fingerprint, result)
 
-        await self.audit_service.log_action(
+        await self._log_generation(
+            audit_entries,
             user_id=therapist_id,
             user_type="therapist",
             action="generate",
@@ -2163,3 +2347,53 @@ class SessionService:
 
         logger.info(f"Generated treatment plan preview for patient {patient_id}")
         return result
+
+    async def generate_ai_bundle(
+        self,
+        patient_id: int,
+        therapist_id: int,
+        agent: TherapyAgent,
+    ) -> Dict[str, Any]:
+        """
+        Generate the insight report, deep summary and treatment plan preview
+        for a patient in one call.
+
+        The patient, approved summaries, tasks and metrics are loaded once and
+        shared by all three; the LLM calls then run concurrently.  Returns
+        {"insight", "deep", "plan"}.  Any failure fails the whole bundle.
+        """
+        context = self._build_patient_summary_context(patient_id, therapist_id)
+        if not context[1]:
+            raise ValueError(NO_APPROVED_SUMMARIES_DETAIL)
+
+        # The three share this sync Session: collect their audit entries and
+        # write them in one commit after the gather, rather than letting each
+        # branch commit (or roll back) mid-flight under the others.
+        audit_entries: List[Dict[str, Any]] = []
+        results = await asyncio.gather(
+            self.generate_patient_insight(
+                patient_id, therapist_id, agent, context=context, audit_entries=audit_entries,
+            ),
+            self.generate_deep_summary(
+                patient_id, therapist_id, agent, context=context, audit_entries=audit_entries,
+            ),
+            self.generate_treatment_plan_preview(
+                patient_id, therapist_id, agent, context=context, audit_entries=audit_entries,
+            ),
+            return_exceptions=True,
+        )
+        # Generations that did run are audited even when another one failed
+        if audit_entries:
+            self.audit_service.record_many(audit_entries)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        insight, deep, plan = results
+        return {"insight": insight, "deep": deep, "plan": plan}
+
+    async def _log_generation(self, audit_entries: Optional[List[Dict[str, Any]]], **entry: Any) -> None:
+        """Audit a generation now, or queue it on `audit_entries` for the caller."""
+        if audit_entries is None:
+            await self.audit_service.log_action(**entry)
+        else:
+            audit_entries.append(entry)
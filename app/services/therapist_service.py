@@ -1,13 +1,97 @@
 """Therapist service - handles therapist profile management and onboarding"""
 
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+import asyncio
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, joinedload, make_transient_to_detached, object_session
+from app.models.modality import ModalityPack
 from app.models.therapist import Therapist, TherapistProfile, TherapeuticApproach
 from app.core.agent import TherapyAgent
 from app.services.audit_service import AuditService
 from loguru import logger
 
 
+# Resolved agent inputs per therapist (see get_agent_for_therapist): column
+# snapshots of the therapist's profile and modality pack, and the system
+# prompt assembled from them.  A hit rebuilds the agent with no SELECT.
+# Agents themselves are not cached: they hold per-request state
+# (_last_result) and session-bound ORM objects.
+# Invalidation: writes to the therapist, their profile or any modality pack
+# drop the affected entries, both at flush and again at commit (so a request
+# racing the writer cannot keep the pre-commit rows).  The TTL bounds
+# staleness for writes from outside this process.
+_AGENT_CONFIG_TTL = 600.0
+_AGENT_CONFIG_MAX = 1024
+_AGENT_CONFIG_STALE_KEY = "agent_config_stale"
+_agent_config_cache: Dict[int, Tuple[float, Optional[dict], Optional[dict], str]] = {}
+_agent_config_lock = threading.Lock()
+
+
+def invalidate_agent_config_cache(therapist_id: Optional[int] = None) -> None:
+    """Drop cached agent inputs for one therapist, or all of them."""
+    with _agent_config_lock:
+        if therapist_id is None:
+            _agent_config_cache.clear()
+        else:
+            _agent_config_cache.pop(therapist_id, None)
+
+
+def _snapshot(obj) -> Optional[dict]:
+    if obj is None:
+        return None
+    return {attr.key: getattr(obj, attr.key) for attr in sa_inspect(type(obj)).column_attrs}
+
+
+def _attach(db: Session, model, snapshot: Optional[dict]):
+    """Rebuild a snapshotted row as a persistent instance of `db`, without a SELECT."""
+    if snapshot is None:
+        return None
+    obj = model(**snapshot)
+    make_transient_to_detached(obj)
+    return db.merge(obj, load=False)
+
+
+def _mark_agent_config_stale(target, therapist_id: Optional[int]) -> None:
+    invalidate_agent_config_cache(therapist_id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_AGENT_CONFIG_STALE_KEY, set()).add(therapist_id)
+
+
+@event.listens_for(Therapist, "after_update")
+@event.listens_for(Therapist, "after_delete")
+def _therapist_written(mapper, connection, target) -> None:
+    _mark_agent_config_stale(target, target.id)
+
+
+@event.listens_for(TherapistProfile, "after_insert")
+@event.listens_for(TherapistProfile, "after_update")
+@event.listens_for(TherapistProfile, "after_delete")
+def _profile_written(mapper, connection, target) -> None:
+    _mark_agent_config_stale(target, target.therapist_id)
+
+
+@event.listens_for(ModalityPack, "after_insert")
+@event.listens_for(ModalityPack, "after_update")
+@event.listens_for(ModalityPack, "after_delete")
+def _modality_pack_written(mapper, connection, target) -> None:
+    # Packs are shared (and auto-detected), so any change drops everything
+    _mark_agent_config_stale(target, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_agent_config_on_commit(session) -> None:
+    for therapist_id in session.info.pop(_AGENT_CONFIG_STALE_KEY, ()):
+        invalidate_agent_config_cache(therapist_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_agent_config_on_rollback(session) -> None:
+    session.info.pop(_AGENT_CONFIG_STALE_KEY, None)
+
+
 class TherapistService:
     """Service for managing therapist profiles and personalization"""
 
@@ -33,7 +117,7 @@ class TherapistService:
         # Create therapist
         therapist = Therapist(
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=await asyncio.to_thread(get_password_hash, password),
             full_name=full_name,
             phone=phone
         )
@@ -203,14 +287,29 @@ class TherapistService:
         """Get a personalized AI agent for a specific therapist"""
         from app.ai.modality import resolve_modality_pack
 
-        therapist = self.db.query(Therapist).filter(Therapist.id == therapist_id).first()
+        # Seen recently: rebuild the agent from the cached inputs, no SELECT
+        with _agent_config_lock:
+            entry = _agent_config_cache.get(therapist_id)
+            if entry is not None and time.monotonic() - entry[0] > _AGENT_CONFIG_TTL:
+                del _agent_config_cache[therapist_id]
+                entry = None
+        if entry is not None:
+            _, profile_snapshot, pack_snapshot, system_prompt = entry
+            return TherapyAgent(
+                therapist_profile=_attach(self.db, TherapistProfile, profile_snapshot),
+                modality_pack=_attach(self.db, ModalityPack, pack_snapshot),
+                system_prompt=system_prompt,
+            )
+
+        therapist = self.get_therapist_by_id(therapist_id)
         if not therapist:
             raise ValueError("Therapist not found")
 
         if not therapist.profile.onboarding_completed:
             logger.warning(f"Therapist {therapist.email} has not completed onboarding")
 
-        modality_pack = resolve_modality_pack(self.db, therapist_id)
+        # Profile was joined in by get_therapist_by_id; don't select it again
+        modality_pack = resolve_modality_pack(self.db, therapist_id, profile=therapist.profile)
 
         # Create personalized agent with modality pack for three-layer prompt assembly
         agent = TherapyAgent(
@@ -218,6 +317,16 @@ class TherapistService:
             modality_pack=modality_pack,
         )
 
+        with _agent_config_lock:
+            if len(_agent_config_cache) >= _AGENT_CONFIG_MAX:
+                _agent_config_cache.pop(next(iter(_agent_config_cache)))
+            _agent_config_cache[therapist_id] = (
+                time.monotonic(),
+                _snapshot(therapist.profile),
+                _snapshot(modality_pack),
+                agent.system_prompt,
+            )
+
         return agent
 
     def get_therapist_by_email(self, email: str) -> Optional[Therapist]:
@@ -225,5 +334,10 @@ class TherapistService:
         return self.db.query(Therapist).filter(Therapist.email == email).first()
 
     def get_therapist_by_id(self, therapist_id: int) -> Optional[Therapist]:
-        """Get therapist by ID"""
-        return self.db.query(Therapist).filter(Therapist.id == therapist_id).first()
+        """Get therapist by ID, with the profile loaded in the same query"""
+        return (
+            self.db.query(Therapist)
+            .options(joinedload(Therapist.profile))
+            .filter(Therapist.id == therapist_id)
+            .first()
+        )
@@ -309,8 +309,7 @@ export const patientsAPI = {
   },
 
   delete: async (patientId: number) => {
-    const response = await api.delete(`/patients/${patientId}`)
-    return response.data
+    await api.delete(`/patients/${patientId}`)
   },
 
   getProtocolProgress: async (patientId: number): Promise<Array<{
@@ -334,8 +333,7 @@ export const patientNotesAPI = {
   },
 
   delete: async (patientId: number, noteId: number) => {
-    const response = await api.delete(`/patients/${patientId}/notes/${noteId}`)
-    return response.data
+    await api.delete(`/patients/${patientId}/notes/${noteId}`)
   },
 }
 
@@ -400,12 +398,23 @@ export const sessionsAPI = {
     if (language) {
       formData.append('language', language)
     }
+    // 202 + job id: transcription and summarization run in the background
     const response = await api.post(
       `/sessions/${sessionId}/summary/from-audio`,
       formData,
       { headers: { 'Content-Type': 'multipart/form-data' } },
     )
-    return response.data
+    const jobId: string = response.data.job_id
+    // The server fails jobs still pending after 10 minutes; stop a little later
+    // in case that answer never arrives
+    const deadline = Date.now() + 11 * 60 * 1000
+    while (Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, 2000))
+      const job = await api.get(`/sessions/${sessionId}/summary/job/${jobId}`)
+      if (job.data.status === 'done') return job.data.summary
+      if (job.data.status === 'failed') throw new Error(job.data.error || 'Summary generation failed')
+    }
+    throw new Error('Summary generation timed out. Please upload the recording again.')
   },
 
   getSummary: async (sessionId: number) => {
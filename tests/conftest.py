@@ -26,3 +26,39 @@ def propagate_loguru_to_caplog(caplog):
     )
     yield
     logger.remove(handler_id)
+
+
+@pytest.fixture(autouse=True)
+def clear_list_cache():
+    """Each test starts with an empty GET /messages/ + /patients/ cache (ids repeat across tests)."""
+    from app.core import list_cache
+
+    list_cache.invalidate()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_config_cache():
+    """Each test starts without cached agent inputs (therapist ids repeat across tests)."""
+    from app.services.therapist_service import invalidate_agent_config_cache
+
+    invalidate_agent_config_cache()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_generation_cache():
+    """Each test starts without cached AI results (patient ids repeat across tests)."""
+    from app.core import generation_cache
+
+    generation_cache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_ownership_cache():
+    """Each test starts without cached patient ownership (patient ids repeat across tests)."""
+    from app.services.patient_service import invalidate_ownership_cache
+
+    invalidate_ownership_cache()
+    yield
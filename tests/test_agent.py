@@ -62,3 +62,16 @@ def test_system_prompt_personalization(sample_profile):
     assert "CBT" in prompt
     assert "supportive" in prompt or "תומך" in prompt
     assert "exercise" in prompt or "תרגיל" in prompt
+
+
+def test_prebuilt_system_prompt_is_used(sample_profile):
+    """A cached system prompt is taken as-is instead of being rebuilt"""
+    agent = TherapyAgent(therapist_profile=sample_profile, system_prompt="cached prompt")
+    assert agent.system_prompt == "cached prompt"
+
+
+def test_shared_anthropic_provider():
+    """One provider (and HTTP client) per API key"""
+    from app.ai.provider import get_anthropic_provider
+
+    assert get_anthropic_provider("test-key") is get_anthropic_provider("test-key")
@@ -0,0 +1,137 @@
+"""
+Tests for the cached agent inputs in TherapistService.get_agent_for_therapist.
+
+Covers:
+1. A repeated call builds the same agent without any SELECT.
+2. The cached profile is attached to the new session and lazy-loads as usual.
+3. Updating the therapist's profile invalidates the entry (new prompt).
+4. The get_therapist_agent dependency builds the agent once per request.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.modality import ModalityPack
+from app.models.therapist import TherapeuticApproach, Therapist, TherapistProfile
+from app.services import therapist_service
+from app.services.therapist_service import TherapistService
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    therapist_service.invalidate_agent_config_cache()
+    yield
+    therapist_service.invalidate_agent_config_cache()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def therapist_id():
+    db = TestSessionLocal()
+    t = Therapist(email="agent@clinic.com", hashed_password="x", full_name="Dr. Agent", is_active=True)
+    db.add(t)
+    db.flush()
+    db.add(TherapistProfile(
+        therapist_id=t.id,
+        therapeutic_approach=TherapeuticApproach.CBT,
+        tone="warm",
+        onboarding_completed=True,
+    ))
+    db.add(ModalityPack(
+        name="generic_integrative", label="Generic", prompt_module="GENERIC MODULE", is_active=True,
+    ))
+    db.commit()
+    therapist_id = t.id
+    db.close()
+    return therapist_id
+
+
+@pytest.fixture
+def selects():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+async def _agent(therapist_id):
+    db = TestSessionLocal()
+    return await TherapistService(db).get_agent_for_therapist(therapist_id), db
+
+
+@pytest.mark.asyncio
+async def test_second_agent_built_without_selects(therapist_id, selects):
+    first, db1 = await _agent(therapist_id)
+    db1.close()
+    assert selects
+
+    selects.clear()
+    second, db2 = await _agent(therapist_id)
+
+    assert selects == []
+    assert second is not first
+    assert second.system_prompt == first.system_prompt
+    assert second.modality_pack.name == "generic_integrative"
+    assert second.profile in db2
+    assert second.profile.therapist.full_name == "Dr. Agent"
+    db2.close()
+
+
+@pytest.mark.asyncio
+async def test_profile_update_invalidates(therapist_id):
+    first, db1 = await _agent(therapist_id)
+    db1.close()
+
+    db = TestSessionLocal()
+    profile = db.query(TherapistProfile).filter(TherapistProfile.therapist_id == therapist_id).one()
+    profile.tone = "direct and brief"
+    db.commit()
+    db.close()
+
+    second, db2 = await _agent(therapist_id)
+    assert second.system_prompt != first.system_prompt
+    assert "direct and brief" in second.system_prompt
+    db2.close()
+
+
+@pytest.mark.asyncio
+async def test_request_dependency_builds_agent_once(therapist_id, monkeypatch):
+    from types import SimpleNamespace
+    from app.api.deps import get_therapist_agent
+
+    db = TestSessionLocal()
+    service = TherapistService(db)
+    calls = []
+    build = service.get_agent_for_therapist
+
+    async def _counting(tid):
+        calls.append(tid)
+        return await build(tid)
+
+    monkeypatch.setattr(service, "get_agent_for_therapist", _counting)
+    request = SimpleNamespace(state=SimpleNamespace())
+    therapist = SimpleNamespace(id=therapist_id)
+
+    first = await get_therapist_agent(request, therapist, service)
+    second = await get_therapist_agent(request, therapist, service)
+
+    assert first is second
+    assert calls == [therapist_id]
+    db.close()
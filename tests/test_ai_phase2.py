@@ -523,6 +523,30 @@ class TestResolveModalityPack:
         result = resolve_modality_pack(mock_db, therapist_id=1)
         assert result is mock_generic
 
+    def test_given_profile_is_not_reselected(self):
+        """A caller-supplied profile (even None) skips the TherapistProfile query."""
+        from app.ai.modality import resolve_modality_pack
+        from app.models.modality import ModalityPack
+        from app.models.therapist import TherapistProfile
+
+        mock_generic = MagicMock(spec=ModalityPack)
+        mock_generic.name = "generic_integrative"
+
+        mock_db = MagicMock()
+        queried = []
+
+        def query_side_effect(model):
+            queried.append(model)
+            q = MagicMock()
+            q.filter.return_value.first.return_value = mock_generic
+            return q
+
+        mock_db.query.side_effect = query_side_effect
+
+        result = resolve_modality_pack(mock_db, therapist_id=1, profile=None)
+        assert result is mock_generic
+        assert TherapistProfile not in queried
+
 
 # ── complete_onboarding_step — step 1 approach mapping ───────────────────────
 
@@ -0,0 +1,289 @@
+"""Tests for audio uploads: spooling to disk (POST /sessions/{id}/clips) and
+the background from-audio summary job (POST /sessions/{id}/summary/from-audio)"""
+
+import os
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.models.base import Base
+from app.api.deps import get_db, get_current_therapist
+from app.core.config import settings
+from app.models.therapist import Therapist
+from app.models.patient import Patient
+from app.models.session import Session as TherapySession, SessionSummary, SummaryStatus
+from app.models.audio_clip import AudioClip
+from app.models.summary_job import SessionSummaryJob
+from app.models.audit import AuditLog as _AuditLog  # noqa: F401
+from app.services.audio_service import AudioService
+from app.services.session_service import SessionService
+from app.services.therapist_service import TherapistService
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def session_id(db):
+    therapist = Therapist(email="audio@clinic.com", hashed_password="x", full_name="Dr. Audio", is_active=True)
+    db.add(therapist)
+    db.flush()
+    patient = Patient(therapist_id=therapist.id, full_name_encrypted="Patient")
+    db.add(patient)
+    db.flush()
+    session = TherapySession(
+        therapist_id=therapist.id, patient_id=patient.id, session_date=date.today(), session_number=1,
+    )
+    db.add(session)
+    db.commit()
+    return session.id
+
+
+@pytest.fixture
+def client(db, session_id):
+    therapist = db.query(Therapist).one()
+
+    def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_therapist] = lambda: therapist
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def transcribed(monkeypatch):
+    """Record what the transcriber saw on disk instead of calling Whisper."""
+    seen = {}
+
+    async def _transcribe(self, audio_file_path, language=None):
+        seen["path"] = audio_file_path
+        with open(audio_file_path, "rb") as f:
+            seen["data"] = f.read()
+        return "transcript text"
+
+    monkeypatch.setattr(AudioService, "transcribe_audio", _transcribe)
+    return seen
+
+
+def test_clip_spooled_to_temp_file(client, session_id, transcribed):
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    resp = client.post(
+        f"/api/v1/sessions/{session_id}/clips",
+        files={"audio": ("clip.m4a", payload, "audio/mp4")},
+    )
+
+    assert resp.status_code == 201, resp.text
+    assert resp.json()["transcript"] == "transcript text"
+    assert transcribed["data"] == payload
+    assert transcribed["path"].endswith(".m4a")
+    assert not os.path.exists(transcribed["path"])
+
+
+def test_clip_over_limit_rejected(client, session_id, transcribed, db, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_AUDIO_SIZE_MB", 1)
+    resp = client.post(
+        f"/api/v1/sessions/{session_id}/clips",
+        files={"audio": ("clip.webm", b"\0" * (1024 * 1024 + 1), "audio/webm")},
+    )
+
+    assert resp.status_code == 413
+    assert transcribed == {}
+    assert db.query(AudioClip).count() == 0
+
+
+def test_empty_clip_rejected(client, session_id, transcribed):
+    resp = client.post(
+        f"/api/v1/sessions/{session_id}/clips",
+        files={"audio": ("clip.webm", b"", "audio/webm")},
+    )
+
+    assert resp.status_code == 400
+    assert transcribed == {}
+
+
+@pytest.fixture
+def summary_job_env(monkeypatch, db):
+    """Run the background job against the test DB with a stubbed agent."""
+    import app.core.database as database
+
+    monkeypatch.setattr(database, "SessionLocal", TestSessionLocal)
+    monkeypatch.setattr(TherapistService, "get_agent_for_therapist", AsyncMock(return_value=MagicMock()))
+    seen = {}
+
+    async def _generate(self, session_id, audio_path, agent, therapist_id, language=None):
+        seen["exists"] = os.path.exists(audio_path)
+        seen["path"] = audio_path
+        if "fail" in seen:
+            raise ValueError(seen["fail"])
+        summary = SessionSummary(full_summary="from audio", status=SummaryStatus.DRAFT)
+        self.db.add(summary)
+        self.db.commit()
+        return summary
+
+    monkeypatch.setattr(SessionService, "generate_summary_from_audio", _generate)
+    return seen
+
+
+def test_from_audio_returns_job_and_completes(client, session_id, summary_job_env):
+    resp = client.post(
+        f"/api/v1/sessions/{session_id}/summary/from-audio",
+        files={"audio": ("recording.webm", b"audio", "audio/webm")},
+    )
+
+    assert resp.status_code == 202, resp.text
+    body = resp.json()
+    assert body["status_url"] == f"/api/v1/sessions/{session_id}/summary/job/{body['job_id']}"
+    # TestClient runs background tasks before returning
+    assert summary_job_env["exists"] is True
+    assert not os.path.exists(summary_job_env["path"])
+
+    job = client.get(f"/api/v1/sessions/{session_id}/summary/job/{body['job_id']}")
+    assert job.status_code == 200
+    assert job.json()["status"] == "done"
+    assert job.json()["summary"]["full_summary"] == "from audio"
+
+
+def test_from_audio_job_failure_recorded(client, session_id, summary_job_env, db):
+    summary_job_env["fail"] = "Session already has a summary"
+    resp = client.post(
+        f"/api/v1/sessions/{session_id}/summary/from-audio",
+        files={"audio": ("recording.webm", b"audio", "audio/webm")},
+    )
+    job_id = resp.json()["job_id"]
+
+    job = client.get(f"/api/v1/sessions/{session_id}/summary/job/{job_id}").json()
+    assert job["status"] == "failed"
+    assert job["error"] == "Session already has a summary"
+    assert job["summary"] is None
+    assert not os.path.exists(summary_job_env["path"])
+
+
+def test_summary_job_scoped_to_session(client, session_id, summary_job_env, db):
+    resp = client.post(
+        f"/api/v1/sessions/{session_id}/summary/from-audio",
+        files={"audio": ("recording.webm", b"audio", "audio/webm")},
+    )
+    job_id = resp.json()["job_id"]
+
+    assert client.get(f"/api/v1/sessions/{session_id + 1}/summary/job/{job_id}").status_code == 404
+    assert client.get(f"/api/v1/sessions/{session_id}/summary/job/unknown").status_code == 404
+    assert db.query(SessionSummaryJob).count() == 1
+
+
+def test_list_clips_matches_clip_response(client, session_id, transcribed):
+    from app.api.routes.sessions import ClipResponse
+
+    for _ in range(2):
+        client.post(
+            f"/api/v1/sessions/{session_id}/clips",
+            files={"audio": ("clip.webm", b"audio", "audio/webm")},
+        )
+
+    resp = client.get(f"/api/v1/sessions/{session_id}/clips")
+
+    assert resp.status_code == 200
+    clips = resp.json()
+    assert [c["clip_index"] for c in clips] == [1, 2]
+    assert clips[0] == ClipResponse.model_validate(clips[0]).model_dump(mode="json")
+    assert set(clips[0]) == set(ClipResponse.model_fields)
+
+
+def test_oversize_content_length_rejected_before_route(client, session_id, monkeypatch):
+    import app.api.routes.sessions as sessions_routes
+
+    called = []
+
+    async def _save(audio, default_filename):
+        called.append(default_filename)
+        raise AssertionError("route should not run")
+
+    monkeypatch.setattr(sessions_routes, "_save_audio_upload", _save)
+    monkeypatch.setattr(settings, "MAX_AUDIO_SIZE_MB", 1)
+
+    for path in ("clips", "summary/from-audio"):
+        resp = client.post(
+            f"/api/v1/sessions/{session_id}/{path}",
+            files={"audio": ("big.webm", b"\0" * (2 * 1024 * 1024), "audio/webm")},
+        )
+        assert resp.status_code == 413
+    assert called == []
+
+
+@pytest.mark.asyncio
+async def test_transcriptions_bounded(tmp_path, monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+    from app.services import audio_service
+
+    active = {"now": 0, "max": 0}
+
+    async def _create(**kwargs):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return SimpleNamespace(text="ok")
+
+    client = SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=_create)))
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-live-0123456789abcdef")
+    monkeypatch.setattr(audio_service, "_get_openai_client", lambda api_key: client)
+    monkeypatch.setattr(audio_service, "_transcription_slots", asyncio.Semaphore(2))
+
+    path = tmp_path / "clip.webm"
+    path.write_bytes(b"audio")
+    service = AudioService()
+    results = await asyncio.gather(*(service.transcribe_audio(str(path)) for _ in range(6)))
+
+    assert results == ["ok"] * 6
+    assert active["max"] == 2
+
+
+def test_stale_pending_job_reported_failed(client, session_id, db):
+    from datetime import datetime
+    from app.models.summary_job import SUMMARY_JOB_STALE_AFTER, SUMMARY_JOB_STALE_ERROR
+
+    therapist_id = db.query(Therapist).one().id
+    fresh = SessionSummaryJob(job_id="fresh", session_id=session_id, therapist_id=therapist_id, status="pending")
+    stale = SessionSummaryJob(
+        job_id="stale", session_id=session_id, therapist_id=therapist_id, status="pending",
+        created_at=datetime.utcnow() - SUMMARY_JOB_STALE_AFTER * 2,
+    )
+    db.add_all([fresh, stale])
+    db.commit()
+
+    assert client.get(f"/api/v1/sessions/{session_id}/summary/job/fresh").json()["status"] == "pending"
+
+    job = client.get(f"/api/v1/sessions/{session_id}/summary/job/stale").json()
+    assert job["status"] == "failed"
+    assert job["error"] == SUMMARY_JOB_STALE_ERROR
+    db.refresh(stale)
+    assert stale.status == "failed"
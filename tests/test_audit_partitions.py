@@ -0,0 +1,58 @@
+"""Tests for monthly audit_logs partitions (app.core.partitions and
+audit_service.ensure_audit_log_partitions)."""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.core.partitions import month_partitions
+from app.services.audit_service import ensure_audit_log_partitions
+
+
+def test_month_partitions_cross_year():
+    assert month_partitions("audit_logs", 2, today=date(2026, 11, 20)) == [
+        ("audit_logs_y2026m11", date(2026, 11, 1), date(2026, 12, 1)),
+        ("audit_logs_y2026m12", date(2026, 12, 1), date(2027, 1, 1)),
+        ("audit_logs_y2027m01", date(2027, 1, 1), date(2027, 2, 1)),
+    ]
+
+
+def _postgres_db(default_rows_in):
+    """Partitioned audit_logs with a DEFAULT partition and no monthly ones."""
+    statements = []
+
+    def _execute(clause, params=None):
+        sql = str(clause)
+        statements.append(sql)
+        if "pg_class" in sql or "'audit_logs_default'" in sql:
+            value = 1
+        elif "to_regclass(:name)" in sql:
+            value = None
+        elif "FROM audit_logs_default" in sql:
+            value = 1 if params["start"] in default_rows_in else None
+        else:
+            value = None
+        return SimpleNamespace(scalar=lambda: value)
+
+    db = MagicMock()
+    db.bind.dialect.name = "postgresql"
+    db.execute.side_effect = _execute
+    return db, statements
+
+
+def test_default_overlap_skipped_not_raised():
+    first, second, third = month_partitions("audit_logs", 2)
+    db, statements = _postgres_db(default_rows_in={second[1]})
+
+    created = ensure_audit_log_partitions(db)
+
+    assert created == [first[0], third[0]]
+    assert not any(s.startswith(f"CREATE TABLE {second[0]}") for s in statements)
+    db.commit.assert_called_once()
+
+
+def test_not_postgres_is_noop():
+    db = MagicMock()
+    db.bind.dialect.name = "sqlite"
+    assert ensure_audit_log_partitions(db) == []
+    db.execute.assert_not_called()
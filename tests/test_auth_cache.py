@@ -0,0 +1,154 @@
+"""
+Tests for the cached therapist lookup in get_current_therapist.
+
+Covers:
+1. A repeated call with the same token skips the therapists SELECT.
+2. The cached therapist is attached to the new session and can be updated.
+3. Any ORM update to the therapist invalidates the cache entry.
+4. A cache hit skips the JWT decode as well.
+5. Token failures raise a fresh 401 each time.
+"""
+
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.models.base import Base
+from app.models.therapist import Therapist
+from app.security.auth import create_access_token
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    deps.invalidate_therapist_cache()
+    yield
+    deps.invalidate_therapist_cache()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def therapist_token():
+    db = TestSessionLocal()
+    t = Therapist(email="cache@clinic.com", hashed_password="x", full_name="Cache", is_active=True)
+    db.add(t)
+    db.commit()
+    token = create_access_token(data={"sub": str(t.id)}, expires_delta=timedelta(hours=1))
+    therapist_id = t.id
+    db.close()
+    return therapist_id, token
+
+
+@pytest.fixture
+def therapist_selects():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM therapists" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _resolve(token):
+    db = TestSessionLocal()
+    try:
+        return deps.get_current_therapist(token=token, db=db), db
+    except Exception:
+        db.close()
+        raise
+
+
+def test_second_lookup_hits_cache(therapist_token, therapist_selects):
+    therapist_id, token = therapist_token
+
+    first, db1 = _resolve(token)
+    db1.close()
+    assert len(therapist_selects) == 1
+
+    second, db2 = _resolve(token)
+    try:
+        assert second.id == therapist_id
+        assert second.email == "cache@clinic.com"
+        assert len(therapist_selects) == 1
+    finally:
+        db2.close()
+
+
+def test_cached_therapist_is_writable(therapist_token):
+    therapist_id, token = therapist_token
+    _, db1 = _resolve(token)
+    db1.close()
+
+    cached, db2 = _resolve(token)
+    cached.intro_wizard_completed = True
+    db2.commit()
+    db2.close()
+
+    db3 = TestSessionLocal()
+    try:
+        assert db3.get(Therapist, therapist_id).intro_wizard_completed is True
+    finally:
+        db3.close()
+
+
+def test_update_invalidates_cache(therapist_token):
+    therapist_id, token = therapist_token
+    _, db1 = _resolve(token)
+    db1.close()
+
+    db2 = TestSessionLocal()
+    db2.get(Therapist, therapist_id).is_active = False
+    db2.commit()
+    db2.close()
+
+    with pytest.raises(HTTPException) as exc:
+        _resolve(token)
+    assert exc.value.status_code == 400
+
+
+def test_cache_hit_skips_token_decode(therapist_token, monkeypatch):
+    therapist_id, token = therapist_token
+    _, db1 = _resolve(token)
+    db1.close()
+
+    calls = []
+    monkeypatch.setattr(deps, "decode_access_token", lambda t: calls.append(t))
+
+    cached, db2 = _resolve(token)
+    try:
+        assert cached.id == therapist_id
+        assert calls == []
+    finally:
+        db2.close()
+
+
+def test_bad_subject_gets_fresh_401():
+    token = create_access_token(data={"sub": "not-a-number"}, expires_delta=timedelta(hours=1))
+    db = TestSessionLocal()
+    errors = []
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            deps.get_current_therapist(token=token, db=db)
+        errors.append(exc_info.value)
+    db.close()
+
+    assert errors[0] is not errors[1]
+    assert errors[0].status_code == 401
+    # Raised `from None`: the int() ValueError is not carried along
+    assert errors[0].__cause__ is None and errors[0].__suppress_context__
@@ -207,3 +207,196 @@ async def test_sessions_by_date_includes_start_time(client, therapist_with_sessi
     data = resp.json()
     assert data[0]["start_time"] is not None
     assert "10:00" in data[0]["start_time"]
+
+
+@pytest.mark.asyncio
+async def test_session_lists_match_session_response(client, therapist_with_sessions):
+    """GET /sessions/ and /sessions/patient/{id} return SessionResponse-shaped items, newest first."""
+    from app.api.routes.sessions import SessionResponse
+
+    patient_id = therapist_with_sessions["patient"].id
+    listed = client.get("/api/v1/sessions/").json()
+    by_patient = client.get(f"/api/v1/sessions/patient/{patient_id}").json()
+
+    assert listed == by_patient
+    assert [s["session_number"] for s in listed] == [3, 1, 2]
+    assert set(listed[0]) == set(SessionResponse.model_fields)
+    assert listed[0]["summary_status"] is None
+    assert listed[0]["is_paid"] is False
+    assert client.get(f"/api/v1/sessions/{listed[0]['id']}").json() == listed[0]
+    assert client.get(f"/api/v1/sessions/patient/{patient_id + 99}").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_session_summary_matches_validated_response(client, db, therapist_with_sessions):
+    """GET /sessions/{id}/summary serializes the stored summary like SummaryResponse.model_validate."""
+    from app.api.routes.sessions import SummaryResponse
+
+    session = therapist_with_sessions["session_today"]
+    summary = _SessionSummary(full_summary="סיכום", topics_discussed=["נושא"], status="approved")
+    db.add(summary)
+    db.flush()
+    session.summary_id = summary.id
+    db.commit()
+
+    resp = client.get(f"/api/v1/sessions/{session.id}/summary")
+
+    assert resp.status_code == 200
+    assert resp.json() == SummaryResponse.model_validate(summary).model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_sessions_by_date_fixed_query_count(client, db, therapist_with_sessions):
+    """GET /sessions/by-date loads sessions, names and summary statuses in one query."""
+    therapist = therapist_with_sessions["therapist"]
+    today = therapist_with_sessions["today"]
+    for i in range(5):
+        patient = _Patient(therapist_id=therapist.id, full_name_encrypted=f"Patient {i}")
+        summary = _SessionSummary(full_summary=f"summary {i}", status="draft")
+        db.add_all([patient, summary])
+        db.flush()
+        db.add(_Session(
+            therapist_id=therapist.id,
+            patient_id=patient.id,
+            session_date=today,
+            summary_id=summary.id,
+        ))
+    db.commit()
+    db.refresh(therapist)
+    db.expunge_all()
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        data = client.get(f"/api/v1/sessions/by-date?date={today.isoformat()}").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(data) == 6
+    assert {d["summary_status"] for d in data} == {None, "draft"}
+    assert "Patient 3" in {d["patient_name"] for d in data}
+    assert len(statements) == 1
+
+
+def _recorded(method, *args, **kwargs):
+    statements = []
+
+    def _record(conn, cursor, statement, *a):
+        statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = method(*args, **kwargs)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return resp, statements
+
+
+@pytest.mark.asyncio
+async def test_update_session_single_statement(client, therapist_with_sessions):
+    """PUT /sessions/{id} updates with one UPDATE ... RETURNING, no SELECT first."""
+    session_id = therapist_with_sessions["session_today"].id
+
+    resp, statements = _recorded(
+        client.put, f"/api/v1/sessions/{session_id}", json={"duration_minutes": 45},
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["duration_minutes"] == 45
+    assert statements[0] == "UPDATE"
+
+    missing = client.put("/api/v1/sessions/999999", json={"duration_minutes": 45})
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_empty_updates_skip_write(client, db, therapist_with_sessions):
+    """PUT /sessions/{id} and PATCH .../summary with {} return the row without writing."""
+    session = therapist_with_sessions["session_today"]
+    summary = _SessionSummary(full_summary="unchanged", status="draft")
+    db.add(summary)
+    db.flush()
+    session.summary_id = summary.id
+    db.commit()
+
+    resp, statements = _recorded(client.put, f"/api/v1/sessions/{session.id}", json={})
+    assert resp.status_code == 200
+    assert resp.json()["id"] == session.id
+    assert set(statements) == {"SELECT"}
+
+    resp, statements = _recorded(client.patch, f"/api/v1/sessions/{session.id}/summary", json={})
+    assert resp.status_code == 200
+    assert resp.json()["full_summary"] == "unchanged"
+    assert set(statements) == {"SELECT"}
+
+    other = therapist_with_sessions["session_yesterday"].id
+    assert client.patch(f"/api/v1/sessions/{other}/summary", json={}).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_summary_conditional_get(client, db, therapist_with_sessions):
+    """GET /sessions/{id}/summary sends an ETag and answers a match with an empty 304."""
+    session = therapist_with_sessions["session_today"]
+    summary = _SessionSummary(full_summary="first", status="draft")
+    db.add(summary)
+    db.flush()
+    session.summary_id = summary.id
+    db.commit()
+    url = f"/api/v1/sessions/{session.id}/summary"
+
+    first = client.get(url)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+
+    resp, statements = _recorded(client.get, url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert len(statements) == 1
+
+    client.patch(url, json={"full_summary": "edited"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["full_summary"] == "edited"
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_session_conditional_get(client, therapist_with_sessions):
+    """GET /sessions/{id} answers a matching If-None-Match with 304; missing sessions still 404."""
+    session_id = therapist_with_sessions["session_today"].id
+    url = f"/api/v1/sessions/{session_id}"
+
+    etag = client.get(url).headers["etag"]
+    assert client.get(url, headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+
+    client.put(url, json={"duration_minutes": 30})
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/api/v1/sessions/999999", headers={"If-None-Match": "*"}).status_code == 404
+    no_summary = client.get(f"/api/v1/sessions/{session_id}/summary", headers={"If-None-Match": "*"})
+    assert no_summary.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_one_session_service_per_request(client, therapist_with_sessions, monkeypatch):
+    """Routes get SessionService from get_session_service: one instance per request."""
+    from app.services.session_service import SessionService
+
+    created = []
+    init = SessionService.__init__
+
+    def _counting_init(self, db):
+        created.append(self)
+        init(self, db)
+
+    monkeypatch.setattr(SessionService, "__init__", _counting_init)
+    session_id = therapist_with_sessions["session_today"].id
+
+    assert client.get(f"/api/v1/sessions/{session_id}").status_code == 200
+    assert client.put(f"/api/v1/sessions/{session_id}", json={"duration_minutes": 50}).status_code == 200
+    assert len(created) == 2
@@ -0,0 +1,26 @@
+"""Tests for GET /healthz/db (SELECT 1 through the connection pool)."""
+
+from fastapi.testclient import TestClient
+
+import app.main as main_module
+from app.main import app
+
+
+def test_db_health_ok():
+    with TestClient(app) as client:
+        resp = client.get("/healthz/db")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ok"}
+
+
+def test_db_health_unreachable(monkeypatch):
+    def _fail():
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(main_module, "ping_db", _fail)
+    with TestClient(app) as client:
+        resp = client.get("/healthz/db")
+
+    assert resp.status_code == 503
+    assert resp.json() == {"status": "unavailable"}
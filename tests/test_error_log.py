@@ -0,0 +1,39 @@
+"""Tests for app.core.error_log.log_failure (sampled tracebacks)."""
+
+from loguru import logger
+
+from app.core import error_log
+
+
+def _fail_and_log(i):
+    try:
+        raise RuntimeError(f"boom {i}")
+    except RuntimeError as e:
+        error_log.log_failure("route failed n={}: {!r}", i, e)
+
+
+def test_tracebacks_limited_to_budget(monkeypatch):
+    monkeypatch.setattr(error_log, "_budget", error_log._TracebackBudget(2, 60.0))
+    records = []
+    handler_id = logger.add(lambda msg: records.append(msg.record), level="ERROR")
+    try:
+        for i in range(4):
+            _fail_and_log(i)
+    finally:
+        logger.remove(handler_id)
+
+    assert [r["message"] for r in records] == [
+        f"route failed n={i}: RuntimeError('boom {i}')" for i in range(4)
+    ]
+    assert [r["exception"] is not None for r in records] == [True, True, False, False]
+    # depth=1: records point at the caller, not at log_failure
+    assert {r["function"] for r in records} == {"_fail_and_log"}
+
+
+def test_budget_refills():
+    budget = error_log._TracebackBudget(1, 10.0)
+    assert budget.allow()
+    assert not budget.allow()
+
+    budget.updated -= 10.0
+    assert budget.allow()
@@ -0,0 +1,216 @@
+"""
+Tests for the /exercises routes.
+
+Covers:
+1. GET / lists a patient's exercises newest-first with every response field.
+2. GET / returns 404 for a patient owned by another therapist.
+3. PATCH / DELETE keep patient.completed_exercises_count in sync.
+4. PATCH without `completed` leaves the patient counter and list cache alone.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.models.base import Base
+from app.api.deps import get_db, get_current_therapist
+from app.models.therapist import Therapist
+from app.models.patient import Patient
+from app.models.exercise import Exercise
+from app.models.audit import AuditLog as _AuditLog  # noqa: F401 — ensure table is created
+from app.models.message import Message as _Message  # noqa: F401
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def populated_db(db):
+    from app.security.encryption import encrypt_data
+
+    therapist = Therapist(email="ex@clinic.com", hashed_password="x", full_name="Dr. Ex", is_active=True)
+    other = Therapist(email="other@clinic.com", hashed_password="x", full_name="Dr. Other", is_active=True)
+    db.add_all([therapist, other])
+    db.flush()
+
+    patient = Patient(therapist_id=therapist.id, full_name_encrypted=encrypt_data("Patient A"))
+    foreign_patient = Patient(therapist_id=other.id, full_name_encrypted=encrypt_data("Patient B"))
+    db.add_all([patient, foreign_patient])
+    db.flush()
+
+    first = Exercise(patient_id=patient.id, therapist_id=therapist.id, description="Breathing", completed=False)
+    db.add(first)
+    db.flush()
+    second = Exercise(patient_id=patient.id, therapist_id=therapist.id, description="Journal", completed=False)
+    db.add(second)
+    db.commit()
+
+    return {
+        "therapist": therapist,
+        "patient": patient,
+        "foreign_patient": foreign_patient,
+        "exercises": [first, second],
+    }
+
+
+@pytest.fixture
+def client(db, populated_db):
+    therapist = populated_db["therapist"]
+
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    def override_get_current_therapist():
+        return therapist
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_therapist] = override_get_current_therapist
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+# ── Tests ─────────────────────────────────────────────────────────────────────
+
+def test_list_exercises_returns_response_fields(client, populated_db):
+    patient = populated_db["patient"]
+    resp = client.get("/api/v1/exercises/", params={"patient_id": patient.id})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [e["description"] for e in body] == ["Journal", "Breathing"]
+    assert set(body[0]) == {
+        "id", "patient_id", "therapist_id", "session_summary_id",
+        "description", "completed", "completed_at", "created_at",
+    }
+    assert body[0]["completed"] is False
+    assert body[0]["completed_at"] is None
+
+
+def test_list_exercises_foreign_patient_404(client, populated_db):
+    resp = client.get("/api/v1/exercises/", params={"patient_id": populated_db["foreign_patient"].id})
+    assert resp.status_code == 404
+
+
+def test_patch_and_delete_sync_completed_count(client, db, populated_db):
+    patient = populated_db["patient"]
+    first, second = populated_db["exercises"]
+
+    resp = client.patch(f"/api/v1/exercises/{first.id}", json={"completed": True})
+    assert resp.status_code == 200
+    assert resp.json()["completed"] is True
+    db.refresh(patient)
+    assert patient.completed_exercises_count == 1
+
+    client.patch(f"/api/v1/exercises/{second.id}", json={"completed": True})
+    db.refresh(patient)
+    assert patient.completed_exercises_count == 2
+
+    resp = client.delete(f"/api/v1/exercises/{first.id}")
+    assert resp.status_code == 204
+    db.refresh(patient)
+    assert patient.completed_exercises_count == 1
+
+
+def test_patch_description_skips_counter_sync(client, db, populated_db, monkeypatch):
+    from sqlalchemy import event
+    from app.core import list_cache
+
+    first, _second = populated_db["exercises"]
+    stale = []
+    monkeypatch.setattr(list_cache, "mark_stale", lambda *args: stale.append(args))
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = client.patch(f"/api/v1/exercises/{first.id}", json={"description": "Box breathing"})
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert resp.status_code == 200
+    assert resp.json()["description"] == "Box breathing"
+    assert not [s for s in statements if s.lstrip().upper().startswith("UPDATE PATIENTS")]
+    assert stale == []
+
+
+def test_list_exercises_owned_patient_without_exercises(client, db, populated_db):
+    from app.security.encryption import encrypt_data
+
+    empty = Patient(therapist_id=populated_db["therapist"].id, full_name_encrypted=encrypt_data("Patient C"))
+    db.add(empty)
+    db.commit()
+
+    resp = client.get("/api/v1/exercises/", params={"patient_id": empty.id})
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+
+def test_open_count(client, populated_db):
+    first, _second = populated_db["exercises"]
+    assert client.get("/api/v1/exercises/open-count").json() == {"open_count": 2}
+
+    client.patch(f"/api/v1/exercises/{first.id}", json={"completed": True})
+    assert client.get("/api/v1/exercises/open-count").json() == {"open_count": 1}
+
+
+def test_bulk_patch_updates_exercises_and_counter(client, db, populated_db):
+    patient = populated_db["patient"]
+    first, second = populated_db["exercises"]
+
+    resp = client.patch("/api/v1/exercises/bulk", json=[
+        {"id": first.id, "completed": True},
+        {"id": second.id, "completed": True, "description": "Journal daily"},
+    ])
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [e["id"] for e in body] == [first.id, second.id]
+    assert all(e["completed"] and e["completed_at"] for e in body)
+    assert body[0]["description"] == "Breathing"
+    assert body[1]["description"] == "Journal daily"
+    db.refresh(patient)
+    assert patient.completed_exercises_count == 2
+
+
+def test_bulk_patch_unknown_id_404_and_rolls_back(client, db, populated_db):
+    patient = populated_db["patient"]
+    first, _second = populated_db["exercises"]
+
+    resp = client.patch("/api/v1/exercises/bulk", json=[
+        {"id": first.id, "completed": True},
+        {"id": 999_999, "completed": True},
+    ])
+    assert resp.status_code == 404
+    db.refresh(first)
+    db.refresh(patient)
+    assert first.completed is False
+    assert patient.completed_exercises_count == 0
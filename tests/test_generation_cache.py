@@ -0,0 +1,183 @@
+"""
+Tests for the fingerprint cache in front of the patient insight and treatment
+plan preview generations (app.core.generation_cache).
+
+Covers:
+1. A repeated insight request with unchanged inputs does not call the LLM again.
+2. Approving another summary changes the fingerprint, so the LLM runs again.
+3. Treatment plan previews are cached the same way, separately from insights.
+4. The AI bundle loads the sessions once and runs all three generations.
+5. The bundle writes its audit rows in one commit after the generations,
+   including when one of them fails.
+"""
+
+from datetime import date
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.therapist import Therapist
+from app.models.patient import Patient
+from app.models.session import Session as TherapySession, SessionSummary, SummaryStatus
+from app.models.exercise import Exercise as _Exercise  # noqa: F401
+from app.models.audit import AuditLog
+from app.models.deep_summary import DeepSummary as _DeepSummary  # noqa: F401
+from app.core.agent import DeepSummaryResult, PatientInsightResult
+from app.services.session_service import SessionService
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _add_approved_session(db, therapist_id, patient_id, day, text):
+    summary = SessionSummary(full_summary=text, status=SummaryStatus.APPROVED, approved_by_therapist=True)
+    db.add(summary)
+    db.flush()
+    db.add(TherapySession(
+        therapist_id=therapist_id,
+        patient_id=patient_id,
+        session_date=date(2026, 1, day),
+        session_number=day,
+        summary_id=summary.id,
+    ))
+    db.commit()
+
+
+@pytest.fixture
+def patient(db):
+    therapist = Therapist(email="gc@clinic.com", hashed_password="x", full_name="Dr. Cache", is_active=True)
+    db.add(therapist)
+    db.flush()
+    patient = Patient(therapist_id=therapist.id, full_name_encrypted="Patient")
+    db.add(patient)
+    db.commit()
+    _add_approved_session(db, therapist.id, patient.id, 1, "first session")
+    return patient
+
+
+def _agent():
+    agent = MagicMock()
+    agent.system_prompt = "prompt"
+    agent.profile = None
+    agent.generate_patient_insight_summary = AsyncMock(return_value=PatientInsightResult(
+        overview="overview", progress="progress", patterns=[], risks=[], suggestions_for_next_sessions=[],
+    ))
+    agent.generate_treatment_plan_preview = AsyncMock(return_value=MagicMock(goals=[]))
+    agent.generate_deep_summary = AsyncMock(return_value=DeepSummaryResult(
+        overall_treatment_picture="picture", timeline_highlights=[], goals_and_tasks="",
+        measurable_progress="", directions_for_next_phase="",
+    ))
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_insight_reused_until_inputs_change(db, patient):
+    service = SessionService(db)
+    agent = _agent()
+
+    first = await service.generate_patient_insight(patient.id, patient.therapist_id, agent)
+    second = await service.generate_patient_insight(patient.id, patient.therapist_id, agent)
+
+    assert agent.generate_patient_insight_summary.await_count == 1
+    assert second.overview == first.overview
+    assert second is not first
+
+    _add_approved_session(db, patient.therapist_id, patient.id, 2, "second session")
+    await service.generate_patient_insight(patient.id, patient.therapist_id, agent)
+
+    assert agent.generate_patient_insight_summary.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_treatment_plan_preview_cached_separately(db, patient):
+    service = SessionService(db)
+    agent = _agent()
+
+    await service.generate_patient_insight(patient.id, patient.therapist_id, agent)
+    await service.generate_treatment_plan_preview(patient.id, patient.therapist_id, agent)
+    await service.generate_treatment_plan_preview(patient.id, patient.therapist_id, agent)
+
+    assert agent.generate_patient_insight_summary.await_count == 1
+    assert agent.generate_treatment_plan_preview.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_ai_bundle_loads_sessions_once(db, patient):
+    service = SessionService(db)
+    agent = _agent()
+    session_selects = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM sessions" in statement:
+            session_selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        bundle = await service.generate_ai_bundle(patient.id, patient.therapist_id, agent)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(session_selects) == 1
+    assert bundle["insight"].overview == "overview"
+    assert bundle["deep"].overall_treatment_picture == "picture"
+    assert bundle["plan"].goals == []
+    # The insight prompt gets the same summaries, without the homework field
+    timeline = agent.generate_patient_insight_summary.await_args.kwargs["summaries_timeline"]
+    assert [s["full_summary"] for s in timeline] == ["first session"]
+    assert "homework_assigned" not in timeline[0]
+    assert agent.generate_deep_summary.await_count == 1
+    assert agent.generate_treatment_plan_preview.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_ai_bundle_audits_after_gather(db, patient, monkeypatch):
+    service = SessionService(db)
+    agent = _agent()
+    commits = []
+    monkeypatch.setattr(db, "commit", lambda real=db.commit: commits.append(1) or real())
+
+    await service.generate_ai_bundle(patient.id, patient.therapist_id, agent)
+
+    assert len(commits) == 1
+    assert sorted(r for (r,) in db.query(AuditLog.resource_type)) == [
+        "patient_deep_summary", "patient_insight", "patient_treatment_plan_preview",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ai_bundle_failure_keeps_other_audit_rows(db, patient):
+    service = SessionService(db)
+    agent = _agent()
+    agent.generate_deep_summary = AsyncMock(side_effect=RuntimeError("llm down"))
+
+    with pytest.raises(RuntimeError, match="llm down"):
+        await service.generate_ai_bundle(patient.id, patient.therapist_id, agent)
+
+    assert sorted(r for (r,) in db.query(AuditLog.resource_type)) == [
+        "patient_insight", "patient_treatment_plan_preview",
+    ]
@@ -0,0 +1,168 @@
+"""
+Tests for MessageService.create_draft_messages (POST /messages/create-batch)
+and MessageService.generate_draft_messages (POST /messages/generate-batch).
+
+Covers:
+1. Drafts come back in input order, one per request.
+2. A failing item is returned as its exception; the rest still persist.
+3. No more than max_concurrency LLM calls run at once.
+4. generate_draft_messages returns text per patient, nothing saved, and
+   reports foreign patients as ValueError.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.therapist import Therapist
+from app.models.patient import Patient
+from app.models.session import Session as _Session  # noqa: F401 — needed for FK
+from app.models.message import Message, MessageStatus
+from app.models.audit import AuditLog as _AuditLog  # noqa: F401
+from app.services.message_service import MessageService
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def therapist_with_patients(db):
+    from app.security.encryption import encrypt_data
+
+    therapist = Therapist(email="batch@clinic.com", hashed_password="x", full_name="Dr. Batch", is_active=True)
+    db.add(therapist)
+    db.flush()
+
+    patients = [
+        Patient(therapist_id=therapist.id, full_name_encrypted=encrypt_data(f"Patient {i}"))
+        for i in range(3)
+    ]
+    db.add_all(patients)
+    db.commit()
+    return therapist, patients
+
+
+def _make_service(db):
+    svc = MessageService(db)
+    svc.audit_service = MagicMock()
+    svc.audit_service.log_action = AsyncMock()
+    return svc
+
+
+def _agent(generate_response):
+    agent = MagicMock()
+    agent.generate_response = generate_response
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_drafts_in_order(db, therapist_with_patients):
+    therapist, patients = therapist_with_patients
+    agent = _agent(AsyncMock(side_effect=lambda prompt, context=None: f"draft {context['n']}"))
+
+    outcomes = await _make_service(db).create_draft_messages(
+        therapist_id=therapist.id,
+        drafts=[
+            {"patient_id": p.id, "message_type": "follow_up", "context": {"n": i}}
+            for i, p in enumerate(patients)
+        ],
+        agent=agent,
+    )
+
+    assert [m.content for m in outcomes] == ["draft 0", "draft 1", "draft 2"]
+    assert [m.patient_id for m in outcomes] == [p.id for p in patients]
+    assert all(m.status == MessageStatus.DRAFT for m in outcomes)
+
+
+@pytest.mark.asyncio
+async def test_batch_item_failure_does_not_fail_others(db, therapist_with_patients):
+    therapist, patients = therapist_with_patients
+    agent = _agent(AsyncMock(return_value="hello"))
+
+    outcomes = await _make_service(db).create_draft_messages(
+        therapist_id=therapist.id,
+        drafts=[
+            {"patient_id": patients[0].id, "message_type": "follow_up"},
+            {"patient_id": 999_999, "message_type": "follow_up"},
+            {"patient_id": patients[1].id, "message_type": "follow_up"},
+        ],
+        agent=agent,
+    )
+
+    assert isinstance(outcomes[1], ValueError)
+    assert isinstance(outcomes[0], Message) and isinstance(outcomes[2], Message)
+    assert db.query(Message).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrency(db, therapist_with_patients):
+    therapist, patients = therapist_with_patients
+    in_flight = 0
+    peak = 0
+
+    async def generate_response(prompt, context=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "hello"
+
+    await _make_service(db).create_draft_messages(
+        therapist_id=therapist.id,
+        drafts=[{"patient_id": p.id, "message_type": "follow_up"} for p in patients * 2],
+        agent=_agent(generate_response),
+        max_concurrency=2,
+    )
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_returns_content_without_saving(db, therapist_with_patients):
+    therapist, patients = therapist_with_patients
+    agent = _agent(AsyncMock(return_value="reminder text"))
+
+    outcomes = await _make_service(db).generate_draft_messages(
+        therapist_id=therapist.id,
+        drafts=[
+            {"patient_id": patients[0].id, "message_type": "task_reminder", "context": {"task": "Journal"}},
+            {"patient_id": 999_999, "message_type": "task_reminder"},
+            {"patient_id": patients[1].id, "message_type": "session_reminder",
+             "context": {"session_date": "01/02", "session_time": "10:00"}},
+        ],
+        agent=agent,
+    )
+
+    assert outcomes[0] == {"content": "reminder text", "message_type": "task_reminder"}
+    assert isinstance(outcomes[1], ValueError)
+    assert outcomes[2]["message_type"] == "session_reminder"
+    assert "10:00" in outcomes[2]["content"]
+    assert agent.generate_response.await_count == 1
+    assert db.query(Message).count() == 0
@@ -0,0 +1,183 @@
+"""
+Tests for GET /messages/ (Message Control Center listing).
+
+Covers:
+1. Messages come back newest-first with every MessageResponse field; drafts excluded.
+2. `fields` projects a subset of columns (id always included); unknown names → 422.
+3. `limit` + `before` page through the listing newest-first.
+4. The cached listing is dropped when one of the therapist's messages is written.
+5. patient_id / status filters narrow the listing.
+6. A listing longer than one streamed partition is still one valid JSON array.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.models.base import Base
+from app.api.deps import get_db, get_current_therapist
+from app.models.therapist import Therapist
+from app.models.patient import Patient
+from app.models.session import Session as _Session  # noqa: F401 — needed for FK
+from app.models.message import Message, MessageStatus, MessageDirection
+from app.models.audit import AuditLog as _AuditLog  # noqa: F401
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def populated_db(db):
+    therapist = Therapist(email="ml@clinic.com", hashed_password="x", full_name="Dr. List", is_active=True)
+    db.add(therapist)
+    db.flush()
+
+    patient = Patient(therapist_id=therapist.id, full_name_encrypted="Test Patient")
+    db.add(patient)
+    db.flush()
+
+    base = datetime(2026, 1, 1, 12, 0)
+    statuses = [MessageStatus.SENT, MessageStatus.SCHEDULED, MessageStatus.DRAFT, MessageStatus.SENT]
+    messages = []
+    for i, status in enumerate(statuses):
+        messages.append(Message(
+            therapist_id=therapist.id,
+            patient_id=patient.id,
+            direction=MessageDirection.TO_PATIENT,
+            content=f"message {i}",
+            message_type="task_reminder",
+            status=status,
+            requires_approval=False,
+            created_at=base + timedelta(hours=i),
+        ))
+    db.add_all(messages)
+    db.commit()
+
+    return {"therapist": therapist, "messages": messages}
+
+
+@pytest.fixture
+def client(db, populated_db):
+    therapist = populated_db["therapist"]
+
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    def override_get_current_therapist():
+        return therapist
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_therapist] = override_get_current_therapist
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+# ── Tests ─────────────────────────────────────────────────────────────────────
+
+def test_list_messages_newest_first_without_drafts(client):
+    resp = client.get("/api/v1/messages/")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [m["content"] for m in body] == ["message 3", "message 1", "message 0"]
+    assert set(body[0]) == {
+        "id", "patient_id", "content", "status", "message_type", "created_at",
+        "requires_approval", "scheduled_send_at", "channel", "recipient_phone",
+        "sent_at", "related_session_id",
+    }
+
+
+def test_list_messages_fields_projection(client):
+    resp = client.get("/api/v1/messages/", params={"fields": "status,created_at"})
+
+    assert resp.status_code == 200
+    assert set(resp.json()[0]) == {"id", "status", "created_at"}
+
+    resp = client.get("/api/v1/messages/", params={"fields": "status,therapist_secret"})
+    assert resp.status_code == 422
+
+
+def test_list_messages_keyset_pagination(client):
+    first_page = client.get("/api/v1/messages/", params={"limit": 2}).json()
+    assert [m["content"] for m in first_page] == ["message 3", "message 1"]
+
+    next_page = client.get(
+        "/api/v1/messages/",
+        params={"limit": 2, "before": first_page[-1]["created_at"]},
+    ).json()
+    assert [m["content"] for m in next_page] == ["message 0"]
+
+    assert client.get("/api/v1/messages/", params={"limit": 500}).status_code == 422
+
+
+def test_list_messages_filters(client, populated_db):
+    patient_id = populated_db["messages"][0].patient_id
+
+    sent = client.get("/api/v1/messages/", params={"status": "sent", "patient_id": patient_id}).json()
+    assert [m["content"] for m in sent] == ["message 3", "message 0"]
+
+    assert client.get("/api/v1/messages/", params={"patient_id": patient_id + 1}).json() == []
+
+
+def test_list_messages_cache_dropped_on_write(client, db, populated_db):
+    assert len(client.get("/api/v1/messages/").json()) == 3
+
+    message = populated_db["messages"][2]  # the draft, hidden from the listing
+    message.status = MessageStatus.SENT
+    db.commit()
+
+    assert len(client.get("/api/v1/messages/").json()) == 4
+
+
+def test_list_messages_streams_across_partitions(client, db, populated_db):
+    therapist = populated_db["therapist"]
+    patient_id = populated_db["messages"][0].patient_id
+    base = datetime(2025, 1, 1, 12, 0)
+    db.add_all([
+        Message(
+            therapist_id=therapist.id,
+            patient_id=patient_id,
+            direction=MessageDirection.TO_PATIENT,
+            content=f"bulk {i}",
+            status=MessageStatus.SENT,
+            requires_approval=False,
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(1200)
+    ])
+    db.commit()
+
+    body = client.get("/api/v1/messages/", params={"fields": "created_at"}).json()
+
+    assert len(body) == 1203
+    assert [m["created_at"] for m in body] == sorted((m["created_at"] for m in body), reverse=True)
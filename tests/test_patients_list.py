@@ -0,0 +1,308 @@
+"""
+Tests for GET /patients/ (PatientService.get_therapist_patients) and
+GET /patients/{patient_id} (PatientService.get_patient_item).
+
+Covers:
+1. Patients come back newest-first with decrypted name/phone/email and age.
+2. Other therapists' patients are not listed; the status filter applies.
+3. A single patient has the same shape as a list item; a foreign one is 404.
+4. PUT /patients/{id} and the notes endpoints return the stored values;
+   notes of a foreign patient / a deleted note are 404.  The PUT is a
+   single UPDATE and drops the cached patient list.  Positive ownership
+   checks are reused briefly and forgotten when the patient is deleted.
+5. The list and summaries reads issue a fixed number of queries, however
+   many patients / sessions there are (no per-row lazy loads); summaries
+   are also served as NDJSON on request.  A read failing mid-stream aborts
+   the response instead of closing a truncated array.
+6. Protocol progress counts past sessions against the protocol length.
+"""
+
+import json
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.models.base import Base
+from app.api.deps import get_db, get_current_therapist
+from app.models.therapist import Therapist
+from app.models.patient import Patient, PatientStatus
+from app.models.patient import PatientNote as _PatientNote  # noqa: F401
+from app.models.audit import AuditLog as _AuditLog  # noqa: F401 — ensure table is created
+from app.models.message import Message as _Message  # noqa: F401
+from app.models.session import Session as TherapySession, SessionSummary
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def populated_db(db):
+    from app.security.encryption import encrypt_data
+
+    therapist = Therapist(email="pl@clinic.com", hashed_password="x", full_name="Dr. List", is_active=True)
+    other = Therapist(email="other@clinic.com", hashed_password="x", full_name="Dr. Other", is_active=True)
+    db.add_all([therapist, other])
+    db.flush()
+
+    first = Patient(
+        therapist_id=therapist.id,
+        full_name_encrypted=encrypt_data("Patient A"),
+        phone_encrypted=encrypt_data("+972500000000"),
+        demographics={"age": 34},
+        status=PatientStatus.ACTIVE,
+    )
+    db.add(first)
+    db.flush()
+    second = Patient(
+        therapist_id=therapist.id,
+        full_name_encrypted=encrypt_data("Patient B"),
+        status=PatientStatus.PAUSED,
+    )
+    foreign = Patient(therapist_id=other.id, full_name_encrypted=encrypt_data("Patient C"))
+    db.add_all([second, foreign])
+    db.commit()
+
+    return {"therapist": therapist, "patients": [first, second]}
+
+
+@pytest.fixture
+def client(db, populated_db):
+    therapist = populated_db["therapist"]
+
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    def override_get_current_therapist():
+        return therapist
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_therapist] = override_get_current_therapist
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+# ── Tests ─────────────────────────────────────────────────────────────────────
+
+def test_list_patients_decrypts_fields(client):
+    resp = client.get("/api/v1/patients/")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [p["full_name"] for p in body] == ["Patient B", "Patient A"]
+    patient_a = body[1]
+    assert patient_a["phone"] == "+972500000000"
+    assert patient_a["email"] is None
+    assert patient_a["age"] == 34
+    assert patient_a["status"] == "active"
+    assert "full_name_encrypted" not in patient_a
+    assert "demographics" not in patient_a
+
+
+def test_list_patients_status_filter(client):
+    resp = client.get("/api/v1/patients/", params={"status": "paused"})
+    assert [p["full_name"] for p in resp.json()] == ["Patient B"]
+
+
+def test_get_patient_matches_list_item(client, populated_db):
+    patient_id = populated_db["patients"][0].id
+
+    resp = client.get(f"/api/v1/patients/{patient_id}")
+
+    assert resp.status_code == 200
+    listed = client.get("/api/v1/patients/").json()
+    assert resp.json() == next(p for p in listed if p["id"] == patient_id)
+
+    foreign_id = populated_db["patients"][1].id + 1
+    assert client.get(f"/api/v1/patients/{foreign_id}").status_code == 404
+
+
+def test_update_patient_and_notes_roundtrip(client, populated_db):
+    patient_id = populated_db["patients"][0].id
+
+    resp = client.put(f"/api/v1/patients/{patient_id}", json={"email": "a@example.com", "age": 35})
+    assert resp.status_code == 200
+    assert resp.json()["email"] == "a@example.com"
+    assert resp.json()["full_name"] == "Patient A"
+    assert resp.json() == client.get(f"/api/v1/patients/{patient_id}").json()
+
+    created = client.post(f"/api/v1/patients/{patient_id}/notes", json={"content": "first note"})
+    assert created.status_code == 201
+    assert set(created.json()) == {"id", "content", "created_at"}
+
+    notes = client.get(f"/api/v1/patients/{patient_id}/notes").json()
+    assert notes == [created.json()]
+
+    note_url = f"/api/v1/patients/{patient_id}/notes/{notes[0]['id']}"
+    resp = client.delete(note_url)
+    assert resp.status_code == 204
+    assert resp.content == b""
+    assert client.delete(note_url).status_code == 404
+    assert client.get(f"/api/v1/patients/{patient_id + 99}/notes").status_code == 404
+    assert client.get(f"/api/v1/patients/{patient_id}/notes").json() == []
+    foreign = client.post(f"/api/v1/patients/{patient_id + 99}/notes", json={"content": "x"})
+    assert foreign.status_code == 404
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_list_and_summaries_query_count(client, db, populated_db):
+    from app.security.encryption import encrypt_data
+
+    therapist = populated_db["therapist"]
+    patient = populated_db["patients"][0]
+    db.add_all([
+        Patient(therapist_id=therapist.id, full_name_encrypted=encrypt_data(f"Extra {i}"))
+        for i in range(5)
+    ])
+    for i in range(4):
+        summary = SessionSummary(full_summary=f"summary {i}")
+        db.add(summary)
+        db.flush()
+        db.add(TherapySession(
+            therapist_id=therapist.id,
+            patient_id=patient.id,
+            session_date=date(2026, 1, 1 + i),
+            session_number=i + 1,
+            summary_id=summary.id,
+        ))
+    db.commit()
+    # Reload the test's own expired instances before counting
+    db.refresh(therapist)
+    summaries_url = f"/api/v1/patients/{patient.id}/summaries"
+
+    with _count_queries() as statements:
+        assert len(client.get("/api/v1/patients/").json()) == 7
+    assert len(statements) == 1
+
+    with _count_queries() as statements:
+        summaries = client.get(summaries_url).json()
+    assert [s["summary"]["full_summary"] for s in summaries] == [f"summary {i}" for i in (3, 2, 1, 0)]
+    assert len(statements) <= 2
+
+    ndjson = client.get(summaries_url, headers={"Accept": "application/x-ndjson"})
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in ndjson.text.splitlines()] == summaries
+
+
+def test_summaries_stream_aborts_on_error(client, populated_db, monkeypatch):
+    from types import SimpleNamespace
+    from app.services.session_service import SessionService
+
+    def _iter(self, patient_id, therapist_id):
+        def _rows():
+            yield {
+                "session_id": 1, "session_date": date(2026, 1, 1), "session_number": 1,
+                "summary": SimpleNamespace(full_summary="first"),
+            }
+            raise RuntimeError("connection lost")
+        return _rows()
+
+    monkeypatch.setattr(SessionService, "iter_patient_summaries", _iter)
+    summaries_url = f"/api/v1/patients/{populated_db['patients'][0].id}/summaries"
+
+    for headers in ({}, {"Accept": "application/x-ndjson"}):
+        with pytest.raises(RuntimeError, match="connection lost"):
+            client.get(summaries_url, headers=headers)
+
+
+def test_update_patient_single_statement(client, db, populated_db):
+    patient_id = populated_db["patients"][0].id
+    # Prime the cached list so the update has to drop it
+    assert client.get("/api/v1/patients/").status_code == 200
+
+    with _count_queries() as statements:
+        resp = client.put(f"/api/v1/patients/{patient_id}", json={"preferred_contact_time": "evening"})
+    assert resp.status_code == 200
+    assert resp.json()["preferred_contact_time"] == "evening"
+    patient_statements = [s for s in statements if "patients" in s and "audit" not in s]
+    assert len(patient_statements) == 1
+    assert patient_statements[0].lstrip().upper().startswith("UPDATE")
+
+    listed = client.get("/api/v1/patients/").json()
+    assert next(p for p in listed if p["id"] == patient_id)["preferred_contact_time"] == "evening"
+    assert client.put(f"/api/v1/patients/{patient_id + 99}", json={"phone": "0500000000"}).status_code == 404
+
+
+def test_empty_patient_update_skips_write(client, db, populated_db):
+    patient_id = populated_db["patients"][0].id
+    before = client.get(f"/api/v1/patients/{patient_id}").json()
+
+    for body in ({}, {"phone": None, "email": None}):
+        with _count_queries() as statements:
+            resp = client.put(f"/api/v1/patients/{patient_id}", json=body)
+        assert resp.status_code == 200
+        assert resp.json() == before
+        assert all(s.lstrip().upper().startswith("SELECT") for s in statements)
+
+    assert client.put(f"/api/v1/patients/{patient_id + 99}", json={}).status_code == 404
+
+
+def test_ownership_check_cached_until_delete(client, populated_db):
+    patient_id = populated_db["patients"][0].id
+    notes_url = f"/api/v1/patients/{patient_id}/notes"
+    assert client.get(notes_url).json() == []
+
+    # The empty list needs the ownership check; a recent positive one is reused
+    with _count_queries() as statements:
+        assert client.get(notes_url).json() == []
+    assert len(statements) == 1
+
+    assert client.delete(f"/api/v1/patients/{patient_id}").status_code == 204
+    assert client.get(notes_url).status_code == 404
+
+
+def test_protocol_progress(client, db, populated_db):
+    patient = populated_db["patients"][0]
+    patient.protocol_ids = ["cbt_depression"]
+    db.add(TherapySession(therapist_id=patient.therapist_id, patient_id=patient.id, session_date=date(2026, 1, 5)))
+    db.commit()
+
+    resp = client.get(f"/api/v1/patients/{patient.id}/protocol-progress")
+
+    assert resp.status_code == 200
+    (item,) = resp.json()
+    assert set(item) == {"id", "name", "current_stage", "typical_sessions"}
+    assert (item["id"], item["current_stage"], item["typical_sessions"]) == ("cbt_depression", 1, 16)
@@ -84,3 +84,16 @@ def test_password_hash_is_different_each_time():
     # But both should verify correctly
     assert verify_password(password, hash1) is True
     assert verify_password(password, hash2) is True
+
+
+def test_jwt_cached_token_still_expires(monkeypatch):
+    """A token decoded once (and cached) is rejected after its exp passes."""
+    import time
+    from datetime import timedelta
+
+    token = create_access_token({"sub": "7"}, expires_delta=timedelta(minutes=5))
+    assert decode_access_token(token)["sub"] == "7"
+
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 600)
+    assert decode_access_token(token) is None
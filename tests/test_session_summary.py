@@ -390,6 +390,22 @@ async def test_patient_insight_with_draft_only(client, therapist_with_patient):
     assert "סיכומים מאושרים" in resp.json()["detail"]
 
 
+def test_ai_reports_skip_agent_without_approved_summaries(client, therapist_with_patient):
+    """The AI report endpoints answer 400 before building the therapist's agent."""
+    patient_id = therapist_with_patient["patient"].id
+
+    with patch(
+        "app.services.therapist_service.TherapistService.get_agent_for_therapist",
+        new_callable=AsyncMock,
+    ) as mock_agent:
+        for path in ("insight-summary", "deep-summary", "treatment-plan/preview", "ai-bundle"):
+            resp = client.post(f"/api/v1/patients/{patient_id}/{path}")
+            assert resp.status_code == 400
+            assert "סיכומים מאושרים" in resp.json()["detail"]
+
+    mock_agent.assert_not_awaited()
+
+
 # --- Prep Brief Tests ---
 
 
@@ -1,7 +1,7 @@
 """Tests for FK-safe session / summary deletion (migration 045).
 
 Covers three paths:
-  1. delete_session: exercises survive; session_summary_id nulled
+  1. delete_session: exercises survive; session_summary_id nulled; no SELECTs
   2. delete_session_summary: exercises survive; session_summary_id nulled
   3. admin_panel therapist delete: exercises survive with no FK error
 """
@@ -126,8 +126,7 @@ def world(db):
 
 # ── Test 1: delete_session preserves exercises ─────────────────────────────
 
-@pytest.mark.asyncio
-async def test_delete_session_preserves_exercises(db, world):
+def test_delete_session_preserves_exercises(db, world):
     from app.services.session_service import SessionService
     from app.models.exercise import Exercise
     from app.models.session import Session as TherapySession, SessionSummary
@@ -138,7 +137,20 @@ async def test_delete_session_preserves_exercises(db, world):
     therapist_id = world["therapist"].id
 
     svc = SessionService(db=db)
-    await svc.delete_session(session_id, therapist_id)
+    db.expunge_all()
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        svc.delete_session(session_id, therapist_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    # DELETE ... RETURNING finds the summary; no SELECT round-trip first
+    assert "SELECT" not in statements
 
     # Session is gone
     assert db.query(TherapySession).filter(TherapySession.id == session_id).first() is None